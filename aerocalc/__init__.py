@@ -70,7 +70,8 @@ default_units   - defines default units to be used by all modules.  May be
 cd              - drag related calculations.
 cl              - lift related calculations.
 constants       - constants used by all modules.
-interpolator    - linear interpolation in one, two or three dimensions
+interpolator    - linear interpolation in one, two or three dimensions, and
+                  on grids in any number of dimensions
 ssec            - static source error correction calculations.
 std_atm         - standard atmosphere parametres and calculations.
 unit_conversion - convert various aeronautical parametres between commonly
@@ -27,7 +27,7 @@
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # #############################################################################
 #
-# version 0.40, 26 Feb 2020
+# version 0.43, 16 Oct 2026
 #
 # Version History:
 # vers     date        Notes
@@ -45,6 +45,14 @@
 # 0.29   30 Jun 2009   Python 3.0 compatibility
 # 0.30   11 Mar 2011   Rework interactive mode to remember the last function used
 # 0.40   26 Feb 2020   Python 3.7 compatibility tweaks
+# 0.41   16 Oct 2026   The conversions between CAS, EAS, TAS and differential
+#                      pressure accept numpy arrays.
+# 0.42   16 Oct 2026   Replaced the bisection in dp2cas and dp_over_p2mach
+#                      with a safeguarded Newton solver that works on arrays,
+#                      with a selectable tolerance.  mach2dp_over_p and
+#                      dp_over_p2mach accept numpy arrays.
+# 0.43   16 Oct 2026   Added an optional precomputed table for the supersonic
+#                      solutions in dp_over_p2mach and dp2cas.
 # ##############20###############################################################
 #
 # To Do:  1. Add functions:
@@ -97,12 +105,28 @@ Convert between pitot static system pressures and air speed.
 
 Provide interactive airspeed conversions when script is run directly, e.g. 
 'python airspeed.py'.
+
+If numpy is installed, the conversions between CAS, EAS, TAS and 
+differential pressure (cas2dp, eas2dp, tas2dp, dp2cas, dp2eas, dp2tas, 
+cas2eas, cas2tas, eas2cas, eas2tas, tas2cas and tas2eas) also accept 
+sequences or numpy arrays of speed, pressure, altitude and temperature, and 
+return numpy arrays.  The subsonic samples are converted in one pass, and 
+only the supersonic samples of dp2cas are solved by iteration.
+
+The supersonic solutions in dp_over_p2mach and dp2cas, which are also used 
+by cas_alt2mach and mach_alt2cas, may be switched to a precomputed table 
+with enable_table(), for code that calls them many times.
 """
 
 import math as M
 import std_atm as SA
 import constants
 
+try:
+    import numpy as N
+except ImportError:
+    N = None
+
 try:
     from default_units import *
 except ImportError:
@@ -133,6 +157,391 @@ A0 = constants.A0  # speed of sound at sea level, std day, m/s
 
 F = (1.25 ** 2.5 * (2.4 ** 2.) ** 2.5) * 1.2
 
+# #############################################################################
+#
+# Array support
+#
+# #############################################################################
+
+
+def _is_array(x):
+    """
+    Return True if x is a sequence or numpy array of values, rather than a 
+    single value.
+    """
+
+    return N is not None and isinstance(x, (N.ndarray, list, tuple))
+
+
+def _exceeds(x, limit):
+    """
+    Return True if x, or any value in an array x, is greater than limit.
+    """
+
+    if _is_array(x):
+        return bool(N.any(x > limit))
+    return x > limit
+
+
+def _all(x):
+    """
+    Return True if x, or every value in an array x, is True.
+    """
+
+    if _is_array(x):
+        return bool(N.all(x))
+    return bool(x)
+
+
+def _is_std(temp):
+    """
+    Return True if temp is the 'std' flag for standard temperature.
+    """
+
+    return isinstance(temp, str) and temp == 'std'
+
+
+def _where(condition, x, y):
+    """
+    Return x where condition is True, and y elsewhere.
+    """
+
+    if _is_array(condition):
+        return N.where(condition, x, y)
+    if condition:
+        return x
+    return y
+
+
+# #############################################################################
+#
+# Supersonic pitot solver
+#
+# #############################################################################
+
+# The largest number of iterations allowed in _super_mach.  The solver 
+# normally converges in well under ten.
+
+_MAX_ITERATIONS = 50
+
+
+def _super_mach(dp_over_p, low, high, tol, name='mach'):
+    """
+    Return the mach number that gives dp_over_p, (pitot pressure - static
+    pressure) / static pressure, in the supersonic pitot equation (Rayleigh
+    pitot tube formula), and the number of iterations used.
+
+    dp_over_p may be a single value or a numpy array.  The solution is found 
+    between low and high by Newton's method, using the analytic derivative 
+    of the pitot equation.  Each value keeps a bracket around its solution, 
+    and a bisection step is taken whenever the Newton step would leave the 
+    bracket.  Iteration stops when the relative error in dp_over_p of every
+    value is within tol.
+
+    The same equation gives CAS / A0 for dp / P0, so this function also 
+    solves for supersonic CAS.
+    """
+
+    if _exceeds(mach2dp_over_p(low) - dp_over_p, 0.):
+        raise ValueError('Initial lower %s guess is too high.' % name)
+    if _exceeds(dp_over_p - mach2dp_over_p(high), 0.):
+        raise ValueError('Initial upper %s guess is too low.' % name)
+
+    # at high mach, dp_over_p + 1 tends to F * mach**2 / 7**2.5, which gives
+    # the initial guess
+
+    mach = ((dp_over_p + 1.) * 7. ** 2.5 / F) ** 0.5
+    mach = _where(mach < low, low, _where(mach > high, high, mach))
+
+    iterations = 0
+    while True:
+        pitot_ratio = F * mach ** 7. / (7. * mach ** 2. - 1.) ** 2.5
+        error = pitot_ratio - 1. - dp_over_p
+        converged = abs(error / dp_over_p) <= tol
+        if _all(converged):
+            return (mach, iterations)
+        if iterations == _MAX_ITERATIONS:
+            raise ValueError('The solution did not converge to the tolerance.  The tolerance may be too small.')
+
+        # narrow the bracket, and take the Newton step if it stays inside.
+        # Values that have converged are left alone, as rounding can put 
+        # their next step just outside the bracket.
+
+        low = _where(error < 0., mach, low)
+        high = _where(error > 0., mach, high)
+        slope = (pitot_ratio * 7. * (2. * mach ** 2. - 1.)) / (mach * (7.
+                 * mach ** 2. - 1.))
+        step = mach - error / slope
+        step = _where((step > low) & (step < high), step, (low + high) / 2.)
+        mach = _where(converged, mach, step)
+        iterations += 1
+
+
+# #############################################################################
+#
+# Table mode
+#
+# #############################################################################
+
+# The number of intervals in the pitot table, evenly spaced in 
+# log(dp_over_p + 1) from mach 1 to 10.  2048 intervals give a relative error
+# in dp_over_p of less than 1e-11, within the default tolerance of the 
+# solver.
+
+_TABLE_INTERVALS = 2048
+
+# The table used for supersonic solutions of the pitot equation, or None if
+# it has not been built yet.  It is built the first time it is needed after 
+# enable_table() is called, and kept for the rest of the session.
+
+_table = None
+
+# True when the supersonic solutions use the table, and True in 
+# _table_refine when each table value is refined by one Newton step.  See 
+# enable_table().
+
+_table_enabled = False
+_table_refine = False
+
+
+class _PitotTable:
+    """
+    Mach tabulated against dp_over_p, (pitot pressure - static pressure) / 
+    static pressure, for the supersonic pitot equation.
+
+    The table is evenly spaced in u = log(dp_over_p + 1), from mach 1 to 
+    mach 10.  Mach is a smooth, monotone function of u, and is interpolated
+    with a cubic Hermite polynomial through the value and the exact slope at
+    each table point.  The polynomial coefficients for each interval are 
+    computed once, so a lookup is a log, an index calculation and a 
+    polynomial evaluation.
+    """
+
+    def __init__(self, intervals):
+        self.intervals = intervals
+        self.u_low = M.log(mach2dp_over_p(1.) + 1.)
+        self.u_high = M.log(mach2dp_over_p(10.) + 1.)
+        self.step = (self.u_high - self.u_low) / intervals
+        self.steps_per_u = 1. / self.step
+
+        u = [self.u_low + i * self.step for i in range(intervals + 1)]
+        u[-1] = self.u_high
+        if N is not None:
+            (mach, iterations) = _super_mach(N.exp(u) - 1., 1., 10., 1e-14)
+            mach = [float(m) for m in mach]
+        else:
+            mach = [_super_mach(M.exp(x) - 1., 1., 10., 1e-14)[0] for x in
+                    u]
+
+        # slope of mach per table step, from the derivative of the pitot 
+        # equation
+
+        slope = [m * (7. * m ** 2. - 1.) / (7. * (2. * m ** 2. - 1.))
+                 * self.step for m in mach]
+
+        self.coeffs = []
+        for i in range(intervals):
+            self.coeffs.append((mach[i], slope[i], 3. * (mach[i + 1]
+                               - mach[i]) - 2. * slope[i] - slope[i + 1],
+                               2. * (mach[i] - mach[i + 1]) + slope[i]
+                               + slope[i + 1]))
+
+        if N is not None:
+            self.coeffs_array = N.array(self.coeffs)
+
+        self.max_error = self._max_error(False)
+        self.refined_error = self._max_error(True)
+
+    def mach(self, dp_over_p, refine, low=1., high=10., tol=1e-10,
+             name='mach'):
+        """
+        Return the mach number for dp_over_p, a single value or a numpy 
+        array, and the number of iterations used.  Values outside the table
+        are passed to _super_mach, with low, high, tol and name.
+        """
+
+        if _is_array(dp_over_p):
+            u = N.log(dp_over_p + 1.)
+            inside = (u >= self.u_low) & (u <= self.u_high)
+            x = (u[inside] - self.u_low) * self.steps_per_u
+            i = N.minimum(x.astype(int), self.intervals - 1)
+            t = x - i
+            c = self.coeffs_array[i]
+
+            mach = N.empty(u.shape)
+            mach[inside] = c[:, 0] + t * (c[:, 1] + t * (c[:, 2] + t
+                                          * c[:, 3]))
+            if refine:
+                mach[inside] = _newton_step(mach[inside],
+                                            dp_over_p[inside])
+            iterations = int(refine)
+            if not N.all(inside):
+                (mach[~inside], solver_iterations) = \
+                    _super_mach(dp_over_p[~inside], low, high, tol, name)
+                iterations = max(iterations, solver_iterations)
+            return (mach, iterations)
+
+        u = M.log(dp_over_p + 1.)
+        if not self.u_low <= u <= self.u_high:
+            return _super_mach(dp_over_p, low, high, tol, name)
+        x = (u - self.u_low) * self.steps_per_u
+        i = min(int(x), self.intervals - 1)
+        t = x - i
+        (c0, c1, c2, c3) = self.coeffs[i]
+        mach = c0 + t * (c1 + t * (c2 + t * c3))
+        if refine:
+            return (_newton_step(mach, dp_over_p), 1)
+
+        return (mach, 0)
+
+    def _max_error(self, refine):
+        """
+        Return the maximum relative error of mach and dp_over_p versus the 
+        pitot equation, sampled at the quarter points of each interval.  The 
+        interpolation error peaks close to, but not exactly at, the middle 
+        of an interval, so the sampled maximum is padded by 1% to give a 
+        bound.
+        """
+
+        u = [self.u_low + (i + n / 4.) * self.step for i in
+             range(self.intervals) for n in (1, 2, 3)]
+        errors = {'mach': 0., 'dp_over_p': 0.}
+        if N is not None:
+            dp_over_p = N.exp(u) - 1.
+            (mach, iterations) = _super_mach(dp_over_p, 1., 10., 1e-14)
+            (mach_table, iterations) = self.mach(dp_over_p, refine)
+            errors['mach'] = float(N.abs((mach_table - mach) / mach).max())
+            errors['dp_over_p'] = float(N.abs((mach2dp_over_p(mach_table)
+                                        - dp_over_p) / dp_over_p).max())
+        else:
+            for x in u:
+                dp_over_p = M.exp(x) - 1.
+                (mach, iterations) = _super_mach(dp_over_p, 1., 10., 1e-14)
+                (mach_table, iterations) = self.mach(dp_over_p, refine)
+                errors['mach'] = max(errors['mach'], abs((mach_table
+                                     - mach) / mach))
+                errors['dp_over_p'] = max(errors['dp_over_p'],
+                        abs((mach2dp_over_p(mach_table) - dp_over_p)
+                        / dp_over_p))
+
+        return dict((key, 1.01 * value) for (key, value) in errors.items())
+
+
+def _newton_step(mach, dp_over_p):
+    """
+    Return mach improved by one Newton step on the supersonic pitot 
+    equation.
+    """
+
+    pitot_ratio = F * mach ** 7. / (7. * mach ** 2. - 1.) ** 2.5
+    slope = (pitot_ratio * 7. * (2. * mach ** 2. - 1.)) / (mach * (7. * mach
+             ** 2. - 1.))
+
+    return mach - (pitot_ratio - 1. - dp_over_p) / slope
+
+
+def _get_table():
+    """
+    Return the pitot table, building it if this is the first time it is 
+    needed.
+    """
+
+    global _table
+
+    if _table is None:
+        _table = _PitotTable(_TABLE_INTERVALS)
+
+    return _table
+
+
+def _super_solve(dp_over_p, low, high, tol, name='mach'):
+    """
+    Return the supersonic solution of the pitot equation, and the number of
+    iterations used, from the table if table mode is enabled and the table 
+    is accurate to within tol, or else from _super_mach.
+    """
+
+    if _table_enabled:
+        table = _get_table()
+        if _table_refine:
+            error = table.refined_error['dp_over_p']
+        else:
+            error = table.max_error['dp_over_p']
+        if error <= tol:
+            return table.mach(dp_over_p, _table_refine, low, high, tol,
+                              name)
+
+    return _super_mach(dp_over_p, low, high, tol, name)
+
+
+def enable_table(refine=False):
+    """
+    Switch the supersonic solutions in dp_over_p2mach and dp2cas, and the 
+    functions that use them, such as cas_alt2mach and mach_alt2cas, to a 
+    precomputed table of the pitot equation from mach 1 to 10, in place of 
+    iteration.  The table is built the first time it is needed, and then 
+    kept for the rest of the session.
+
+    The maximum relative error of dp_over_p from the table is less than 
+    1e-11.  If refine is True, each value from the table is refined by one 
+    Newton step, which reduces the error to close to rounding error.  Call 
+    table_info() for the maximum errors.
+
+    Solutions asked for with a tolerance smaller than the maximum error of 
+    the table, and CAS above mach 10 at sea level, are still found by 
+    iteration.
+
+    Examples:
+
+    >>> enable_table()
+    >>> dp_over_p2mach(3.5, full_output = True)
+    (1.762665125185033, 0)
+    >>> table_info()['max_error']['dp_over_p'] < 1e-11
+    True
+    >>> disable_table()
+    """
+
+    global _table_enabled, _table_refine
+
+    _table_enabled = True
+    _table_refine = bool(refine)
+
+
+def disable_table():
+    """
+    Return the supersonic solutions in dp_over_p2mach and dp2cas to 
+    iteration.  The table is kept, in case table mode is enabled again.
+    """
+
+    global _table_enabled
+
+    _table_enabled = False
+
+
+def table_info():
+    """
+    Return a dictionary describing the table used in table mode, or None if 
+    table mode is not enabled.
+
+    The dictionary holds the mach range ('min_mach' and 'max_mach'), the 
+    number of intervals in the table ('intervals'), whether each value is 
+    refined by a Newton step ('refine'), and the maximum relative error 
+    ('max_error') of 'mach' and 'dp_over_p' versus the pitot equation.
+    """
+
+    if not _table_enabled:
+        return None
+
+    table = _get_table()
+    if _table_refine:
+        error = table.refined_error
+    else:
+        error = table.max_error
+
+    return {'min_mach': 1., 'max_mach': 10., 'intervals': table.intervals,
+            'refine': _table_refine, 'max_error': dict(error)}
+
+
 # #############################################################################
 #
 # delta pressure to speed
@@ -155,21 +564,33 @@ def _dp2speed(
     ):
 
     dp = U.press_conv(dp, from_units=press_units, to_units='pa')
-    speed = M.sqrt(((7. * Pref) * (1. / Rhoref)) * ((dp / Pref + 1.)
-                    ** (2. / 7.) - 1.))
+    speed = _dp2speed_ms(dp, Pref, Rhoref)
 
     # check to confirm the speed is less than 661.48 kt
 
     speed_kt = U.speed_conv(speed, from_units='m/s', to_units='kt')
-    if speed_kt > 661.48:
+    if _exceeds(speed_kt, 661.48):
         raise ValueError('The function _dp2speed only works if the speed is less than or equal to 661.48 kt')
     speed = U.speed_conv(speed, from_units='m/s', to_units=speed_units)
 
     return speed
 
 
+def _dp2speed_ms(dp, Pref, Rhoref):
+    """
+    Return the speed in m/s for a differential pressure in pa.  Subsonic 
+    equation.  Negative differential pressures in an array give nan.
+    """
+
+    x = ((7. * Pref) * (1. / Rhoref)) * ((dp / Pref + 1.) ** (2. / 7.) - 1.)
+    if _is_array(x):
+        with N.errstate(invalid='ignore'):
+            return N.sqrt(x)
+    return M.sqrt(x)
+
+
 def dp2cas(dp, press_units=default_press_units,
-           speed_units=default_speed_units):
+           speed_units=default_speed_units, tol=1e-10, full_output=False):
     """
     Return the CAS for a given differential pressure (the difference 
     between the pitot and static pressures).
@@ -182,75 +603,67 @@ def dp2cas(dp, press_units=default_press_units,
 
     If the units are not specified, the units in default_units.py are used.
 
+    Supersonic CAS are found by iteration, until the differential pressure
+    of the result is within a relative error of tol.  If full_output is 
+    True, (cas, iterations) is returned, where iterations is the number of 
+    iterations used (zero if all the CAS are subsonic).
+
     Examples:
     
     Determine the CAS in kt that is equivalent to a differential pressure 
     of 15 in HG:
     >>> dp2cas(15)
-    518.9663756612765
+    518.9663756612766
     
     Determine the CAS in mph that is equivalent to a differential pressure 
     of 0.2 psi:
     >>> dp2cas(.2, press_units = 'psi', speed_units = 'mph')
-    105.88271367435266
-    """
-
-    try:
-
-        # subsonic case
+    105.88271367435269
 
-        cas = _dp2speed(dp, P0, Rho0, press_units, speed_units)
-        return cas
-    except ValueError:
-
-        # supersonic case - need to iterate a solution.  Set upper and lower
-        # guesses, and iterate until we zero in on a cas that produces the
-        # desired differential pressure.
-
-        dp_seek = U.press_conv(dp, from_units=press_units, to_units='pa'
-                               )
-
-        low = 340.  # initial lower guess, m/s
-
-        # This function works up to approximately 6,600 kt CAS.  The upper
-        # limit can be extended by increasing the value of the initial upper
-        # guess ("high").
+    Determine the CAS in kt for an array of differential pressures in in HG,
+    with the last one being supersonic:
+    >>> dp2cas([5, 15, 30])
+    array([314.25271985, 518.96637566, 693.00101848])
+    """
 
-        high = 3400.  # initial upper guess, m/s
+    dp = U.press_conv(dp, from_units=press_units, to_units='pa')
 
-        # confirm initial low and high are OK:
+    # subsonic case
 
-        dp_low = _super_cas2dp(low)
-        if dp_low > dp_seek:
-            raise ValueError('Initial lower cas guess is too high.')
+    cas = _dp2speed_ms(dp, P0, Rho0)
 
-        dp_high = _super_cas2dp(high)
-        if dp_high < dp_seek:
-            raise ValueError('Initial upper cas guess is too low.')
+    # supersonic case - need to iterate a solution for the samples that are
+    # above 661.48 kt
 
-        guess = (low + high) / 2.
-        dp_guess = _super_cas2dp(guess)
+    iterations = 0
+    supersonic = U.speed_conv(cas, from_units='m/s', to_units='kt') > 661.48
+    if _is_array(cas):
+        if N.any(supersonic):
+            (cas[supersonic], iterations) = _super_dp2cas(dp[supersonic],
+                                                          tol)
+    elif supersonic:
+        (cas, iterations) = _super_dp2cas(dp, tol)
 
-        # keep iterating until dp is within 0.001% of desired value
+    cas = U.speed_conv(cas, from_units='m/s', to_units=speed_units)
 
-        while M.fabs(dp_guess - dp_seek) / dp_seek > 1e-5:
-            if dp_guess > dp_seek:
-                high = guess
-            else:
-                low = guess
+    if full_output:
+        return (cas, iterations)
+    return cas
 
-            guess = (low + high) / 2.
-            dp_guess = _super_cas2dp(guess)
 
-    # the supersonic solution is in m/s, so we need to convert to the
-    # desired units.
+def _super_dp2cas(dp, tol):
+    """
+    Return the CAS in m/s for a differential pressure in pa, and the number
+    of iterations used.
 
-    cas = U.speed_conv(guess, from_units='m/s', to_units=speed_units)
+    This function only works for CAS from 340 to 3400 m/s, (approximately 
+    660 to 6,600 kt).  It is only intended for CAS > 661.48 kt.
+    """
 
-    # Supersonic case.  The subsonic case is returned way up at the top,
-    # inside the try statement.
+    (cas_over_A0, iterations) = _super_solve(dp / P0, 340. / A0, 3400.
+                                             / A0, tol, name='cas')
 
-    return cas
+    return (cas_over_A0 * A0, iterations)
 
 
 def dp2eas(
@@ -395,7 +808,14 @@ def cas2dp(cas, speed_units=default_speed_units,
 
 #   if kcas > 661.48:
 
-    if mcas > A0:
+    if _is_array(mcas):
+        supersonic = mcas > A0
+        dp = N.empty_like(mcas)
+        dp[supersonic] = _super_cas2dp(mcas[supersonic])
+        dp[~supersonic] = _speed2dp(mcas[~supersonic], P0, Rho0,
+                                    press_units='pa', speed_units='m/s')
+        dp = U.press_conv(dp, from_units='pa', to_units=press_units)
+    elif mcas > A0:
 
         # supersonic case
 
@@ -439,7 +859,7 @@ def eas2dp(
     # check to confirm the speed is less than 661.48 kt
 
     keas = U.speed_conv(eas, from_units=speed_units, to_units='kt')
-    if keas > 661.48:
+    if _exceeds(keas, 661.48):
         raise ValueError('The function eas2dp only works if the eas is less than or equal to 661.48 kt')
 
     P = SA.alt2press(altitude, alt_units=alt_units, press_units='pa')
@@ -482,7 +902,7 @@ def tas2dp(
     # check to confirm the speed is less than 661.48 kt
 
     ktas = U.speed_conv(tas, from_units=speed_units, to_units='kt')
-    if ktas > 661.48:
+    if _exceeds(ktas, 661.48):
         raise ValueError('The function tas2dp only works if the tas is less than or equal to 661.48 kt')
 
     P = SA.alt2press(altitude, alt_units=alt_units, press_units='pa')
@@ -576,7 +996,7 @@ def cas2tas(
     
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         temp = SA.alt2temp(altitude, temp_units=temp_units,
                            alt_units=alt_units)
 
@@ -661,7 +1081,7 @@ def eas2tas(
     
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         temp = SA.alt2temp(altitude, temp_units=temp_units,
                            alt_units=alt_units)
 
@@ -743,11 +1163,11 @@ def eas2cas(
     
     Determine equivalent Air Speed for 250 kt CAS at 10,000 ft:
     >>> cas2eas(250, 10000)
-    248.09577774599643
+    248.09577774599646
     
     Determine equivalent Air Speed for 250 mph CAS at 10,000 ft:
     >>> cas2eas(250, 10000, speed_units = 'mph')
-    248.54048779668804
+    248.54048779668813
     """
 
     dp = eas2dp(eas, altitude, speed_units, alt_units)
@@ -819,25 +1239,25 @@ def tas2cas(
     Determine the true Air Speed for 250 kt CAS at 10,000 ft with standard
     temperature:
     >>> cas2tas(250, 10000)
-    288.7022797291816
+    288.70227972918167
 
     Determine the true Air Speed for 250 mph CAS at 10,000 ft with standard
     temperature:
     >>> cas2tas(250, 10000, speed_units = 'mph')
-    289.2197766677413
+    289.2197766677414
 
     Determine the true Air Speed for 250 mph CAS at 10,000 ft with 
     temperature of 0 deg C:
     >>> cas2tas(250, 10000, 0, speed_units = 'mph')
-    291.80148625165526
+    291.8014862516553
 
     Determine the true Air Speed for 250 mph CAS at 10,000 ft with 
     temperature of 0 deg F:
     >>> cas2tas(250, 10000, 0, speed_units = 'mph', temp_units = 'F')
-    282.145887847616
+    282.14588784761605
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         temp = SA.alt2temp(altitude, temp_units=temp_units,
                            alt_units=alt_units)
 
@@ -931,7 +1351,7 @@ def tas2eas(
     
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         temp = SA.alt2temp(altitude, temp_units=temp_units,
                            alt_units=alt_units)
 
@@ -1014,61 +1434,50 @@ def i_tas2eas(data_items):
 # #############################################################################
 
 
-def dp_over_p2mach(dp_over_p):
+def dp_over_p2mach(dp_over_p, tol=1e-10, full_output=False):
     """
     Return the mach number for a given delta p over p.
 
     Mach must be less than or equal to 10.
-    """
-
-#   mach = (5*( (dp_over_p + 1)**(2/7.) -1) )**0.5
-
-    mach = M.sqrt(5. * ((dp_over_p + 1.) ** (2. / 7.) - 1.))
-
-    if mach <= 1.:
-        return mach
-    else:
-
-        # supersonic case - need to iterate a solution.  Set upper and lower
-        # guesses, and iterate until we zero in on a mach that produces the
-        # desired result.
-
-        dp_over_p_seek = dp_over_p
-
-        low = 1.  # initial lower guess for mach
 
-        # This function works up to Mach 10  The upper limit can be
-        # extended by increasing the value of the initial upper guess
-        # ("high").
+    dp_over_p may be a single value, or a sequence or numpy array of values.
+    Supersonic mach numbers are found by iteration, until the delta p over p 
+    of the result is within a relative error of tol.  If full_output is 
+    True, (mach, iterations) is returned, where iterations is the number of 
+    iterations used (zero if all the mach numbers are subsonic).
 
-        high = 10.  # initial upper guess for mach
+    Example - determine the mach number for delta p over p of 0.11655 and 
+    3.5:
 
-        # confirm initial low and high are OK:
-
-        dp_over_p_low = mach2dp_over_p(low)
-        if dp_over_p_low > dp_over_p_seek:
-            raise ValueError('Initial lower mach guess is too high.')
-
-        dp_over_p_high = mach2dp_over_p(high)
-        if dp_over_p_high < dp_over_p_seek:
-            raise ValueError('Initial upper mach guess is too low.')
-
-        guess = (low + high) / 2.
-        dp_over_p_guess = mach2dp_over_p(guess)
-
-        # keep iterating until dp is within 0.001% of desired value
-
-        while M.fabs(dp_over_p_guess - dp_over_p_seek) / dp_over_p_seek\
-             > 1e-5:
-            if dp_over_p_guess > dp_over_p_seek:
-                high = guess
-            else:
-                low = guess
+    >>> dp_over_p2mach([0.11655, 3.5])
+    array([0.39999676, 1.76266513])
+    """
 
-            guess = (low + high) / 2.
-            dp_over_p_guess = mach2dp_over_p(guess)
+#   mach = (5*( (dp_over_p + 1)**(2/7.) -1) )**0.5
 
-    return guess
+    if _is_array(dp_over_p):
+        dp_over_p = N.asarray(dp_over_p, dtype=float)
+        with N.errstate(invalid='ignore'):
+            mach = N.sqrt(5. * ((dp_over_p + 1.) ** (2. / 7.) - 1.))
+    else:
+        mach = M.sqrt(5. * ((dp_over_p + 1.) ** (2. / 7.) - 1.))
+
+    # supersonic case - need to iterate a solution.  This function works up
+    # to Mach 10.  The upper limit can be extended by increasing the upper 
+    # limit passed to _super_mach.
+
+    iterations = 0
+    supersonic = mach > 1.
+    if _is_array(mach):
+        if N.any(supersonic):
+            (mach[supersonic], iterations) = \
+                _super_solve(dp_over_p[supersonic], 1., 10., tol)
+    elif supersonic:
+        (mach, iterations) = _super_solve(dp_over_p, 1., 10., tol)
+
+    if full_output:
+        return (mach, iterations)
+    return mach
 
 
 def mach2dp_over_p(M):
@@ -1083,7 +1492,13 @@ def mach2dp_over_p(M):
     0.11655196580975336
     """
 
-    if M <= 1.:
+    if _is_array(M):
+        M = N.asarray(M, dtype=float)
+        supersonic = M > 1.
+        dp_over_p = (M ** 2. / 5. + 1.) ** 3.5 - 1.
+        dp_over_p[supersonic] = (F * M[supersonic] ** 7.) / (7.
+                * M[supersonic] ** 2. - 1.) ** 2.5 - 1.
+    elif M <= 1.:
         dp_over_p = (M ** 2. / 5. + 1.) ** 3.5 - 1.
     else:
         dp_over_p = (F * M ** 7.) / (7. * M ** 2. - 1.) ** 2.5 - 1.
@@ -1353,15 +1768,15 @@ def mach2tas(
     Determine the TAS in mph at 0.8 mach at 5000 m, assuming 
     standard temperature:
     >>> mach2tas(0.8, altitude = 5000, alt_units = 'm', speed_units = 'mph')
-    573.6032679038371
+    573.6032679038373
     
     Determine the TAS in km/h at 0.4 mach at a temperature of 
     300 deg K:
     >>> mach2tas(0.4, 300, temp_units = 'K', speed_units = 'km/h')
-    499.99796329569176
+    499.9979632956918
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         if altitude != 'blank':
             temp = SA.alt2temp(altitude, temp_units=temp_units,
                                alt_units=alt_units)
@@ -1449,7 +1864,7 @@ def tas2mach(
     Determine the mach number for a TAS of 500 kt at a temperature of
     0 deg F:
     >>> tas2mach(500, 0, temp_units = 'F')
-    0.8029278875876428
+    0.8029278875876426
     
     Determine the mach number for a TAS of 500 kt at an altitude of
     10,000 ft, assuming standard temperature:
@@ -1459,10 +1874,10 @@ def tas2mach(
     Determine the mach number for a TAS of 400 mph at an altitude of
     5000 m, assuming standard temperature:
     >>> tas2mach(400, altitude = 5000, speed_units = 'mph', alt_units = 'm')
-    0.5578768774616658
+    0.5578768774616657
     """
 
-    if temp == 'std':
+    if _is_std(temp):
         if altitude != 'blank':
             temp = SA.alt2temp(altitude, temp_units=temp_units,
                                alt_units=alt_units)
@@ -105,7 +105,7 @@ def eas2cl(
     >>> W = 1800
     >>> EAS = 55
     >>> eas2cl(EAS, W, S, speed_units='kt', weight_units='lb', area_units='ft**2')
-    1.597820083228606
+    1.5978200832286058
     """
 
     eas = U.speed_conv(eas, from_units=speed_units, to_units='m/s')
@@ -159,7 +159,7 @@ def cas2cl(
     >>> Alt = 3000
     >>> cas2cl(CAS, Alt, W, S, load_factor = 2**0.5, speed_units='km/h',\
     alt_units='m', weight_units='kg', area_units='m**2') 
-    0.7357813111713088
+    0.7357813111713084
     
     """
 
@@ -27,72 +27,117 @@
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # #############################################################################
 #
-# version 0.20, 26 Feb 2020
+# version 0.32, 16 Oct 2026
 #
 # Version History:
 # vers     date       Notes
 # 0.10   30 Jun 2009  First public release.
 # 0.20   26 Feb 2020  Python 3.7 compatibility tweaks
+# 0.30   16 Oct 2026  Add GridInterpolator, for multilinear interpolation of
+#                     arrays of points on a regular grid in any number of 
+#                     dimensions
+# 0.31   16 Oct 2026  Add natural, akima and pchip cubic methods to 
+#                     GridInterpolator
+# 0.32   16 Oct 2026  interpolate() accepts whole tables of x and y, and 
+#                     arrays of x1
 # #############################################################################
-
-"""
-Provides functions to perform linear interpolation in one, two or three
-dimensions.
-"""
-
-def interpolate(x, y, x1):
-	"""
-	Returns y1 that is the interpolated y value for x1, given two lists of
-	x and y values.
+
+"""
+Provides functions to perform linear interpolation in one, two or three
+dimensions, and GridInterpolator, to interpolate arrays of points in a table
+of values on a grid in any number of dimensions.
+"""
+
+import bisect
+
+try:
+	import numpy as N
+except ImportError:
+	N = None
+
+def interpolate(x, y, x1):
+	"""
+	Returns y1 that is the interpolated y value for x1, given two lists of
+	x and y values.
+
+	x may have just the two values that bracket x1, or be a whole table of 
+	values, either increasing or decreasing, with the matching y values.  
+	The interval for x1 is found with a binary search.  Values of x1 
+	outside the table are extrapolated from the interval at the end.
+
+	x1 may be a single value, or an array of values, which are all 
+	interpolated in one pass (requires numpy).  With only two x values, the
+	y values may also be arrays, which are broadcast against x1.
 
     Example:
 
-    if the x values are:
-	x = [13000, 13500]
+    if the x values are:
+	x = [13000, 13500]
     and the corresponding y values are:
 
-	y = [2000, 25O0]
-	and we want to know the interpolated y value for x = 13100: 
+	y = [2000, 25O0]
+	and we want to know the interpolated y value for x = 13100: 
     >>> x = [13000, 13500]
     >>> y = [2000, 2500]
     >>> x1 = 13100
     >>> interpolate(x, y, x1)
     2100.0
-	"""
-	for item in x:
-		item = float(item)
-	for item in y:
-		item = float(item)
-	x1 = float(x1)
-	  
-	y1 = y[0] + (x1 - x[0]) / (x[1] - x[0]) * (y[1] - y[0])
-	
-	return y1
-
-
-def interpolate2(x, y, z, x1, y1):
-	"""
-	Two-dimensional interpolation.
-	
-	Returns z1 value that is the interpolated z value for x1 and y1, given
-	three lists of x, y, and z values.
-	
-	The z list has two items, with each being a list of two items.  E.g.:
-	
-	z = [[1, 2], [3, 4]]
-	
-
+
+    A whole table, and several values at once:
+
+    >>> x = [0, 1000, 2000, 4000]
+    >>> y = [100, 90, 85, 75]
+    >>> interpolate(x, y, 3000)
+    80.0
+    >>> interpolate(x, y, [500, 1500, 5000]).tolist()
+    [95.0, 87.5, 70.0]
+	"""
+	if len(x) != len(y) or len(x) < 2:
+		raise ValueError('x and y must have the same number of values, and at least two.')
+	if N is not None and N.ndim(x1) > 0:
+		x1 = N.asarray(x1, dtype=float)
+	else:
+		x1 = float(x1)
+
+	if len(x) == 2:
+		return y[0] + (x1 - x[0]) / (x[1] - x[0]) * (y[1] - y[0])
+
+	if x[-1] < x[0]:
+		x = x[::-1]
+		y = y[::-1]
+	if isinstance(x1, float):
+		i = min(max(bisect.bisect_right(x, x1) - 1, 0), len(x) - 2)
+	else:
+		x = N.asarray(x, dtype=float)
+		y = N.asarray(y, dtype=float)
+		i = N.clip(N.searchsorted(x, x1, 'right') - 1, 0, len(x) - 2)
+
+	return y[i] + (x1 - x[i]) / (x[i + 1] - x[i]) * (y[i + 1] - y[i])
+
+
+def interpolate2(x, y, z, x1, y1):
+	"""
+	Two-dimensional interpolation.
+	
+	Returns z1 value that is the interpolated z value for x1 and y1, given
+	three lists of x, y, and z values.
+	
+	The z list has two items, with each being a list of two items.  E.g.:
+	
+	z = [[1, 2], [3, 4]]
+	
+
     Example:
 
-    if the x and y values are:
-	x = [13000, 13500]
-	y = [10, 20]
-	
-	and, the z value for x, y of 13000, 10 = 2000, 
-	the z value for x, y of 13500, 10 = 2500, 
-	the z value for x, y of 13000, 20 = 2200, and
-	the z value for x, y of 13500, 20 = 2700, then
-	
+    if the x and y values are:
+	x = [13000, 13500]
+	y = [10, 20]
+	
+	and, the z value for x, y of 13000, 10 = 2000, 
+	the z value for x, y of 13500, 10 = 2500, 
+	the z value for x, y of 13000, 20 = 2200, and
+	the z value for x, y of 13500, 20 = 2700, then
+	
 	z = [[2000, 2500],[2200, 2700]]
 	
 	if we want to find the z value for x, y = 1310, 12:
@@ -104,42 +149,42 @@ def interpolate2(x, y, z, x1, y1):
     >>> y1 = 12
     >>> interpolate2(x, y, z, x1, y1)
     2140.0
-	"""
-	y11 = interpolate(x, z[0], x1)
-	y22 = interpolate(x, z[1], x1)
-	
-	z1 = interpolate(y, [y11, y22], y1)
-	
-	return z1
-
-def interpolate3(x, y, z, v, x1, y1, z1):
-	"""
-	Three-dimensional interpolation.
-	
-	Returns v1 value that is the interpolated v value for x1, y1 and z1, 
-	given four lists of x, y, and z values and the corresponding v values.
-	
-	The v list has two items, with each being a list of two lists.  E.g.:
-	
-	v = [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]
-	
-    Example:
-
-	if the x, y and z values are:
-	x = [13000, 13500]
-	y = [10, 20]
-	z = [90, 95]
-	
-	and, the v value for x, y, z of 13000, 10, 90 = 2000, 
-	the v value for x, y, z of 13500, 10, 90 = 2500, 
-	the v value for x, y, z of 13000, 20, 90 = 2200, 
-	the v value for x, y, z of 13500, 20, 90 = 2700,
-	the v value for x, y, z of 13000, 10, 95 = 3000, 
-	the v value for x, y, z of 13500, 10, 95 = 3500, 
-	the v value for x, y, z of 13000, 20, 95 = 3200, 
-	the v value for x, y, z of 13500, 20, 95 = 3700, then
-	
-	v = [[[2000, 2500],[2200, 2700]], [[3000, 3500],[3200, 3700]]]
+	"""
+	y11 = interpolate(x, z[0], x1)
+	y22 = interpolate(x, z[1], x1)
+	
+	z1 = interpolate(y, [y11, y22], y1)
+	
+	return z1
+
+def interpolate3(x, y, z, v, x1, y1, z1):
+	"""
+	Three-dimensional interpolation.
+	
+	Returns v1 value that is the interpolated v value for x1, y1 and z1, 
+	given four lists of x, y, and z values and the corresponding v values.
+	
+	The v list has two items, with each being a list of two lists.  E.g.:
+	
+	v = [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]
+	
+    Example:
+
+	if the x, y and z values are:
+	x = [13000, 13500]
+	y = [10, 20]
+	z = [90, 95]
+	
+	and, the v value for x, y, z of 13000, 10, 90 = 2000, 
+	the v value for x, y, z of 13500, 10, 90 = 2500, 
+	the v value for x, y, z of 13000, 20, 90 = 2200, 
+	the v value for x, y, z of 13500, 20, 90 = 2700,
+	the v value for x, y, z of 13000, 10, 95 = 3000, 
+	the v value for x, y, z of 13500, 10, 95 = 3500, 
+	the v value for x, y, z of 13000, 20, 95 = 3200, 
+	the v value for x, y, z of 13500, 20, 95 = 3700, then
+	
+	v = [[[2000, 2500],[2200, 2700]], [[3000, 3500],[3200, 3700]]]
 
 	if we want to find the v value for x, y, z = 13250, 15, 92.5:
 
@@ -152,16 +197,341 @@ def interpolate3(x, y, z, v, x1, y1, z1):
     >>> z1 = 91
     >>> interpolate3(x, y, z, v, x1, y1, z1)
     2340.0
-
-	"""
-	z11 = interpolate2(x, y, v[0], x1, y1)
-	z22 = interpolate2(x, y, v[1], x1, y1)
-	
-	v1 = interpolate(z, [z11, z22], z1)
-	
+
+	"""
+	z11 = interpolate2(x, y, v[0], x1, y1)
+	z22 = interpolate2(x, y, v[1], x1, y1)
+	
+	v1 = interpolate(z, [z11, z22], z1)
+	
 	return v1
 
 
+class GridInterpolator:
+	"""
+	Multilinear interpolation in a table of values on a regular grid, in any
+	number of dimensions.
+
+	The grid is defined by a list of axes, each an increasing sequence of at
+	least two values.  The table is an array with one dimension per axis, in 
+	the same order, so values[i, j, k] is the value at axes[0][i], 
+	axes[1][j] and axes[2][k].  Note this is the reverse of the nesting 
+	used by interpolate2 and interpolate3, where the first index is for the
+	last coordinate.
+
+	The grid is set up once, and the interpolator is then called with one 
+	coordinate per axis.  The coordinates may be numbers, or arrays, which 
+	are broadcast against each other, and the result has the broadcast 
+	shape.  The bracketing grid points for all the points are found with a
+	binary search on each axis, and the interpolation is done in one pass 
+	for all points.
+
+	bounds sets what is returned for points outside the grid:
+	'clamp' = the value at the nearest point on the edge of the grid
+	'extrapolate' = extrapolation with the polynomial for the interval at the edge of the grid
+	'nan' = nan
+
+	method sets the interpolation between the grid points:
+	'linear' = multilinear interpolation
+	'natural' = cubic spline, with zero second derivative at the ends of each axis
+	'akima' = Akima cubic, which follows the data with less overshoot near sudden changes of slope
+	'pchip' = monotone piecewise cubic (Fritsch-Carlson), which does not overshoot the data between grid points, so monotone data stays monotone
+
+	The cubic methods are cubic Hermite polynomials along each axis, with 
+	the slopes at the grid points found by the method along that axis, and
+	their products in several dimensions.  The polynomial coefficients for
+	every grid cell are computed when the interpolator is set up, so a 
+	lookup is one polynomial evaluation per point.  A cubic method can give
+	the same accuracy as linear interpolation in a much smaller table, if 
+	the data is smooth.
+
+	numpy is required.
+
+	Example, the same table as the interpolate3 example:
+
+	>>> axes = [[13000, 13500], [10, 20], [90, 95]]
+	>>> values = [[[2000, 3000], [2200, 3200]], [[2500, 3500], [2700, 3700]]]
+	>>> grid = GridInterpolator(axes, values)
+	>>> grid(13125, 12.5, 92.5)
+	2675.0
+
+	Several points at once, and points outside the grid:
+
+	>>> grid([13125, 13500], [12.5, 20], [92.5, 95]).tolist()
+	[2675.0, 3700.0]
+	>>> grid(14000, 20, 95)
+	3700.0
+	>>> GridInterpolator(axes, values, bounds='extrapolate')(14000, 20, 95)
+	4200.0
+	>>> GridInterpolator(axes, values, bounds='nan')(14000, 20, 95)
+	nan
+
+	A monotone cubic in one dimension:
+
+	>>> grid = GridInterpolator([[0, 1, 2, 3]], [0, 0, 1, 1], method='pchip')
+	>>> grid([0.5, 1.5, 2.5]).tolist()
+	[0.0, 0.5, 1.0]
+	"""
+
+	def __init__(self, axes, values, bounds='clamp', method='linear'):
+		if N is None:
+			raise ImportError('GridInterpolator requires numpy.')
+		if bounds not in ('clamp', 'extrapolate', 'nan'):
+			raise ValueError('bounds must be one of "clamp", "extrapolate" or "nan".')
+		if method not in ('linear', 'natural', 'akima', 'pchip'):
+			raise ValueError('method must be one of "linear", "natural", "akima" or "pchip".')
+		self.method = method
+		self.axes = [N.array(axis, dtype=float) for axis in axes]
+		self.values = N.array(values, dtype=float)
+		self.bounds = bounds
+		if self.values.shape != tuple(len(axis) for axis in self.axes):
+			raise ValueError('The shape of values must match the length of the axes.')
+		for axis in self.axes:
+			if axis.ndim != 1 or len(axis) < 2 or N.any(N.diff(axis) <= 0):
+				raise ValueError('Each axis must be an increasing sequence of at least two values.')
+
+		# values as a flat array, with the step in the flat array for one
+		# step along each axis
+
+		self._flat = self.values.ravel()
+		self._strides = [int(N.prod(self.values.shape[n + 1:])) for n in
+			range(self.values.ndim)]
+
+		# lists for single points, which are faster to interpolate without
+		# the overhead of numpy
+
+		self._axis_lists = [axis.tolist() for axis in self.axes]
+		self._flat_list = self._flat.tolist()
+
+		if method != 'linear':
+			self._coeffs = self._cubic_coeffs()
+			cells = [len(axis) - 1 for axis in self.axes]
+			self._cell_strides = [int(N.prod(cells[n + 1:])) for n in
+				range(len(cells))]
+
+	def __call__(self, *points):
+		if len(points) != len(self.axes):
+			raise ValueError('There must be one coordinate for each of the %d axes.' % len(self.axes))
+		if self.method == 'linear' and all(isinstance(point, (int, float))
+				for point in points):
+			return self._point(points)
+		points = N.broadcast_arrays(*[N.asarray(point, dtype=float) for
+			point in points])
+		shape = points[0].shape
+
+		cells = []
+		fractions = []
+		outside = N.zeros(points[0].size, dtype=bool)
+		for axis, point in zip(self.axes, points):
+			point = point.ravel()
+			i = N.clip(N.searchsorted(axis, point, 'right') - 1, 0,
+				len(axis) - 2)
+			t = (point - axis[i]) / (axis[i + 1] - axis[i])
+			if self.bounds == 'clamp':
+				t = N.clip(t, 0., 1.)
+			elif self.bounds == 'nan':
+				outside |= (point < axis[0]) | (point > axis[-1])
+			cells.append(i)
+			fractions.append(t)
+
+		if self.method == 'linear':
+			base = sum(i * stride for i, stride in zip(cells, self._strides))
+			value = self._interpolate(base, fractions)
+		else:
+			cell = sum(i * stride for i, stride in zip(cells,
+				self._cell_strides))
+			value = self._evaluate(cell, fractions)
+		value[outside] = N.nan
+
+		if shape == ():
+			return float(value[0])
+		return value.reshape(shape)
+
+	def _point(self, point):
+		"""
+		Returns the interpolated value for a single point
+		"""
+		base = 0
+		fractions = []
+		for axis, x, stride in zip(self._axis_lists, point, self._strides):
+			i = min(max(bisect.bisect_right(axis, x) - 1, 0), len(axis) - 2)
+			t = (x - axis[i]) / (axis[i + 1] - axis[i])
+			if x < axis[0] or x > axis[-1]:
+				if self.bounds == 'clamp':
+					t = min(max(t, 0.), 1.)
+				elif self.bounds == 'nan':
+					return float('nan')
+			base += i * stride
+			fractions.append(t)
+
+		value = 0.
+		for corner in range(2 ** len(fractions)):
+			index = base
+			weight = 1.
+			for n, t in enumerate(fractions):
+				if corner >> n & 1:
+					index += self._strides[n]
+					weight *= t
+				else:
+					weight *= 1. - t
+			value += weight * self._flat_list[index]
+
+		return value
+
+	def _interpolate(self, base, fractions):
+		"""
+		Returns the weighted sum of the values at the corners of the grid 
+		cells, given the flat index of the low corner of each cell and the
+		fractional position of the points along each axis
+		"""
+		value = 0.
+		for corner in range(2 ** len(fractions)):
+			index = base
+			weight = 1.
+			for n, t in enumerate(fractions):
+				if corner >> n & 1:
+					index = index + self._strides[n]
+					weight = weight * t
+				else:
+					weight = weight * (1. - t)
+			value = value + weight * self._flat[index]
+
+		return N.array(value, dtype=float).reshape(-1)
+
+	def _evaluate(self, cell, fractions):
+		"""
+		Returns the value of the cubic polynomials for the grid cells, given
+		the flat index of each cell and the fractional position of the 
+		points along each axis
+		"""
+
+		# powers of the fractional positions, multiplied together for all
+		# the axes, in the same order as the coefficients
+
+		terms = N.ones((len(cell), 1))
+		for t in fractions:
+			powers = t[:, None] ** N.arange(4)
+			terms = (terms[:, :, None] * powers[:, None, :]).reshape(len(cell),
+				-1)
+
+		return N.einsum('ij,ij->i', self._coeffs[cell], terms)
+
+	def _cubic_coeffs(self):
+		"""
+		Returns the cubic polynomial coefficients for each grid cell, as an 
+		array with one row per cell, in the order of the flat index of the
+		cells, and 4**N columns, for the powers 0 to 3 of the fractional 
+		position along each axis.
+		"""
+		ndim = len(self.axes)
+
+		# the values, and the slopes at the grid points along each set of 
+		# axes.  derivs[a] is the derivative along the axes n where bit n of
+		# a is set.
+
+		derivs = [self.values]
+		for a in range(1, 2 ** ndim):
+			n = a.bit_length() - 1
+			derivs.append(_slopes(self.axes[n], derivs[a - 2 ** n], n,
+				self.method))
+		coeffs = N.array(derivs).reshape((2,) * ndim + self.values.shape)
+		coeffs = coeffs.transpose(list(range(ndim))[::-1] + list(range(ndim,
+			2 * ndim)))
+
+		# convert the values and slopes at the ends of the intervals along 
+		# each axis to the coefficients of the cubic in the fractional
+		# position in the interval.  The first ndim dimensions hold the 
+		# derivative, and then the coefficient, for each axis.
+
+		for n, axis in enumerate(self.axes):
+			h = N.diff(axis).reshape((-1,) + (1,) * (ndim - n - 1))
+			y = N.moveaxis(coeffs, n, 0)
+			low = N.arange(len(axis) - 1)
+			y0 = y[0].take(low, axis=ndim - 1 + n)
+			y1 = y[0].take(low + 1, axis=ndim - 1 + n)
+			d0 = h * y[1].take(low, axis=ndim - 1 + n)
+			d1 = h * y[1].take(low + 1, axis=ndim - 1 + n)
+			coeffs = N.moveaxis(N.array([y0, d0, 3 * (y1 - y0) - 2 * d0 - d1,
+				2 * (y0 - y1) + d0 + d1]), 0, n)
+
+		# one row for each cell
+
+		coeffs = coeffs.reshape((4 ** ndim,) + coeffs.shape[ndim:])
+		return N.moveaxis(coeffs, 0, -1).reshape(-1, 4 ** ndim).copy()
+
+
+def _slopes(x, y, n, method):
+	"""
+	Returns the slopes dy/dx at the grid points of x, along dimension n of the
+	array y, for a natural spline, akima or pchip cubic
+	"""
+	y = N.moveaxis(y, n, 0)
+	h = N.diff(x).reshape((-1,) + (1,) * (y.ndim - 1))
+	delta = N.diff(y, axis=0) / h
+	if len(x) == 2:
+		return N.moveaxis(N.array([delta[0], delta[0]]), 0, n)
+
+	if method == 'natural':
+
+		# continuous second derivative at the interior points, and zero 
+		# second derivative at the ends
+
+		size = len(x)
+		A = N.zeros((size, size))
+		rhs = N.empty(y.shape)
+		A[0, :2] = [2., 1.]
+		rhs[0] = 3 * delta[0]
+		A[-1, -2:] = [1., 2.]
+		rhs[-1] = 3 * delta[-1]
+		for i in range(1, size - 1):
+			A[i, i - 1:i + 2] = [h.flat[i], 2 * (h.flat[i - 1] + h.flat[i]),
+				h.flat[i - 1]]
+			rhs[i] = 3 * (h[i] * delta[i - 1] + h[i - 1] * delta[i])
+		slopes = N.linalg.solve(A, rhs.reshape(size, -1)).reshape(y.shape)
+
+	elif method == 'akima':
+
+		# the interval slopes, extended by two intervals at each end
+		
+		m = N.concatenate([[3 * delta[0] - 2 * delta[1]], [2 * delta[0] - 
+			delta[1]], delta, [2 * delta[-1] - delta[-2]], [3 * delta[-1] -
+			2 * delta[-2]]])
+		w1 = N.abs(m[3:] - m[2:-1])
+		w2 = N.abs(m[1:-2] - m[:-3])
+		total = w1 + w2
+		with N.errstate(invalid='ignore', divide='ignore'):
+			slopes = N.where(total > 0, (w1 * m[1:-2] + w2 * m[2:-1]) / 
+				total, 0.5 * (m[1:-2] + m[2:-1]))
+
+	else:
+
+		# pchip: a weighted harmonic mean of the interval slopes at the 
+		# interior points, or zero where the data has a peak or is flat
+
+		w1 = 2 * h[1:] + h[:-1]
+		w2 = h[1:] + 2 * h[:-1]
+		slopes = N.zeros(y.shape)
+		same_sign = delta[:-1] * delta[1:] > 0
+		with N.errstate(invalid='ignore', divide='ignore'):
+			slopes[1:-1] = N.where(same_sign, (w1 + w2) / (w1 / delta[:-1] +
+				w2 / delta[1:]), 0.)
+		slopes[0] = _pchip_end(h[0], h[1], delta[0], delta[1])
+		slopes[-1] = _pchip_end(h[-1], h[-2], delta[-1], delta[-2])
+
+	return N.moveaxis(slopes, 0, n)
+
+
+def _pchip_end(h0, h1, delta0, delta1):
+	"""
+	Returns the pchip slope at the end of an axis, from a three point 
+	formula, limited to keep the data monotone
+	"""
+	slope = ((2 * h0 + h1) * delta0 - h0 * delta1) / (h0 + h1)
+	slope = N.where(N.sign(slope) != N.sign(delta0), 0., slope)
+	return N.where((N.sign(delta0) != N.sign(delta1)) & (N.abs(slope) > 3 *
+		N.abs(delta0)), 3 * delta0, slope)
+
+
 if __name__ == '__main__':  # pragma: no cover
 
     # run doctest to check the validity of the examples in the doc strings.
@@ -17,16 +17,30 @@ import unit_conversion as U
 
 # #############################################################################
 #
-# version 0.2, 28 Feb 2020
+# version 0.6, 16 Oct 2026
 #
 # Version History:
 # vers     date       Notes
 # 0.1    29 May 2009  Initial release
 # 0.2    28 Feb 2020  Python 3 compatibility
+# 0.3    16 Oct 2026  Cache the parsed prop maps in a .npz file next to the
+#                     csv files, and load it while it is up to date
+# 0.4    16 Oct 2026  cp2ct(), cp2eff(), cp2blade_angle() and 
+#                     blade_angle2cp() accept arrays, and interpolate with
+#                     interpolator.GridInterpolator.  Fix pull_Ct_data_point()
+#                     returning blade angle
+# 0.5    16 Oct 2026  Find prop maps in the directories in PROP_MAP_PATH.
+#                     Keep the maps in memory mapped .npy files, so they 
+#                     are shared between processes, and add get_prop(), a
+#                     registry of the props loaded in each process
+# 0.6    16 Oct 2026  Add prop_surface(), to calculate efficiency, thrust 
+#                     coefficient and blade angle on a grid of TAS, rpm, 
+#                     power and altitude, and load_prop_surface()
 # #############################################################################
 #
 # To Do:  1. Remove hard coded pointers to directories on kwh's computers.
-#            Perhaps create a config file to hold default directories.
+#            Perhaps create a config file to hold default directories.  The
+#            PROP_MAP_PATH environment variable is checked first.
 #
 #         2. Fix 'nan' prop_eff returned at low TAS or low power.
 #
@@ -46,15 +60,40 @@ coefficient, and thrust coefficient, given flight and engine parametres.
 Validated against Excel spreadsheet provided by Les Doud (Hartzell).
 """
 
+# Directories searched for prop map csv files when no base_path is given,
+# before the table of computer names.  Set from the PROP_MAP_PATH 
+# environment variable, with the directories separated by os.pathsep.
+prop_map_path = [path for path in os.environ.get('PROP_MAP_PATH', '').split(os.pathsep) if path]
+
+# The props loaded by get_prop in this process, by prop name and base_path
+_props = {}
+
 class Prop:
-    def __init__(self, base_name, base_path=''):
+    def __init__(self, base_name, base_path='', cache=True):
         """Returns a propeller object
         
         prop = Prop('7666-2RV')
         prop = Prop('MTV*183-59B')
         prop = Prop('MTV*402')
+        prop = Prop('7666-2RV', '/data/Hartzell_prop_maps')
+
+        base_path is the directory with the prop map csv files.  If it is 
+        not specified, the directories in prop_map_path are searched, and 
+        then the directories known for each computer.
+
+        The maps parsed from the csv files are saved in cache files in the
+        same directory, and later objects for the same prop are loaded 
+        from them, as long as the csv files have not changed since.  The 
+        maps are loaded as memory mapped arrays, so all the processes that
+        use the same prop share one copy of the maps in memory.  Set cache 
+        to False to always parse the csv files.
+
+        A Prop is pickled by its name and directory, and unpickled with 
+        get_prop, so passing it to a process pool does not copy the maps.
         """
         self.prop = base_name
+        if base_path == '':
+            base_path = _find_map_dir(base_name)
 
         # create temp lists, to hold the data before it is read into arrays
         temp_data_storage1 = []
@@ -83,15 +122,16 @@ class Prop:
                 elif node_name == 'sage-ubuntu-1404':
                     base_path = '/home/kwh/python/prop_maps/Hartzell_prop_maps/'
                 else:
-                    raise ValueError('Unknown computer')
+                    raise ValueError('Unknown computer.  Give the directory of the prop map files as base_path, or in the PROP_MAP_PATH environment variable.')
 
             # confirm the path to the data files exists
             if os.path.exists(base_path):
                 pass
             else:
                 raise ValueError('The path specified for the prop map files does not exist')
+            self.base_path = base_path
 
-            file_glob = base_path + base_name + '*.csv'
+            file_glob = os.path.join(base_path, base_name + '*.csv')
             file_names = glob.glob(file_glob)
 
             # confirm that at least one data file was found
@@ -102,6 +142,9 @@ class Prop:
             # sorting seems to not be needed on OS X, as glob.glob() returns a sorted list
             # but, on Linux, the list is not sorted
             file_names.sort()
+
+            if cache and self._load_cache(base_path, file_names):
+                return
             
             for file_name in file_names:
                 FILE = open(file_name)  
@@ -330,6 +373,9 @@ class Prop:
                 self.dia = 74
             else:
                 raise ValueError('Invalid prop')
+
+            if cache:
+                self._save_cache(base_path, file_names)
         elif 'MTV' in base_name:
             if base_path == '': 
                 node_name = node()
@@ -350,14 +396,15 @@ class Prop:
                 elif node_name == 'sage-ubuntu-1204':
                     base_path = '/home/kwh/python//prop_maps/'
                 else:
-                    raise ValueError('Unknown computer')
+                    raise ValueError('Unknown computer.  Give the directory of the prop map files as base_path, or in the PROP_MAP_PATH environment variable.')
 
             # confirm the path to the data files exists
             if os.path.exists(base_path):
                 pass
             else:
                 raise ValueError('The path specified for the prop map files does not exist')
-            file_glob = base_path + base_name + '*.csv'
+            self.base_path = base_path
+            file_glob = os.path.join(base_path, base_name + '*.csv')
 #            file_glob = base_path + '*' + base_name + '*.csv'
             
             file_names = glob.glob(file_glob)
@@ -366,6 +413,9 @@ class Prop:
             if len(file_names) < 1:
                 raise ValueError('No prop data files were found.')
 
+            if cache and self._load_cache(base_path, file_names):
+                return
+
             for file_name in file_names:
                 temp_lines = []
                 FILE = open(file_name)  
@@ -424,10 +474,127 @@ class Prop:
                 self.eff_Cp_max = max(self.prop_eff_map[0,:,0])
                 self.eff_J_min = min(self.prop_eff_map[0,0,1:])
                 self.eff_J_max = max(self.prop_eff_map[0,0,1:])
+
+            if cache:
+                self._save_cache(base_path, file_names)
                 
         else:
             print('prop type not known')
 
+    def __reduce__(self):
+        return (get_prop, (self.prop, self.base_path))
+
+    def _cache_name(self, base_path):
+        """
+        Returns the name of the cache file for the prop maps.  Characters 
+        in the prop name that are not safe in a file name, such as the '*'
+        in MT prop names, are replaced by '_'.
+        """
+        return os.path.join(base_path, re.sub(r'[^\w.-]', '_', self.prop) + '.map.npz')
+
+    def _load_cache(self, base_path, file_names):
+        """
+        Loads the prop maps from the cache file, and returns True, if the 
+        cache file exists and was made from the same csv files, with the 
+        same sizes and modification times.  Otherwise returns False.
+        """
+        try:
+            cache = N.load(self._cache_name(base_path))
+        except (IOError, OSError, ValueError):
+            return False
+        try:
+            if cache['_sources'].tolist() != _map_sources(file_names):
+                return False
+            values = {}
+            for key in cache.files:
+                if key not in ('_sources', '_maps'):
+                    values[key] = cache[key].item()
+            for key in cache['_maps'].tolist():
+                values[key] = N.load(self._map_file(base_path, key), mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            return False
+        finally:
+            cache.close()
+
+        self.__dict__.update(values)
+        return True
+
+    def _save_cache(self, base_path, file_names):
+        """
+        Saves the prop maps, their ranges and the prop details in the cache 
+        file, with the names, sizes and modification times of the csv files
+        they were parsed from.
+        """
+        values = dict((key, N.asarray(value)) for key, value in self.__dict__.items() if key not in ('prop', 'base_path') and not key.startswith('_'))
+        maps = [key for key, value in values.items() if value.ndim > 0]
+
+        # write to temporary files first, so a prop constructed at the same
+        # time in another process never sees a partial cache file.  The 
+        # maps are each saved in a .npy file, which can be memory mapped, 
+        # and the .npz file, with the other values and the list of maps, 
+        # is written last.  If the directory can not be written, the maps 
+        # are just not cached.
+        try:
+            for key in maps:
+                map_file = self._map_file(base_path, key)
+                CACHE = open(map_file + '.tmp', 'wb')
+                N.save(CACHE, values.pop(key))
+                CACHE.close()
+                os.replace(map_file + '.tmp', map_file)
+            values['_maps'] = N.array(maps)
+            values['_sources'] = N.array(_map_sources(file_names))
+            cache_file = self._cache_name(base_path)
+            CACHE = open(cache_file + '.tmp', 'wb')
+            N.savez(CACHE, **values)
+            CACHE.close()
+            os.replace(cache_file + '.tmp', cache_file)
+        except (IOError, OSError):
+            pass
+
+    def _map_file(self, base_path, map_name):
+        """
+        Returns the name of the cache file for one of the prop maps
+        """
+        return self._cache_name(base_path)[:-len('.npz')] + '.' + map_name + '.npy'
+
+
+def get_prop(base_name, base_path=''):
+    """
+    Returns the Prop for base_name, which is constructed the first time it 
+    is asked for in each process, and then kept for later calls.  Worker 
+    processes that call get_prop for the same prop share its maps in 
+    memory, through the memory mapped cache files.
+    """
+    key = (base_name, base_path)
+    if key not in _props:
+        _props[key] = Prop(base_name, base_path)
+
+    return _props[key]
+
+def _find_map_dir(base_name):
+    """
+    Returns the first directory in prop_map_path with csv files for the 
+    prop, or '' if there is none
+    """
+    for path in prop_map_path:
+        if glob.glob(os.path.join(path, base_name + '*.csv')):
+            return path
+
+    return ''
+
+
+def _map_sources(file_names):
+    """
+    Returns a list with the full name, size and modification time of each 
+    prop map csv file, to check if a cache file is up to date
+    """
+    sources = []
+    for file_name in sorted(file_names):
+        stat = os.stat(file_name)
+        sources.append('%s\t%d\t%d' % (os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns))
+
+    return sources
+
 
 def ct2thrust(Ct, Rho, rpm, dia, thrust_units = 'lb', density_units = 'lb/ft**3', dia_units = 'in'):
     """
@@ -476,7 +643,7 @@ def tip_mach(tas, rpm, temperature, dia, speed_units = 'kt', temp_units = 'C', d
     speed_of_sound = SA.temp2speed_of_sound(temperature, temp_units = temp_units, speed_units = 'm/s')
     
     rotation_speed = dia * rpm * M.pi/ 60
-    tip_speed = M.sqrt(tas ** 2 + rotation_speed ** 2)
+    tip_speed = (tas ** 2 + rotation_speed ** 2) ** 0.5
     tip_mach = tip_speed / speed_of_sound
         
     return tip_mach
@@ -691,13 +858,13 @@ def pull_Ct_data_point(prop, tip_mach, J, Cp):
     Returns specific Ct data points from prop map array files.
     """
     (tip_mach, J, Cp) = (float(tip_mach), float(J), float(Cp))
-    mach_index = N.searchsorted(prop.blade_angle_map[:,0,0],tip_mach)
-    J_index = N.searchsorted(prop.blade_angle_map[0,0,1:],J) + 1
-    Cp_index = N.searchsorted(prop.blade_angle_map[0,1:,0],Cp) + 1
+    mach_index = N.searchsorted(prop.prop_CT_map[:,0,0],tip_mach)
+    J_index = N.searchsorted(prop.prop_CT_map[0,0,1:],J) + 1
+    Cp_index = N.searchsorted(prop.prop_CT_map[0,1:,0],Cp) + 1
     
-    blade_angle = prop.blade_angle_map[mach_index, Cp_index, J_index]
+    Ct = prop.prop_CT_map[mach_index, Cp_index, J_index]
     
-    return blade_angle
+    return Ct
 
 
 def pull_blade_angle_data_point(prop, tip_mach, J, Cp):
@@ -733,62 +900,13 @@ def cp2ct(prop, Cp, J, tip_mach):
     """
     Returns thrust coefficient, given power coefficient (Cp), advance ratio
     (J) and the mach number of the blade tip.
-    """
-    mach_low = max(prop.Ct_mach_min, prop.prop_CT_map[max(min(N.searchsorted(prop.prop_CT_map[:,0,0], tip_mach) - 1, prop.z_size - 1),0),0,0])
-    if mach_low == prop.Ct_mach_max:
-        mach_low = prop.prop_CT_map[-2,0,0]
-    mach_high = min(prop.Ct_mach_max, prop.prop_CT_map[min(N.searchsorted(prop.prop_CT_map[:,0,0], tip_mach), prop.z_size - 1),0,0])
-    if mach_high == prop.Ct_mach_min:
-        mach_high = prop.prop_CT_map[1,0,0]
-
-    J_low = max(prop.Ct_J_min, prop.prop_CT_map[0,0,max(min(N.searchsorted(prop.prop_CT_map[0,0,1:], J), prop.x_size - 2),1)])
-    if J_low == prop.Ct_J_max:
-        J_low = prop.prop_CT_map[0,0,-2]
-    J_high = min(prop.Ct_J_max, prop.prop_CT_map[0,0,min(N.searchsorted(prop.prop_CT_map[0,0,1:], J), prop.x_size - 2) + 1])
-    if J_high == prop.Ct_J_min:
-        J_high = prop.prop_CT_map[0,0,2]
-
-    Cp_low = max(prop.Ct_Cp_min, prop.prop_CT_map[0,max(min(N.searchsorted(prop.prop_CT_map[0,1:,0], Cp), prop.y_size - 2),1),0])
-    if Cp_low == prop.Ct_Cp_max:
-        Cp_low = prop.prop_CT_map[0,-2,0]
-    Cp_high = min(prop.Ct_Cp_max, prop.prop_CT_map[0,min(N.searchsorted(prop.prop_CT_map[0,1:,0], Cp), prop.y_size - 2) + 1,0])
-    if Cp_high == prop.Ct_Cp_min:
-        Cp_high = prop.prop_CT_map[0,2,0]
-
-    # get Ct for mach_low, J_low and Cp_low
-    Ct_low_low_low = pull_Ct_data_point(prop, mach_low, J_low, Cp_low)
-
-    # get Ct for mach_low, J_high and Cp_low
-    Ct_low_high_low = pull_Ct_data_point(prop, mach_low, J_high, Cp_low)
-
-    # get Ct for mach_low, J_low and Cp_high
-    Ct_low_low_high = pull_Ct_data_point(prop, mach_low, J_low, Cp_high)
 
-    # get Ct for mach_low, J_high and Cp_high
-    Ct_low_high_high = pull_Ct_data_point(prop, mach_low, J_high, Cp_high)
-
-    # get Ct for mach_high, J_low and Cp_low
-    Ct_high_low_low = pull_Ct_data_point(prop, mach_high, J_low, Cp_low)
-
-    # get Ct for mach_high, J_high and Cp_low
-    Ct_high_high_low = pull_Ct_data_point(prop, mach_high, J_high, Cp_low)
-
-    # get Ct for mach_high, J_low and Cp_high
-    Ct_high_low_high = pull_Ct_data_point(prop, mach_high, J_low, Cp_high)
-
-    # get Ct for mach_high, J_high and Cp_high
-    Ct_high_high_high = pull_Ct_data_point(prop, mach_high, J_high, Cp_high)
-
-    x = [J_low, J_high]
-    y = [Cp_low, Cp_high]
-    z = [mach_low, mach_high]
-    
-    values = [[[Ct_low_low_low, Ct_low_high_low], [Ct_low_low_high, Ct_low_high_high]],
-              [[Ct_high_low_low, Ct_high_high_low], [Ct_high_low_high, Ct_high_high_high]]]
-
-    Ct = I.interpolate3(x, y, z, values, J, Cp, tip_mach)
-
-    return Ct
+    Cp, J and tip_mach may be single values, or arrays, which are broadcast
+    against each other, and then an array is returned.  The thrust 
+    coefficient is interpolated linearly in the map, and extrapolated 
+    linearly outside it.
+    """
+    return _map_grid(prop, 'prop_CT_map')(tip_mach, Cp, J)
 
 def cp2ct_alt(prop, Cp, bhp, rpm, tas, altitude, temp = 'std', power_units = 'hp', alt_units = 'ft', temp_units = 'C', speed_units = 'kt', dia_units = 'in'):
     """
@@ -805,153 +923,75 @@ def cp2eff(prop, Cp, J, tip_mach):
     """
     Returns prop efficiency, given power coefficient (Cp), advance ratio
     (J) and the mach number of the blade tip.
-    """
-    mach_low = max(prop.eff_mach_min, prop.prop_eff_map[max(min(N.searchsorted(prop.prop_eff_map[:,0,0], tip_mach) - 1, prop.z_size - 1),0),0,0])
-    if mach_low == prop.eff_mach_max:
-        mach_low = prop.prop_eff_map[-2,0,0]
-    mach_high = min(prop.eff_mach_max, prop.prop_eff_map[min(N.searchsorted(prop.prop_eff_map[:,0,0], tip_mach), prop.z_size - 1),0,0])
-    if mach_high == prop.eff_mach_min:
-        mach_high = prop.prop_eff_map[1,0,0]
-
-    J_low = max(prop.eff_J_min, prop.prop_eff_map[0,0,max(min(N.searchsorted(prop.prop_eff_map[0,0,1:], J), prop.x_size - 2),1)])
-    if J_low == prop.eff_J_max:
-        J_low = prop.prop_eff_map[0,0,-2]
-    J_high = min(prop.eff_J_max, prop.prop_eff_map[0,0,min(N.searchsorted(prop.prop_eff_map[0,0,1:], J), prop.x_size - 2) + 1])
-    if J_high == prop.eff_J_min:
-        J_high = prop.prop_eff_map[0,0,2]
-    if J_high == J_low:
-        J_high = J_low + 0.1
-
-    Cp_low = max(prop.eff_Cp_min, prop.prop_eff_map[0,max(min(N.searchsorted(prop.prop_eff_map[0,1:,0], Cp), prop.y_size - 1),1),0])
-    if Cp_low == prop.eff_Cp_max:
-        # print 'in CP-low'
-        Cp_low = prop.prop_eff_map[0,-2,0]
-    Cp_high = min(prop.eff_Cp_max, prop.prop_eff_map[0,min(N.searchsorted(prop.prop_eff_map[0,1:,0], Cp), prop.y_size - 1) + 1,0])
-    if Cp_high == prop.eff_Cp_min:
-        # print 'in CP-high'
-        Cp_high = prop.prop_eff_map[0,2,0]
-    if Cp_high == Cp_low:
-        Cp_high = Cp_low + 0.01
-
-    # get eff for mach_low, J_low and Cp_low
-    eff_low_low_low = pull_eff_data_point(prop, mach_low, J_low, Cp_low)
-    
-    # get eff for mach_low, J_high and Cp_low
-    eff_low_high_low = pull_eff_data_point(prop, mach_low, J_high, Cp_low)
-
-    # get eff for mach_low, J_low and Cp_high
-    eff_low_low_high = pull_eff_data_point(prop, mach_low, J_low, Cp_high)
-    
-    # get eff for mach_low, J_high and Cp_high
-    eff_low_high_high = pull_eff_data_point(prop, mach_low, J_high, Cp_high)
-
-    # get eff for mach_high, J_low and Cp_low
-    eff_high_low_low = pull_eff_data_point(prop, mach_high, J_low, Cp_low)
-    
-    # get eff for mach_high, J_high and Cp_low
-    eff_high_high_low = pull_eff_data_point(prop, mach_high, J_high, Cp_low)
-
-    # get eff for mach_high, J_low and Cp_high
-    eff_high_low_high = pull_eff_data_point(prop, mach_high, J_low, Cp_high)
-    
-    # get eff for mach_high, J_high and Cp_high
-    eff_high_high_high = pull_eff_data_point(prop, mach_high, J_high, Cp_high)
-
-    x = [J_low, J_high]
-    y = [Cp_low, Cp_high]
-    z = [mach_low, mach_high]
-    
-    values = [[[eff_low_low_low, eff_low_high_low], [eff_low_low_high, eff_low_high_high]],
-              [[eff_high_low_low, eff_high_high_low], [eff_high_low_high, eff_high_high_high]]]
-    
-    # print '[J_low, J_high]:', x
-    # print '[Cp_low, Cp_high]:', y
-    # print '[mach_low, mach_high:]', z
-    # print '[[[eff_low_low_low, eff_low_high_low], [eff_low_low_high, eff_low_high_high]], [[eff_high_low_low, eff_high_high_low], [eff_high_low_high, eff_high_high_high]]]:', values
-    # print 'J:', J
-    # print 'Cp:', Cp
-    # print 'tip mach:', tip_mach
-    
-    eff = I.interpolate3(x, y, z, values, J, Cp, tip_mach)
 
-    return eff
+    Cp, J and tip_mach may be single values or arrays, as for cp2ct.
+    """
+    return _map_grid(prop, 'prop_eff_map')(tip_mach, Cp, J)
 
 def cp2blade_angle(prop, Cp, J, tip_mach):
     """
     Returns blade angle, given power coefficient (Cp), advance ratio
     (J) and the mach number of the blade tip.
-    """
-    mach_low = max(prop.blade_angle_mach_min, prop.blade_angle_map[max(min(N.searchsorted(prop.blade_angle_map[:,0,0], tip_mach) - 1, prop.z_size - 1),0),0,0])
-    if mach_low == prop.blade_angle_mach_max:
-        mach_low = prop.blade_angle_map[-2,0,0]
-    mach_high = min(prop.blade_angle_mach_max, prop.blade_angle_map[min(N.searchsorted(prop.blade_angle_map[:,0,0], tip_mach), prop.z_size - 1),0,0])
-    if mach_high == prop.blade_angle_mach_min:
-        mach_high = prop.blade_angle_map[1,0,0]
 
-    J_low = max(prop.blade_angle_J_min, prop.blade_angle_map[0,0,max(min(N.searchsorted(prop.blade_angle_map[0,0,1:], J), prop.x_size - 2),1)])
-    if J_low == prop.blade_angle_J_max:
-        J_low = prop.blade_angle_map[0,0,-2]
-    J_high = min(prop.blade_angle_J_max, prop.blade_angle_map[0,0,min(N.searchsorted(prop.blade_angle_map[0,0,1:], J), prop.x_size - 2) + 1])
-    if J_high == prop.blade_angle_J_min:
-        J_high = prop.blade_angle_map[0,0,2]
-
-    Cp_low = max(prop.blade_angle_Cp_min, prop.blade_angle_map[0,max(min(N.searchsorted(prop.blade_angle_map[0,1:,0], Cp), prop.y_size - 1),1),0])
-    if Cp_low == prop.blade_angle_Cp_max:
-        # print 'in CP-low'
-        Cp_low = prop.blade_angle_map[0,-2,0]
-    Cp_high = min(prop.blade_angle_Cp_max, prop.blade_angle_map[0,min(N.searchsorted(prop.blade_angle_map[0,1:,0], Cp), prop.y_size - 1) + 1,0])
-    if Cp_high == prop.blade_angle_Cp_min:
-        # print 'in CP-high'
-        Cp_high = prop.blade_angle_map[0,2,0]
-
-    # get eff for mach_low, J_low and Cp_low
-    blade_angle_low_low_low = pull_blade_angle_data_point(prop, mach_low, J_low, Cp_low)
-    
-    # get eff for mach_low, J_high and Cp_low
-    blade_angle_low_high_low = pull_blade_angle_data_point(prop, mach_low, J_high, Cp_low)
-
-    # get eff for mach_low, J_low and Cp_high
-    blade_angle_low_low_high = pull_blade_angle_data_point(prop, mach_low, J_low, Cp_high)
-    
-    # get eff for mach_low, J_high and Cp_high
-    blade_angle_low_high_high = pull_blade_angle_data_point(prop, mach_low, J_high, Cp_high)
-
-    # get eff for mach_high, J_low and Cp_low
-    blade_angle_high_low_low = pull_blade_angle_data_point(prop, mach_high, J_low, Cp_low)
-    
-    # get eff for mach_high, J_high and Cp_low
-    blade_angle_high_high_low = pull_blade_angle_data_point(prop, mach_high, J_high, Cp_low)
-
-    # get eff for mach_high, J_low and Cp_high
-    blade_angle_high_low_high = pull_blade_angle_data_point(prop, mach_high, J_low, Cp_high)
-    
-    # get eff for mach_high, J_high and Cp_high
-    blade_angle_high_high_high = pull_blade_angle_data_point(prop, mach_high, J_high, Cp_high)
-
-    x = [J_low, J_high]
-    y = [Cp_low, Cp_high]
-    z = [mach_low, mach_high]
-    
-    values = [[[blade_angle_low_low_low, blade_angle_low_high_low], [blade_angle_low_low_high, blade_angle_low_high_high]],
-              [[blade_angle_high_low_low, blade_angle_high_high_low], [blade_angle_high_low_high, blade_angle_high_high_high]]]
-    
-    blade_angle = I.interpolate3(x, y, z, values, J, Cp, tip_mach)
-
-    return blade_angle
+    Cp, J and tip_mach may be single values or arrays, as for cp2ct.
+    """
+    return _map_grid(prop, 'blade_angle_map')(tip_mach, Cp, J)
 
 def blade_angle2cp(prop, blade_angle, J, tip_mach):
     """Returns propeller power coefficient (Cp), given blade angle, advance ratio (J) and the mach number of the blade tip.
+
+    blade_angle, J and tip_mach may be single values or arrays, as for 
+    cp2ct.  The blade angle must increase with Cp.
     """
-    temp_cps = []
-    temp_blade_angles = []
-    
-    for cp in N.arange(prop.blade_angle_Cp_min, prop.blade_angle_Cp_max, .005):
-        temp_cps.append(cp)
-        temp_blade_angles.append(cp2blade_angle(prop, cp, J, tip_mach))
-    
-    i = N.searchsorted(temp_blade_angles, blade_angle)
-    
-    return I.interpolate(temp_blade_angles[i:i+2], temp_cps[i:i+2], blade_angle)
+    points = N.broadcast_arrays(*[N.asarray(value, dtype=float) for value in (blade_angle, J, tip_mach)])
+    shape = points[0].shape
+    (blade_angle, J, tip_mach) = [point.ravel() for point in points]
+    Cps = prop.blade_angle_map[0,1:,0]
+    angle_map = prop.blade_angle_map[:,1:,1:]
+    (mach_index, mach_fraction) = _bracket(prop.blade_angle_map[:,0,0], tip_mach)
+    (J_index, J_fraction) = _bracket(prop.blade_angle_map[0,0,1:], J)
+    Cp = N.empty(len(blade_angle))
+
+    # for a given J and tip mach, the blade angle is linear in Cp between 
+    # the Cp values of the map, so the Cp is found exactly from the blade 
+    # angles at the Cp values of the map, which are blended from the four 
+    # map rows around the J and tip mach.  Points are done in blocks, to 
+    # limit the memory used.
+    for start in range(0, len(blade_angle), 65536):
+        block = slice(start, start + 65536)
+        (m, t_m) = (mach_index[block], mach_fraction[block, None])
+        (j, t_j) = (J_index[block], J_fraction[block, None])
+        angles = (1 - t_m) * ((1 - t_j) * angle_map[m, :, j] + t_j * angle_map[m, :, j + 1]) + t_m * ((1 - t_j) * angle_map[m + 1, :, j] + t_j * angle_map[m + 1, :, j + 1])
+        i = N.clip((angles < blade_angle[block, None]).sum(axis=1), 1, len(Cps) - 1)
+        rows = N.arange(len(i))
+        angle_low = angles[rows, i - 1]
+        angle_high = angles[rows, i]
+        Cp[block] = Cps[i - 1] + (blade_angle[block] - angle_low) / (angle_high - angle_low) * (Cps[i] - Cps[i - 1])
+
+    if shape == ():
+        return float(Cp[0])
+    return Cp.reshape(shape)
+
+def _bracket(axis, values):
+    """
+    Returns the index of the interval of axis for each of values, and the 
+    fractional position in the interval, which is less than 0 or more than
+    1 for values outside the axis
+    """
+    i = N.clip(N.searchsorted(axis, values, 'right') - 1, 0, len(axis) - 2)
+    return i, (values - axis[i]) / (axis[i + 1] - axis[i])
+
+def _map_grid(prop, map_name):
+    """
+    Returns the interpolator for one of the prop maps, with axes of tip 
+    mach, Cp and J.  It is set up on first use, and kept with the prop.
+    """
+    grids = prop.__dict__.setdefault('_grids', {})
+    if map_name not in grids:
+        prop_map = getattr(prop, map_name)
+        grids[map_name] = I.GridInterpolator([prop_map[:,0,0], prop_map[0,1:,0], prop_map[0,0,1:]], prop_map[:,1:,1:], bounds='extrapolate')
+
+    return grids[map_name]
         
 def blade_angle2bhp(prop, blade_angle, rpm, tas, altitude, temp = 'std', power_units = 'hp', alt_units = 'ft', temp_units = 'C', speed_units = 'kt', dia_units = 'in'):
     """
@@ -973,3 +1013,111 @@ def blade_angle2bhp(prop, blade_angle, rpm, tas, altitude, temp = 'std', power_u
     
     return bhp
 
+
+class PropSurface:
+    """
+    Prop efficiency, thrust coefficient and blade angle on a grid of TAS,
+    rpm, engine power and pressure altitude, at standard temperature, made
+    by prop_surface or load_prop_surface.
+
+    The values for other points are interpolated in the grid, by calling 
+    eff, ct or blade_angle with the TAS, rpm, power and altitude, which may
+    be single values or arrays, in the units the surface was made with.  
+    This is much faster than calculating the prop data for each point, for
+    performance sweeps that evaluate the prop many times.
+    """
+
+    def __init__(self, prop, axes, values, units, method='linear', bounds='nan'):
+        self.prop = prop
+        self.axes = [N.asarray(axis, dtype=float) for axis in axes]
+        self.values = values
+        (self.speed_units, self.power_units, self.alt_units) = units
+        self.method = method
+        self.bounds = bounds
+        self._grids = dict((name, I.GridInterpolator(self.axes, value, bounds=bounds, method=method)) for name, value in values.items())
+
+    def eff(self, tas, rpm, bhp, altitude):
+        """
+        Returns prop efficiency
+        """
+        return self._grids['eff'](tas, rpm, bhp, altitude)
+
+    def ct(self, tas, rpm, bhp, altitude):
+        """
+        Returns thrust coefficient
+        """
+        return self._grids['Ct'](tas, rpm, bhp, altitude)
+
+    def blade_angle(self, tas, rpm, bhp, altitude):
+        """
+        Returns blade angle, or nan if the prop has no blade angle map
+        """
+        return self._grids['blade_angle'](tas, rpm, bhp, altitude)
+
+    def save(self, file_name):
+        """
+        Saves the surface in a .npz file, to be loaded by load_prop_surface
+        """
+        FILE = open(file_name, 'wb')
+        N.savez(FILE, prop=self.prop, tas=self.axes[0], rpm=self.axes[1], bhp=self.axes[2], altitude=self.axes[3], units=[self.speed_units, self.power_units, self.alt_units], method=self.method, bounds=self.bounds, **self.values)
+        FILE.close()
+
+
+def prop_surface(prop, tas, rpm, bhp, altitude, speed_units = 'kt', power_units = 'hp', alt_units = 'ft', method = 'linear', bounds = 'nan'):
+    """
+    Returns a PropSurface, with the prop efficiency, thrust coefficient and
+    blade angle calculated at every combination of the values in tas, rpm,
+    bhp and altitude, at standard temperature.  All the points are 
+    calculated in one pass, with the array versions of the prop functions.
+
+    prop = a Prop
+    tas, rpm, bhp, altitude = increasing sequences of values for the grid
+    method = the interpolation method in the surface, as for interpolator.GridInterpolator
+    bounds = what the surface returns outside the grid, as for interpolator.GridInterpolator.  The default is nan.
+
+    Props with no thrust coefficient map have the thrust coefficient found
+    from the efficiency, as in cp2ct_alt, and props with no blade angle map
+    have nan for the blade angle.
+
+    Example:
+
+    surface = prop_surface(prop, range(60, 221, 10), range(2000, 2701, 100), range(60, 201, 10), range(0, 16001, 2000))
+    surface.eff(150, 2500, 180, 8000)
+    """
+    axes = [N.asarray(axis, dtype=float) for axis in (tas, rpm, bhp, altitude)]
+    (tas, rpm, bhp, altitude) = N.meshgrid(*axes, indexing='ij')
+
+    press_ratio = SA.alt2press_ratio(altitude, alt_units = alt_units)
+    temp = SA.alt2temp(altitude, temp_units = 'C', alt_units = alt_units)
+    temp_ratio = U.temp_conv(temp, from_units = 'C', to_units = 'K') / 288.15
+    density = press_ratio / temp_ratio * SA.Rho0
+    Cp = bhp2Cp(bhp, rpm, density, prop.dia, power_units = power_units, density_units = 'kg/m**3')
+    J = advance_ratio(tas, rpm, prop.dia, speed_units = speed_units)
+    blade_tip_mach = tip_mach(tas, rpm, temp, prop.dia, speed_units = speed_units)
+
+    values = {'eff': cp2eff(prop, Cp, J, blade_tip_mach)}
+    if hasattr(prop, 'prop_CT_map'):
+        values['Ct'] = cp2ct(prop, Cp, J, blade_tip_mach)
+    else:
+        with N.errstate(divide='ignore', invalid='ignore'):
+            values['Ct'] = values['eff'] * Cp / J
+    if hasattr(prop, 'blade_angle_map'):
+        values['blade_angle'] = cp2blade_angle(prop, Cp, J, blade_tip_mach)
+    else:
+        values['blade_angle'] = N.full(Cp.shape, N.nan)
+
+    return PropSurface(prop.prop, axes, values, (speed_units, power_units, alt_units), method = method, bounds = bounds)
+
+def load_prop_surface(file_name):
+    """
+    Returns a PropSurface saved by PropSurface.save
+    """
+    FILE = N.load(file_name)
+    try:
+        axes = [FILE[name] for name in ('tas', 'rpm', 'bhp', 'altitude')]
+        values = dict((name, FILE[name]) for name in ('eff', 'Ct', 'blade_angle'))
+        surface = PropSurface(FILE['prop'].item(), axes, values, FILE['units'].tolist(), method = FILE['method'].item(), bounds = FILE['bounds'].item())
+    finally:
+        FILE.close()
+
+    return surface
@@ -88,7 +88,7 @@ def gps2stall(GS, TK, Hp, T, temp_units='C', alt_units=default_alt_units, speed_
     Examples:
     
     >>> gps2stall([44, 104, 157, 131], [258, 29, 91, 150], 7000, 14, temp_units='F', GPS_units='km/h')
-    (50.322235245211225, 0.6583323098888626)
+    (50.32223524521123, 0.6583323098888626)
 
     """
 
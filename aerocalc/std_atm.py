@@ -27,7 +27,7 @@
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # #############################################################################
 #
-# version 0.30, 26 Feb 2020
+# version 0.37, 16 Oct 2026
 #
 # Version History:
 # vers     date       Notes
@@ -55,6 +55,28 @@
 # 0.20   18 Apr 2010  Added dynamic and kinematic viscosity.
 #                 
 # 0.30   26 Feb 2020  Python 3.7 compatibility tweaks
+#
+# 0.31   16 Oct 2026  Altitude to temperature, pressure and density functions
+#                     accept sequences or numpy arrays of altitudes.
+#
+# 0.32   16 Oct 2026  Pressure and density to altitude functions accept 
+#                     sequences or numpy arrays, with an option to return nan
+#                     for values above 84.852 km instead of raising an error.
+#
+# 0.33   16 Oct 2026  Added optional table mode for alt2temp, alt2press_ratio
+#                     and alt2density_ratio.
+# 0.34   16 Oct 2026  Rely on unit_conversion to accept arrays without 
+#                     modifying them, rather than copying them first.
+#
+# 0.35   16 Oct 2026  density_alt, sat_press, dry_press and pressure_alt 
+#                     accept sequences or numpy arrays, with nan for a dew 
+#                     point or relative humidity that was not provided.
+#
+# 0.36   16 Oct 2026  density_alt2temp calculates the temperature directly 
+#                     for dry air or a known dew point, and accepts arrays.
+#                     density_alt_table calculates all its rows at once.
+#
+# 0.37   16 Oct 2026  temp2speed_of_sound accepts sequences or numpy arrays.
 # ##############20###############################################################
 #
 # To Do: 1. Done.
@@ -128,6 +150,22 @@ There is a good discussion of the 1976 International Standard Atmosphere, and
 the various formulae at:
 http://www.atmosculator.com/The%20Standard%20Atmosphere.html?
 
+If numpy is installed, the functions that take an altitude (alt2temp, 
+alt2temp_ratio, alt2press_ratio, alt2press, alt2density_ratio and 
+alt2density) also accept a sequence or numpy array of altitudes, and return 
+a numpy array of the same shape.  All the layers of the atmosphere are 
+evaluated in one pass, which is much faster than calling the function once 
+per altitude when reducing large flight test data files.  The inverse 
+functions (press2alt, press_ratio2alt, density2alt and density_ratio2alt) 
+accept arrays in the same way.
+
+For applications that need very large numbers of standard atmosphere values
+over a limited altitude range, such as Monte Carlo performance runs, 
+enable_table() switches alt2temp, alt2press_ratio and alt2density_ratio (and 
+the functions built on them) to a precomputed table.  table_info() returns 
+the table resolution and its maximum error versus the exact layer formulas,
+and disable_table() returns to the exact formulas.
+
 """
 
 import constants
@@ -151,6 +189,11 @@ except ImportError:
     default_dynamic_viscosity_units = 'Pa s'
     default_kinematic_viscosity_units = 'm**2/s'
 
+try:
+    import numpy as N
+except ImportError:
+    N = None
+
 try:
     L.setlocale(L.LC_ALL, 'en_US')
 except:
@@ -158,6 +201,7 @@ except:
 
 g = constants.g  # Acceleration of gravity at 45.542 deg latitude, m/s**s
 Rd = constants.Rd  # Gas constant for dry air, J/kg K
+Rv = 461.495  # Gas constant for water vapour, J/kg K
 
 # conditions starting at sea level, in a region with temperature gradient
 
@@ -212,6 +256,398 @@ L71 = -2.  # temperature lapse rate, starting at 71,000 m, deg K/km
 P71 = PR71 * P0
 Rho71 = (Rho0 * PR71) * (T0 / T71)
 
+# altitude at the top of the highest layer, km
+
+H_MAX = 84.852
+
+# base altitude (km), base pressure (pa), base temperature (deg K) and 
+# temperature lapse rate (deg K/km) of each layer, used by the array 
+# functions.  A lapse rate of zero marks an isothermal layer.
+
+_LAYER_H = (0, 11, 20, 32, 47, 51, 71)
+_LAYER_P = (P0, P11, P20, P32, P47, P51, P71)
+_LAYER_RHO = (Rho0, Rho11, Rho20, Rho32, Rho47, Rho51, Rho71)
+_LAYER_T = (T0, T11, T20, T32, T47, T51, T71)
+_LAYER_L = (L0, 0, L20, L32, 0, L51, L71)
+
+# #############################################################################
+#
+# Array support
+#
+# #############################################################################
+
+
+def _is_array(x):
+    """
+    Return True if x is a sequence or numpy array of values, rather than a 
+    single value.
+    """
+
+    return N is not None and isinstance(x, (N.ndarray, list, tuple))
+
+
+def _as_array(x):
+    """
+    Return x as a float array if it is a sequence or numpy array.  Single 
+    values are returned unchanged.
+    """
+
+    if _is_array(x):
+        return N.asarray(x, dtype=float)
+    return x
+
+
+def _given(x):
+    """
+    Return True if an optional value, such as a dew point, was provided, 
+    i.e. it is not 'FALSE' or nan.  For a sequence or numpy array, return 
+    an array that is True where the values were provided.
+    """
+
+    if _is_array(x):
+        return ~N.isnan(N.asarray(x, dtype=float))
+    if isinstance(x, str):
+        return x != 'FALSE'
+    return not M.isnan(x)
+
+
+def _optional(x):
+    """
+    Return an optional value as a float or float array, with nan if it was 
+    not provided.
+    """
+
+    if isinstance(x, str) and x == 'FALSE':
+        return N.nan
+    return N.asarray(x, dtype=float)
+
+
+def _alt_layer(H):
+    """
+    Return the index of the layer that contains each altitude in an array of 
+    altitudes in km.  An altitude exactly on a layer boundary belongs to the 
+    lower layer, matching the scalar functions.
+    """
+
+    if N.any(H > H_MAX):
+        raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+
+    return N.searchsorted(_LAYER_H[1:], H, side='left')
+
+
+def _alt2temp_array(H):
+    """
+    Return the standard temperature in deg K for an array of altitudes in km.
+    """
+
+    layer = _alt_layer(H)
+    Hb = N.take(_LAYER_H, layer)
+    Tb = N.take(_LAYER_T, layer)
+    Lb = N.take(_LAYER_L, layer)
+
+    return Tb + (H - Hb) * Lb
+
+
+def _alt2press_ratio_array(H):
+    """
+    Return the pressure ratio for an array of altitudes in km.
+    """
+
+    layer = _alt_layer(H)
+    Hb = N.take(_LAYER_H, layer)
+    Pb = N.take(_LAYER_P, layer)
+    Tb = N.take(_LAYER_T, layer)
+    Lb = N.take(_LAYER_L, layer)
+
+    PR = N.empty(H.shape)
+    iso = Lb == 0
+    grad = ~iso
+    PR[grad] = _alt2press_ratio_gradient(H[grad], Hb[grad], Pb[grad],
+                                         Tb[grad], Lb[grad])
+    PR[iso] = (Pb[iso] / P0) * N.exp((-1 * (H[iso] - Hb[iso]))
+                                     * ((1000 * g) / (Rd * Tb[iso])))
+
+    return PR
+
+
+def _value2alt_array(X, X_layers, gradient):
+    """
+    Return the altitude in km for an array of pressures or densities.
+
+    X_layers holds the pressure or density at the base of each layer, and 
+    gradient is the function that gives the altitude in a layer with a 
+    temperature gradient.  A value exactly equal to a layer boundary value 
+    belongs to the higher layer, matching the scalar functions.
+    """
+
+    # the boundary values decrease with altitude, so search on the negated 
+    # values, which increase
+
+    layer = N.searchsorted(N.negative(X_layers[1:]), -X, side='right')
+    Xb = N.take(X_layers, layer)
+    Hb = N.take(_LAYER_H, layer)
+    Tb = N.take(_LAYER_T, layer)
+    Lb = N.take(_LAYER_L, layer)
+
+    H = N.empty(X.shape)
+    iso = Lb == 0
+    grad = ~iso
+    H[grad] = gradient(X[grad], Xb[grad], Hb[grad], Tb[grad], Lb[grad])
+
+    # the pressure ratio and density ratio are equal in an isothermal layer
+
+    H[iso] = Hb[iso] - ((Rd * Tb[iso]) * N.log(X[iso] / Xb[iso])) / (1000 * g)
+
+    return H
+
+
+def _check_alt_limit(H, out_of_range):
+    """
+    Apply the out_of_range option to altitudes, in km, that are above the 
+    top of the model.  out_of_range may be 'raise', to raise a ValueError, or
+    'nan', to replace the out of range altitudes by nan.
+    """
+
+    if out_of_range not in ('raise', 'nan'):
+        raise ValueError('out_of_range must be "raise" or "nan".')
+
+    if _is_array(H):
+        above = H > H_MAX
+        if N.any(above):
+            if out_of_range == 'raise':
+                raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+            H[above] = N.nan
+    elif H > H_MAX:
+        if out_of_range == 'raise':
+            raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+        H = float('nan')
+
+    return H
+
+# #############################################################################
+#
+# Table mode
+#
+# #############################################################################
+
+# The table used by alt2temp and alt2press_ratio when table mode is enabled,
+# or None to use the exact layer formulas.  See enable_table().
+
+_table = None
+
+
+class _ISATable:
+    """
+    Standard temperature and pressure ratio tabulated on a uniform grid of 
+    altitudes in km.
+
+    The grid spacing is a whole fraction of a km, so the layer boundaries 
+    fall on grid points.  The temperature is interpolated linearly, which is
+    exact within each layer.  The pressure ratio is interpolated with a cubic
+    Hermite polynomial through the value and the exact slope at each grid 
+    point.  The polynomial coefficients for each interval are computed once, 
+    so a lookup is an index calculation and a polynomial evaluation.
+    """
+
+    def __init__(self, H_low, H_high, steps_per_km):
+        self.steps_per_km = steps_per_km
+        self.step = 1. / steps_per_km
+        self.H_low = M.floor(H_low * steps_per_km) / steps_per_km
+        self.intervals = int(M.ceil((H_high - self.H_low) * steps_per_km))
+        self.H_high = self.H_low + self.intervals * self.step
+        if self.H_high > H_MAX:
+            raise ValueError('The table must end at or below 84.852 km.')
+
+        H = [self.H_low + i * self.step for i in range(self.intervals + 1)]
+        T = [_alt2temp_km(alt) for alt in H]
+        PR = [_alt2press_ratio_km(alt) for alt in H]
+
+        # slope of the pressure ratio per grid step, from the hydrostatic 
+        # equation
+
+        slope = [-pr * ((1000 * g) / (Rd * temp)) * self.step for pr, temp
+                 in zip(PR, T)]
+
+        self.T_coeffs = []
+        self.PR_coeffs = []
+        for i in range(self.intervals):
+            self.T_coeffs.append((T[i], T[i + 1] - T[i], 0., 0.))
+            self.PR_coeffs.append((PR[i], slope[i],
+                                   3 * (PR[i + 1] - PR[i]) - 2 * slope[i]
+                                   - slope[i + 1],
+                                   2 * (PR[i] - PR[i + 1]) + slope[i]
+                                   + slope[i + 1]))
+
+        if N is not None:
+            self.T_array = N.array(self.T_coeffs)
+            self.PR_array = N.array(self.PR_coeffs)
+
+        self.max_error = self._max_error()
+
+    def temp(self, H):
+        """Return the temperature in deg K for altitudes in km."""
+
+        if _is_array(H):
+            return self._lookup_array(H, self.T_array, _alt2temp_km)
+        if self.H_low <= H <= self.H_high:
+            return self._lookup(H, self.T_coeffs)
+
+        # altitudes outside the table use the exact formulas
+
+        return _alt2temp_km(H)
+
+    def press_ratio(self, H):
+        """Return the pressure ratio for altitudes in km."""
+
+        if _is_array(H):
+            return self._lookup_array(H, self.PR_array, _alt2press_ratio_km)
+        if self.H_low <= H <= self.H_high:
+            return self._lookup(H, self.PR_coeffs)
+        return _alt2press_ratio_km(H)
+
+    def _lookup(self, H, coeffs):
+        u = (H - self.H_low) * self.steps_per_km
+        i = min(int(u), self.intervals - 1)
+        t = u - i
+        (c0, c1, c2, c3) = coeffs[i]
+
+        return c0 + t * (c1 + t * (c2 + t * c3))
+
+    def _lookup_array(self, H, coeffs, exact):
+        inside = (H >= self.H_low) & (H <= self.H_high)
+        u = (H[inside] - self.H_low) * self.steps_per_km
+        i = N.minimum(u.astype(int), self.intervals - 1)
+        t = u - i
+        c = coeffs[i]
+
+        value = N.empty(H.shape)
+        value[inside] = c[:, 0] + t * (c[:, 1] + t * (c[:, 2] + t * c[:, 3]))
+        if not N.all(inside):
+            value[~inside] = exact(H[~inside])
+
+        return value
+
+    def _max_error(self):
+        """
+        Return the maximum relative error of the temperature, pressure ratio
+        and density ratio versus the layer formulas, sampled at the quarter
+        points of each interval.  The interpolation error peaks close to, 
+        but not exactly at, the middle of an interval, so the sampled 
+        maximum is padded by 1% to give a bound.
+        """
+
+        H = [self.H_low + (i + n / 4.) * self.step for i in
+             range(self.intervals) for n in (1, 2, 3)]
+        if N is not None:
+            H = N.array(H)
+            T = _alt2temp_km(H)
+            PR = _alt2press_ratio_km(H)
+            T_table = self._lookup_array(H, self.T_array, None)
+            PR_table = self._lookup_array(H, self.PR_array, None)
+            errors = {'temp': N.abs((T_table - T) / T).max(),
+                      'press_ratio': N.abs((PR_table - PR) / PR).max(),
+                      'density_ratio': N.abs((PR_table / T_table - PR / T)
+                                             / (PR / T)).max()}
+            return dict((key, 1.01 * float(value)) for (key, value) in
+                        errors.items())
+
+        errors = {'temp': 0., 'press_ratio': 0., 'density_ratio': 0.}
+        for alt in H:
+            T = _alt2temp_km(alt)
+            PR = _alt2press_ratio_km(alt)
+            T_table = self._lookup(alt, self.T_coeffs)
+            PR_table = self._lookup(alt, self.PR_coeffs)
+            for (key, value, truth) in (('temp', T_table, T),
+                    ('press_ratio', PR_table, PR),
+                    ('density_ratio', PR_table / T_table, PR / T)):
+                errors[key] = max(errors[key], 1.01 * abs((value - truth)
+                                  / truth))
+
+        return errors
+
+
+def enable_table(
+    min_alt=-2000,
+    max_alt=50000,
+    resolution=500,
+    alt_units=default_alt_units,
+    ):
+    """
+    Switch alt2temp, alt2press_ratio and alt2density_ratio, and the functions
+    that use them, to a precomputed table covering min_alt to max_alt.  
+    Altitudes outside the table are still calculated with the exact layer 
+    formulas.  The table is built when this function is called.
+
+    The resolution is the largest allowable spacing between table points.  
+    The actual spacing is reduced, if needed, to be a whole fraction of a 
+    km, so the layer boundaries fall on table points.  Call table_info()
+    for the actual spacing and the maximum error.
+
+    The altitudes and resolution may be in feet ('ft'), metres ('m'), 
+    kilometres ('km'), statute miles, ('sm') or nautical miles ('nm').  If 
+    the units are not specified, the units in default_units.py are used.
+
+    The temperature is exact to within rounding error, as it varies linearly
+    within each layer.  With the default resolution of 500 ft the maximum 
+    relative error of the pressure ratio and density ratio is less than 
+    1e-9, and it falls with the fourth power of the resolution.
+
+    Examples:
+
+    >>> enable_table(0, 50000, 100)
+    >>> round(alt2press_ratio(5000), 12)
+    0.832048115873
+    >>> table_info()['max_error']['press_ratio'] < 1e-11
+    True
+    >>> disable_table()
+    """
+
+    global _table
+
+    H_low = U.length_conv(min_alt, from_units=alt_units, to_units='km')
+    H_high = U.length_conv(max_alt, from_units=alt_units, to_units='km')
+    step = U.length_conv(resolution, from_units=alt_units, to_units='km')
+    if H_high <= H_low:
+        raise ValueError('max_alt must be greater than min_alt.')
+    if step <= 0:
+        raise ValueError('The resolution must be greater than zero.')
+
+    _table = _ISATable(H_low, H_high, int(M.ceil(1. / step - 1e-9)))
+
+
+def disable_table():
+    """
+    Return alt2temp, alt2press_ratio and alt2density_ratio to the exact layer
+    formulas.
+    """
+
+    global _table
+
+    _table = None
+
+
+def table_info(alt_units=default_alt_units):
+    """
+    Return a dictionary describing the table used in table mode, or None if 
+    table mode is not enabled.
+
+    The dictionary holds the altitude range ('min_alt' and 'max_alt') and 
+    the spacing of the table points ('resolution') in the specified altitude 
+    units, and the maximum relative error ('max_error') of 'temp', 
+    'press_ratio' and 'density_ratio' versus the exact layer formulas.
+    """
+
+    if _table is None:
+        return None
+
+    return {'min_alt': U.length_conv(_table.H_low, from_units='km',
+                                     to_units=alt_units),
+            'max_alt': U.length_conv(_table.H_high, from_units='km',
+                                     to_units=alt_units),
+            'resolution': U.length_conv(_table.step, from_units='km',
+                                        to_units=alt_units),
+            'max_error': dict(_table.max_error)}
+
 # #############################################################################
 #
 # Altitude to temperature
@@ -251,6 +687,11 @@ def alt2temp(H, alt_units=default_alt_units,
     >>> alt2temp(11 * 5280, temp_units = 'R')
     389.96999999999997
     
+    The altitude may also be a sequence or numpy array of altitudes, in which
+    case a numpy array of temperatures is returned:
+    >>> alt2temp([0, 5000, 40000])
+    array([ 15.   ,   5.094, -56.5  ])
+    
     """
 
     # Validated to 84000 m
@@ -260,26 +701,40 @@ def alt2temp(H, alt_units=default_alt_units,
 
     H = U.length_conv(H, from_units=alt_units, to_units='km')
 
-    if H <= 11:
-        temp = T0 + H * L0
-    elif H <= 20:
-        temp = T11
-    elif H <= 32:
-        temp = T20 + (H - 20) * L20
-    elif H <= 47:
-        temp = T32 + (H - 32) * L32
-    elif H <= 51:
-        temp = T47
-    elif H <= 71:
-        temp = T51 + (H - 51) * L51
-    elif H <= 84.852:
-        temp = T71 + (H - 71) * L71
+    if _table is None:
+        temp = _alt2temp_km(H)
     else:
-        raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+        temp = _table.temp(H)
 
     return U.temp_conv(temp, to_units=temp_units, from_units='K')
 
 
+def _alt2temp_km(H):
+    """
+    Return the standard temperature in deg K for an altitude, or an array of
+    altitudes, in km, using the layer formulas.
+    """
+
+    if _is_array(H):
+        return _alt2temp_array(H)
+    if H <= 11:
+        return T0 + H * L0
+    if H <= 20:
+        return T11
+    if H <= 32:
+        return T20 + (H - 20) * L20
+    if H <= 47:
+        return T32 + (H - 32) * L32
+    if H <= 51:
+        return T47
+    if H <= 71:
+        return T51 + (H - 51) * L51
+    if H <= 84.852:
+        return T71 + (H - 71) * L71
+    else:
+        raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+
+
 def alt2temp_ratio(H, alt_units=default_alt_units):
     """
     Return the temperature ratio (temperature / standard temperature for
@@ -466,6 +921,9 @@ def alt2press_ratio(H, alt_units=default_alt_units):
       File \"std_atm.py\", line 461, in alt2press_ratio
         'This function is only implemented for altitudes of 84.852 km and below.'
     ValueError: This function is only implemented for altitudes of 84.852 km and below.
+
+    The altitude may also be a sequence or numpy array of altitudes, in which
+    case a numpy array of pressure ratios is returned.
         """
 
     # uses meters and degrees K for the internal calculations
@@ -474,6 +932,19 @@ def alt2press_ratio(H, alt_units=default_alt_units):
 
     H = U.length_conv(H, from_units=alt_units, to_units='km')
 
+    if _table is None:
+        return _alt2press_ratio_km(H)
+    return _table.press_ratio(H)
+
+
+def _alt2press_ratio_km(H):
+    """
+    Return the pressure ratio for an altitude, or an array of altitudes, in 
+    km, using the layer formulas.
+    """
+
+    if _is_array(H):
+        return _alt2press_ratio_array(H)
     if H <= 11:
         return _alt2press_ratio_gradient(H, 0, P0, T0, L0)
     if H <= 20:
@@ -507,7 +978,7 @@ def alt2press(H, alt_units=default_alt_units,
     Calculate the pressure in inches of mercury at 5,000 (default altitude 
     units):
     >>> alt2press(5000)
-    24.895987851572702
+    24.895987851572695
     
     Calculate the pressure in pounds per square foot at 10,000 (default 
     altitude units):
@@ -516,7 +987,7 @@ def alt2press(H, alt_units=default_alt_units,
     
     Calculate the pressure in pascal at 20 km:
     >>> alt2press(20, press_units = 'pa', alt_units = 'km')
-    5474.888555743623
+    5474.888555743622
     """
 
     # uses meters, pa and degrees K for the internal calculations
@@ -568,15 +1039,28 @@ def pressure_alt(H, alt_setting, alt_units=default_alt_units):
     Calculate the pressure altitude in metres for 304.8 m barometric 
     altitude with altimeter setting of 1008 mb:
     >>> pressure_alt(304.8, 1008, alt_units = 'm')
-    348.59361654048143
+    348.5936165404815
+
+    The altitude and altimeter setting may also be sequences or numpy 
+    arrays, with the units of each altimeter setting decided separately:
+    >>> pressure_alt([1000, 1000], [30.92, 1008])
+    array([  88.64244318, 1143.67984429])
     """
 
     H = U.length_conv(H, from_units=alt_units, to_units='ft')
-    if alt_setting > 35:
-        alt_setting = U.press_conv(alt_setting, from_units='hpa',
-                                   to_units='in HG')
-    if alt_setting < 25 or alt_setting > 35:
-        raise ValueError('Altimeter setting out of range.')
+    if _is_array(alt_setting):
+        alt_setting = _as_array(alt_setting)
+        alt_setting = N.where(alt_setting > 35, U.press_conv(alt_setting,
+                              from_units='hpa', to_units='in HG'),
+                              alt_setting)
+        if N.any((alt_setting < 25) | (alt_setting > 35)):
+            raise ValueError('Altimeter setting out of range.')
+    else:
+        if alt_setting > 35:
+            alt_setting = U.press_conv(alt_setting, from_units='hpa',
+                                       to_units='in HG')
+        if alt_setting < 25 or alt_setting > 35:
+            raise ValueError('Altimeter setting out of range.')
     base_press = U.press_conv(P0, from_units='pa', to_units='in HG')
     HP = H + 145442.2 * (1 - (alt_setting / base_press) ** 0.190261)
     HP = U.length_conv(HP, from_units='ft', to_units=alt_units)
@@ -650,7 +1134,7 @@ def alt2density(H, alt_units=default_alt_units,
     
     Calculate the density in lb / ft cubed at 7,500 (default altitude units):
     >>> alt2density(7500)
-    0.061046199847730374
+    0.06104619984773038
     
     Calculate the density in slugs / ft cubed at 5,000 (default altitude units):
     >>> alt2density(5000, density_units = 'slug/ft**3')
@@ -684,7 +1168,7 @@ def alt_temp2density_ratio(H, temp, alt_units=default_alt_units, temp_units=defa
     If the units are not specified, the units in default_units.py are used.
 
     """
-    if temp == 'std':
+    if isinstance(temp, str) and temp == 'std':
         temp = SA.alt2temp(H, temp_units=temp_units)
     press_ratio = alt2press_ratio(H, alt_units=alt_units)
     temp_ratio = temp2temp_ratio(temp, temp_units=temp_units)
@@ -722,7 +1206,7 @@ def _density2alt_isothermal(
 
 
 def density2alt(Rho, density_units=default_density_units,
-                alt_units=default_alt_units):
+                alt_units=default_alt_units, out_of_range='raise'):
     """
     Return the altitude corresponding to the specified density, with
     density in 'lb/ft**3', 'slug/ft**3' or 'kg/m**3'.  
@@ -737,12 +1221,19 @@ def density2alt(Rho, density_units=default_density_units,
     Calculate the altitude in default altitude units where the density is 
     0.056475 in default density units:
     >>> density2alt(.056475)
-    9999.804093493727
+    9999.804093493725
     
     Calculate the altitude in metres where the density is 0.018012 kg / m 
     cubed:
     >>> density2alt(.018012, alt_units = 'm', density_units = 'kg/m**3')
     29999.978688508152
+
+    The density may also be a sequence or numpy array of densities, in which
+    case a numpy array of altitudes is returned.  Densities that correspond 
+    to altitudes above 84.852 km raise a ValueError, unless out_of_range is
+    'nan', in which case the altitude for those densities is nan:
+    >>> density2alt([1.225, 1e-6], density_units = 'kg/m**3', out_of_range = 'nan')
+    array([ 0., nan])
     """
 
     # function tested in tests/test_std_atm.py
@@ -750,7 +1241,9 @@ def density2alt(Rho, density_units=default_density_units,
     Rho = U.density_conv(Rho, from_units=density_units,
                          to_units='kg/m**3')
 
-    if Rho > Rho11:
+    if _is_array(Rho):
+        H = _value2alt_array(Rho, _LAYER_RHO, _density2alt_gradient)
+    elif Rho > Rho11:
         H = _density2alt_gradient(Rho, Rho0, 0, T0, L0)
     elif Rho > Rho20:
         H = _density2alt_isothermal(Rho, Rho11, 11, T11)
@@ -765,13 +1258,12 @@ def density2alt(Rho, density_units=default_density_units,
     else:
         H = _density2alt_gradient(Rho, Rho71, 71, T71, L71)
 
-    if H > 84.852:
-        raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+    H = _check_alt_limit(H, out_of_range)
 
     return U.length_conv(H, from_units='km', to_units=alt_units)
 
 
-def density_ratio2alt(DR, alt_units=default_alt_units):
+def density_ratio2alt(DR, alt_units=default_alt_units, out_of_range='raise'):
     """
     Return the altitude for the specified density ratio. The altitude is in
     feet ('ft'), metres ('m'), statute miles, ('sm') or nautical miles 
@@ -788,17 +1280,21 @@ def density_ratio2alt(DR, alt_units=default_alt_units):
     
     Calculate the altitude in feet where the density ratio is 0.5:
     >>> density_ratio2alt(.5)
-    21859.50324995652
+    21859.503249956517
     
     Calculate the altitude in km where the density ratio is 0.1
     >>> density_ratio2alt(.1, alt_units = 'km')
     17.9048674520646
+
+    The density ratio may also be a sequence or numpy array.  See 
+    density2alt for the out_of_range options.
     """
 
     # function tested in tests/test_std_atm.py
 
-    D = DR * Rho0
-    return density2alt(D, alt_units=alt_units, density_units='kg/m**3')
+    D = _as_array(DR) * Rho0
+    return density2alt(D, alt_units=alt_units, density_units='kg/m**3',
+                       out_of_range=out_of_range)
 
 
 # #############################################################################
@@ -844,6 +1340,13 @@ def density_alt(
     
     If the units are not specified, the units in default_units.py are used.
 
+    Any of the altitude, temperature, altimeter setting, dew point and 
+    relative humidity may be sequences or numpy arrays, e.g. for many 
+    weather reports at once, and the density altitudes are returned as a 
+    numpy array.  A dew point or relative humidity of nan means the value 
+    was not provided for that sample.  The altimeter setting units are 
+    decided for each sample.
+
     The method is from: http://wahiduddin.net/calc/density_altitude.htm
     
     Examples:
@@ -861,24 +1364,32 @@ def density_alt(
     of 29.9213 in HG or 1013.25 mb.  The dew point and relative humidity are 
     not specified, so the air is assumed to be dry:
     >>> density_alt(7000, 85, temp_units = 'F')
-    10159.07304637576
+    10159.073046375759
     
     Calculate the density altitude in default altitude units for a pressure 
     altitude of 7000 default altitude units, an altimeter setting of 29.80 and
     a temperature of 85 deg F and a dew point of 55 deg F:
     >>> density_alt(7000, 85, 29.80, 55, temp_units = 'F')
-    10522.77773654551
+    10522.777736545508
     
     Calculate the density altitude in metres for a pressure altitude of 
     2000 m, an altimeter setting of 1010 mb,  a temperature of 15 deg (default 
     temperature units) and a relative humidity of 50%:
     >>> density_alt(2000, 15, 1010, alt_units = 'm', RH = 0.5)
-    2529.823560771358
+    2529.8235607713577
     
     The dew point may be specified in one of two ways: as the fourth 
     argument on the command line, or via the keyword argument DP.
     >>> density_alt(2000, 15, 1010, alt_units = 'm', DP = 5)
-    2530.753321161468
+    2530.7533211614677
+
+    Calculate the density altitude in default altitude units for three 
+    reports, the first with a dew point, the second with a relative 
+    humidity, and the third with neither, so it is taken as dry air:
+    >>> nan = float('nan')
+    >>> density_alt([7000, 2000, 500], [30, 15, -5], [29.80, 1010, 30.12], 
+    ...             DP = [10, nan, nan], RH = [nan, 0.5, nan])
+    array([10542.50058064,  2690.6487799 , -2081.44194552])
         
     The relative humidity must be in the range of 0 to 1:
     >>> density_alt(2000, 15, 1010, alt_units = 'm', RH = 1.1)
@@ -891,11 +1402,11 @@ def density_alt(
     ValueError: The relative humidity must be in the range of 0 to 1.
         """
 
-    Rv = 461.495  # gas constant for water vapour
-
     # saturated vapour pressure
 
-    if DP == 'FALSE' and RH == 0:
+    if _is_array(DP) or _is_array(RH):
+        Pv = sat_press(T, DP, RH, temp_units, press_units='pa')
+    elif not _given(DP) and (not _given(RH) or RH == 0):
         Pv = 0
     else:
         Pv = sat_press(T, DP, RH, temp_units, press_units='pa')
@@ -970,24 +1481,36 @@ def sat_press(
     
     Dew point is 65 deg F.  Find the water vapour pressure in default pressure units:
     >>> sat_press(DP=65, temp_units = 'F')
-    0.6220771070195616
+    0.6220771070195618
     
     Dew point is 212 deg F (the boiling point of water at sea level).
     Find the water vapour pressure in lb per sq. inch:
     >>> sat_press(DP=212, temp_units = 'F', press_units = 'psi')
-    14.696775531500785
+    14.696775531500787
 
     Temperature is 30 deg C.  Find the water vapour pressure in default pressure units:
     for 50% relative humidity:
     >>> sat_press(T=30, RH = 0.5)
-    0.6264766699605793
+    0.6264766699605794
+
+    The temperature, dew point and relative humidity may also be sequences 
+    or numpy arrays.  A dew point of nan means the relative humidity is used
+    for that sample, and a relative humidity of nan as well gives a vapour 
+    pressure of zero:
+    >>> sat_press(T=[30, 30, 30], DP=[11, float('nan'), float('nan')], 
+    ...           RH=[0.2, 0.5, float('nan')])
+    array([0.38741016, 0.62647667, 0.        ])
     """
 
-    if DP != 'FALSE':
+    if _is_array(T) or _is_array(DP) or _is_array(RH):
+        Pv = _sat_press_array(T, DP, RH, temp_units)
+        return U.press_conv(Pv, from_units='pa', to_units=press_units)
+
+    if _given(DP):
 
         # use dew point method
 
-        if T != 'FALSE':
+        if _given(T):
             if DP > T:
                 raise ValueError('The dew point cannot be greater than the temperature.')
 
@@ -998,7 +1521,7 @@ def sat_press(
         Pv = _sat_press(DP) * 100.
     else:
 
-        if RH == 'FALSE':
+        if not _given(RH):
             raise ValueError('Either DP (dew point) or RH (relative humidity) must be specified.')
 
     # relative humidity is specified
@@ -1007,7 +1530,7 @@ def sat_press(
         if RH < 0 or RH > 1:
             raise ValueError('The relative humidity must be in the range of 0 to 1.')
 
-        if T == 'FALSE':
+        if not _given(T):
             raise ValueError('If the relative humidity is specified, the temperature must also be specified.')
 
         T = U.temp_conv(T, from_units=temp_units, to_units='C')
@@ -1020,6 +1543,40 @@ def sat_press(
     return Pv
 
 
+def _sat_press_array(T, DP, RH, temp_units):
+    """
+    Return the saturated vapour pressure of water in pa, for a temperature, 
+    dew point and relative humidity where any may be arrays.  The dew point 
+    is used where it is provided, the temperature and relative humidity 
+    where only the relative humidity is provided, and the vapour pressure is
+    zero where neither is provided.
+    """
+
+    (T, DP, RH) = N.broadcast_arrays(_optional(T), _optional(DP),
+                                     _optional(RH))
+    use_DP = ~N.isnan(DP)
+    use_RH = ~use_DP & ~N.isnan(RH)
+    RH = N.where(use_RH, RH, N.nan)
+
+    if N.any(DP > T):
+        raise ValueError('The dew point cannot be greater than the temperature.')
+    if N.any((RH < 0) | (RH > 1)):
+        raise ValueError('The relative humidity must be in the range of 0 to 1.')
+    if N.any(use_RH & N.isnan(T)):
+        raise ValueError('If the relative humidity is specified, the temperature must also be specified.')
+
+    # the saturation pressure at the dew point, or at the temperature 
+    # multiplied by the relative humidity
+
+    DP = U.temp_conv(DP, from_units=temp_units, to_units='C')
+    T = U.temp_conv(T, from_units=temp_units, to_units='C')
+    with N.errstate(invalid='ignore'):
+        Pv = _sat_press(N.where(use_DP, DP, T)) * 100.
+        Pv = N.where(use_DP, Pv, N.where(use_RH, Pv * RH, 0.))
+
+    return Pv
+
+
 def dry_press(
     H,
     Pv,
@@ -1044,11 +1601,118 @@ def density_alt2temp(
     press_alt,
     alt_units=default_alt_units,
     temp_units=default_temp_units,
+    DP='FALSE',
+    RH=0.0,
     ):
     """
     Return temperature to achieve a desired density altitude.
 
+    For dry air, or if the dew point is specified, the temperature is 
+    calculated directly from the density at the desired density altitude and
+    the pressure at the pressure altitude.  If the relative humidity is 
+    specified, the vapour pressure depends on the temperature, so the 
+    temperature is found by iteration, to within 1 unit of density altitude.
+
+    The density altitude, pressure altitude, dew point and relative humidity
+    may be sequences or numpy arrays, with nan for a dew point or relative 
+    humidity that was not provided, as for density_alt.
+
     If the units are not specified, the units in default_units.py are used.
+
+    Examples:
+
+    Calculate the temperature in deg F for a density altitude of 5000 ft at 
+    a pressure altitude of 3700 ft, in dry air:
+    >>> density_alt2temp(5000, 3700, alt_units = 'ft', temp_units = 'F')
+    66.01992012963956
+
+    Calculate the temperatures in deg C for a density altitude of 8000 ft at
+    pressure altitudes of 6000, 7000 and 8000 ft, in dry air:
+    >>> density_alt2temp(8000, [6000, 7000, 8000], alt_units = 'ft', 
+    ...                  temp_units = 'C')
+    array([20.63122188,  9.7256448 , -0.84978569])
+    """
+
+    # samples with a relative humidity, and no dew point, need iteration
+
+    if _is_array(RH) or _is_array(DP):
+        use_RH = N.logical_and(_given(RH), N.logical_not(_given(DP)))
+        use_RH = N.logical_and(use_RH, _as_array(RH) != 0)
+    else:
+        use_RH = _given(RH) and not _given(DP) and RH != 0
+
+    if _is_array(use_RH):
+        temp = _density_alt2temp_direct(density_alt_seek, press_alt,
+                                        N.where(use_RH, N.nan,
+                                        _optional(DP)), alt_units,
+                                        temp_units)
+        if N.any(use_RH):
+            (temp, seek, HP, RH, use_RH) = N.broadcast_arrays(temp,
+                    _as_array(density_alt_seek), _as_array(press_alt),
+                    _as_array(RH), use_RH)
+            temp = temp.copy()
+            temp[use_RH] = [_density_alt2temp_humid(s, h, r, alt_units)
+                            for (s, h, r) in zip(seek[use_RH],
+                            HP[use_RH], RH[use_RH])]
+    elif use_RH:
+        temp = _density_alt2temp_humid(density_alt_seek, press_alt, RH,
+                                       alt_units)
+    else:
+        temp = _density_alt2temp_direct(density_alt_seek, press_alt, DP,
+                                        alt_units, temp_units)
+
+    return U.temp_conv(temp, from_units='C', to_units=temp_units)
+
+
+def _density_alt2temp_direct(
+    density_alt_seek,
+    press_alt,
+    DP,
+    alt_units,
+    temp_units,
+    ):
+    """
+    Return the temperature in deg C to achieve a density altitude in dry 
+    air, or air with the specified dew point.
+
+    The density is the sum of the dry air and water vapour densities, 
+    Pd / (Rd * T) + Pv / (Rv * T), and Pv only depends on the dew point, so 
+    the temperature is (Pd / Rd + Pv / Rv) / density.
+    """
+
+    if _is_array(DP):
+        Pv = sat_press(DP=DP, RH=float('nan'), temp_units=temp_units,
+                       press_units='pa')
+    elif _given(DP):
+        Pv = sat_press(DP=DP, temp_units=temp_units, press_units='pa')
+    else:
+        Pv = 0.
+
+    Pd = dry_press(press_alt, Pv, alt_units=alt_units, press_units='pa')
+    D = alt2density_ratio(density_alt_seek, alt_units=alt_units) * Rho0
+    T = (Pd / Rd + Pv / Rv) / D
+    T = U.temp_conv(T, from_units='K', to_units='C')
+
+    if _is_array(DP):
+        if N.any(U.temp_conv(_as_array(DP), from_units=temp_units,
+                 to_units='C') > T):
+            raise ValueError('The dew point cannot be greater than the temperature.')
+    elif _given(DP):
+        if U.temp_conv(DP, from_units=temp_units, to_units='C') > T:
+            raise ValueError('The dew point cannot be greater than the temperature.')
+
+    return T
+
+
+def _density_alt2temp_humid(
+    density_alt_seek,
+    press_alt,
+    RH,
+    alt_units,
+    ):
+    """
+    Return the temperature in deg C to achieve a density altitude with the
+    specified relative humidity, by bisection.
     """
 
     low = -100.  # initial lower guess
@@ -1056,16 +1720,19 @@ def density_alt2temp(
 
     # confirm initial low and high are OK:
 
-    da_low = density_alt(press_alt, low, alt_units=alt_units)
+    da_low = density_alt(press_alt, low, RH=RH, alt_units=alt_units,
+                         temp_units='C')
     if da_low > density_alt_seek:
         raise ValueError('Initial low guess too high.')
 
-    da_high = density_alt(press_alt, high, alt_units=alt_units)
+    da_high = density_alt(press_alt, high, RH=RH, alt_units=alt_units,
+                          temp_units='C')
     if da_high < density_alt_seek:
         raise ValueError('Initial high guess too low.')
 
     guess = (low + high) / 2.
-    da_guess = density_alt(press_alt, guess, alt_units=alt_units)
+    da_guess = density_alt(press_alt, guess, RH=RH, alt_units=alt_units,
+                           temp_units='C')
 
     # keep iterating until da is within 1 ft of desired value
 
@@ -1076,9 +1743,8 @@ def density_alt2temp(
             low = guess
 
         guess = (low + high) / 2.
-        da_guess = density_alt(press_alt, guess, alt_units=alt_units)
-
-    guess = U.temp_conv(guess, from_units='C', to_units=temp_units)
+        da_guess = density_alt(press_alt, guess, RH=RH,
+                               alt_units=alt_units, temp_units='C')
 
     return guess
 
@@ -1096,6 +1762,9 @@ def density_alt_table(
     """
     Return a text or html table of required temperature vs pressure altitude.
 
+    The temperatures for all the pressure altitudes are calculated in one
+    call to density_alt2temp.
+
     If the units are not specified, the units in default_units.py are used.
     """
 
@@ -1121,25 +1790,27 @@ def density_alt_table(
     else:
         raise ValueError('Invalid format.  Must be either "text" or "html"')
 
+    alt_low = max(density_alt_seek - alt_range / 2., 0)
+    alt_high = density_alt_seek + alt_range / 2.
+    alts = [alt_low + i * alt_inc for i in range(int((alt_high - alt_low)
+            / alt_inc + 1e-9) + 1)]
+
     if multi_units:
-        for alt in range(max(density_alt_seek - alt_range / 2., 0),
-                         density_alt_seek + alt_range / 2. + alt_inc,
-                         alt_inc):
-            temp_c = density_alt2temp(density_alt_seek, alt,
-                    alt_units=alt_units)
+        temps = _density_alt2temp_column(density_alt_seek, alts, alt_units,
+                                         'C')
+        for (alt, temp_c) in zip(alts, temps):
             temp_f = U.temp_conv(temp_c, from_units='C', to_units='F')
-            alt_str = L.format('%.*f', (0, alt), grouping=True)
+            alt_str = L.format_string('%.*f', (0, alt), grouping=True)
             temp_c_str = '%.1f' % temp_c
             temp_f_str = '%.1f' % temp_f
             line_buffer.append(alt_str.rjust(6) + temp_c_str.rjust(11)
                                 + temp_f_str.rjust(10))
     else:
-        for alt in range(max(density_alt_seek - alt_range / 2., 0),
-                         density_alt_seek + alt_range / 2. + alt_inc,
-                         alt_inc):
-            alt_str = L.format('%.*f', (0, alt), grouping=True)
-            temp_str = '%.1f' % density_alt2temp(density_alt_seek, alt,
-                    temp_units=temp_units, alt_units=alt_units)
+        temps = _density_alt2temp_column(density_alt_seek, alts, alt_units,
+                                         temp_units)
+        for (alt, temp) in zip(alts, temps):
+            alt_str = L.format_string('%.*f', (0, alt), grouping=True)
+            temp_str = '%.1f' % temp
             line_buffer.append(alt_str.rjust(6) + temp_str.rjust(11))
 
     if file != '':
@@ -1152,6 +1823,19 @@ def density_alt_table(
         return '\n'.join(line_buffer)
 
 
+def _density_alt2temp_column(density_alt_seek, alts, alt_units, temp_units):
+    """
+    Return the temperatures for a density altitude at a list of pressure 
+    altitudes, in one array calculation if numpy is available.
+    """
+
+    if N is not None:
+        return density_alt2temp(density_alt_seek, N.array(alts),
+                                alt_units=alt_units, temp_units=temp_units)
+    return [density_alt2temp(density_alt_seek, alt, alt_units=alt_units,
+            temp_units=temp_units) for alt in alts]
+
+
 # #############################################################################
 #
 # Pressure to altitude and pressure ratio to altitude
@@ -1182,7 +1866,7 @@ def _press2alt_isothermal(
 
 
 def press2alt(P, press_units=default_press_units,
-              alt_units=default_alt_units):
+              alt_units=default_alt_units, out_of_range='raise'):
     """
     Return the altitude corresponding to the specified pressure, with
     pressure in inches of HG, mm of HG, psi, psf (lb per sq. ft), pa, hpa or
@@ -1198,7 +1882,7 @@ def press2alt(P, press_units=default_press_units,
     Calculate the pressure altitude in feet for a pressure of 31.0185 inches
     of HG:
     >>> press2alt(31.0185)
-    -999.9602016597179
+    -999.9602016597178
     
     Calculate the pressure altitude in feet for a pressure of 
     1455.33 lb sq. ft:
@@ -1208,19 +1892,30 @@ def press2alt(P, press_units=default_press_units,
     Calculate the pressure altitude in metres for a pressure of 
     90.3415 mm HG:
     >>> press2alt(90.3415, press_units = 'mm HG', alt_units = 'm')
-    15000.032231346277
+    15000.032231346275
     
     Calculate the pressure altitude in metres for a pressure of 
     1171.86 pascal:
     >>> press2alt(1171.86, press_units = 'pa', alt_units = 'm')
-    30000.03658869385
+    30000.036588693845
+
+    The pressure may also be a sequence or numpy array of pressures, such as
+    a column of recorded static pressure, in which case a numpy array of 
+    altitudes is returned.  Pressures that correspond to altitudes above 
+    84.852 km raise a ValueError, unless out_of_range is 'nan', in which case
+    the altitude for those pressures is nan, and the valid samples are still
+    converted:
+    >>> press2alt([1013.25, 0.001], press_units = 'hpa', out_of_range = 'nan')
+    array([ 0., nan])
     """
 
     # function tested in tests/test_std_atm.py
 
     P = U.press_conv(P, from_units=press_units, to_units='pa')
 
-    if P > P11:
+    if _is_array(P):
+        H = _value2alt_array(P, _LAYER_P, _press2alt_gradient)
+    elif P > P11:
         H = _press2alt_gradient(P, P0, 0, T0, L0)
     elif P > P20:
         H = _press2alt_isothermal(P, P11, 11, T11)
@@ -1235,13 +1930,12 @@ def press2alt(P, press_units=default_press_units,
     else:
         H = _press2alt_gradient(P, P71, 71, T71, L71)
 
-    if H > 84.852:
-        raise ValueError('This function is only implemented for altitudes of 84.852 km and below.')
+    H = _check_alt_limit(H, out_of_range)
 
     return U.length_conv(H, from_units='km', to_units=alt_units)
 
 
-def press_ratio2alt(PR, alt_units=default_alt_units):
+def press_ratio2alt(PR, alt_units=default_alt_units, out_of_range='raise'):
     """
     Return the pressure ratio for the specified altitude.  The altitude is 
     specified in feet ('ft'), metres ('m'), statute miles, ('sm') or 
@@ -1253,17 +1947,21 @@ def press_ratio2alt(PR, alt_units=default_alt_units):
     
     Calculate the altitude in feet where the pressure ratio is 0.5:
     >>> press_ratio2alt(.5)
-    17969.990746028907
+    17969.990746028903
     
     Calculate the altitude in metres where the pressure ratio is 0.1:
     >>> press_ratio2alt(.1, alt_units = 'm')
-    16096.249927559486
+    16096.249927559484
+
+    The pressure ratio may also be a sequence or numpy array.  See press2alt
+    for the out_of_range options.
     """
 
     # function tested in tests/test_std_atm.py
 
-    P = PR * P0
-    return press2alt(P, press_units='pa', alt_units=alt_units)
+    P = _as_array(PR) * P0
+    return press2alt(P, press_units='pa', alt_units=alt_units,
+                     out_of_range=out_of_range)
 
 
 # #############################################################################
@@ -1292,14 +1990,17 @@ def temp2speed_of_sound(temp, temp_units=default_temp_units,
     
     Determine speed of sound in mph at 120 deg F:
     >>> temp2speed_of_sound(120, speed_units = 'mph', temp_units = 'F')
-    804.7350015499129
+    804.7350015499131
     """
 
     # function tested in tests/test_std_atm.py
 
-    temp = U.temp_conv(temp, from_units=temp_units, to_units='K')
-
-    speed_of_sound = M.sqrt((1.4 * Rd) * temp)
+    if _is_array(temp):
+        temp = U.temp_conv(N.asarray(temp, dtype=float), from_units=temp_units, to_units='K')
+        speed_of_sound = N.sqrt((1.4 * Rd) * temp)
+    else:
+        temp = U.temp_conv(temp, from_units=temp_units, to_units='K')
+        speed_of_sound = M.sqrt((1.4 * Rd) * temp)
     speed_of_sound = U.speed_conv(speed_of_sound, from_units='m/s',
                                   to_units=speed_units)
 
@@ -15,6 +15,7 @@ import sys
 
 sys.path.append('../')
 import airspeed as A
+import numpy as N
 
 # These tests assume that default_units.py contains the following defaults:
 # default_area_units = 'ft**2'
@@ -623,6 +624,164 @@ class Test_tas2temp(unittest.TestCase):
         # print Value, Truth
         self.assertTrue(RE(Value, Truth) <= 1e-5)
 
+class Test_airspeed_arrays(unittest.TestCase):
+
+    """Check that arrays of values give the same results as single values"""
+
+    def test_01(self):
+
+        # subsonic and supersonic CAS in one array
+
+        cas = [100, 400, 661, 700, 1500]
+        Value = A.cas2dp(cas)
+        for (c, v) in zip(cas, Value):
+            self.assertEqual(v, A.cas2dp(c))
+
+    def test_02(self):
+        dp = N.array([0.5, 15, 30, 60])
+        Value = A.dp2cas(dp, speed_units='mph')
+        for (d, v) in zip(dp, Value):
+            self.assertEqual(v, A.dp2cas(d, speed_units='mph'))
+
+    def test_03(self):
+        cas = N.array([100., 200., 300.])
+        alt = N.array([0., 10000., 25000.])
+        temp = N.array([15., 0., -40.])
+        Value = A.cas2tas(cas, alt, temp)
+        for i in range(3):
+            self.assertEqual(Value[i], A.cas2tas(cas[i], alt[i], temp[i]))
+        Value = A.tas2cas(cas, alt)
+        for i in range(3):
+            self.assertEqual(Value[i], A.tas2cas(cas[i], alt[i]))
+
+    def test_04(self):
+        eas = N.array([100., 200., 300.])
+        alt = N.array([0., 10000., 25000.])
+        Value = A.eas2tas(eas, alt)
+        for i in range(3):
+            self.assertEqual(Value[i], A.eas2tas(eas[i], alt[i]))
+        Value = A.cas2eas(eas, alt, speed_units='km/h')
+        for i in range(3):
+            self.assertEqual(Value[i], A.cas2eas(eas[i], alt[i],
+                             speed_units='km/h'))
+
+    def test_05(self):
+
+        # a single supersonic TAS raises, as for a single value
+
+        self.assertRaises(ValueError, A.tas2dp, [200, 700], [0, 0], [15, 15])
+
+class Test_super_solver(unittest.TestCase):
+
+    """Check the supersonic solutions in dp2cas and dp_over_p2mach"""
+
+    def test_01(self):
+
+        # supersonic CAS round trip
+
+        cas = N.array([700., 1000., 2500., 6000.])
+        Value = A.dp2cas(A.cas2dp(cas))
+        for (v, c) in zip(Value, cas):
+            self.assertTrue(RE(v, c) <= 1e-10)
+
+    def test_02(self):
+
+        # the iteration count is returned, and is zero for subsonic CAS
+
+        (Value, iterations) = A.dp2cas(5, full_output=True)
+        self.assertEqual(iterations, 0)
+        (Value, iterations) = A.dp2cas(30, full_output=True)
+        self.assertTrue(0 < iterations < 10)
+
+    def test_03(self):
+
+        # a looser tolerance takes no more iterations
+
+        dp_over_p = N.linspace(1., 100., 50)
+        (Value1, iterations1) = A.dp_over_p2mach(dp_over_p, tol=1e-4,
+                                                 full_output=True)
+        (Value2, iterations2) = A.dp_over_p2mach(dp_over_p, tol=1e-12,
+                                                 full_output=True)
+        self.assertTrue(iterations1 <= iterations2)
+        for (v, m) in zip(A.mach2dp_over_p(Value2), dp_over_p):
+            self.assertTrue(RE(v, m) <= 1e-12)
+
+    def test_04(self):
+
+        # arrays give the same mach as single values
+
+        dp_over_p = [0.5, 0.9, 3.5, 31.65347]
+        Value = A.dp_over_p2mach(dp_over_p)
+        for (v, d) in zip(Value, dp_over_p):
+            self.assertTrue(RE(v, A.dp_over_p2mach(d)) <= 1e-10)
+
+    def test_05(self):
+
+        # mach above 10 is out of range
+
+        self.assertRaises(ValueError, A.dp_over_p2mach, [1., 200.])
+
+class Test_table_mode(unittest.TestCase):
+
+    """Check the optional pitot table against the iterative solution"""
+
+    def tearDown(self):
+        A.disable_table()
+
+    def test_01(self):
+
+        # table_info is None when the table is not in use
+
+        A.disable_table()
+        self.assertEqual(A.table_info(), None)
+
+    def test_02(self):
+
+        # scalar lookups are within the reported error bound
+
+        dp_over_p = (0.9, 3.5, 31.65347, 100.)
+        Value = [A.dp_over_p2mach(d) for d in dp_over_p]
+        A.enable_table()
+        error = A.table_info()['max_error']['mach']
+        self.assertTrue(error < 1e-11)
+        for (d, Truth) in zip(dp_over_p, Value):
+            (mach, iterations) = A.dp_over_p2mach(d, full_output=True)
+            self.assertEqual(iterations, 0)
+            self.assertTrue(RE(mach, Truth) <= 1e-10)
+
+    def test_03(self):
+
+        # refined array lookups are within the reported error bound
+
+        dp_over_p = N.linspace(0.9, 120., 1001)
+        A.enable_table(refine=True)
+        error = A.table_info()['max_error']['dp_over_p']
+        self.assertTrue(error < 1e-13)
+        Value = A.dp_over_p2mach(dp_over_p)
+        self.assertTrue(N.max(N.abs((A.mach2dp_over_p(Value) - dp_over_p)
+                        / dp_over_p)) <= error)
+
+    def test_04(self):
+
+        # cas_alt2mach and mach_alt2cas give the same results as iteration
+
+        Truth = (A.cas_alt2mach(600, 40000), A.mach_alt2cas(2.5, 30000))
+        A.enable_table()
+        Value = (A.cas_alt2mach(600, 40000), A.mach_alt2cas(2.5, 30000))
+        for (v, t) in zip(Value, Truth):
+            self.assertTrue(RE(v, t) <= 1e-10)
+
+    def test_05(self):
+
+        # tolerances tighter than the table, and mach above 10, still 
+        # iterate
+
+        A.enable_table()
+        (Value, iterations) = A.dp_over_p2mach(3.5, tol=1e-14,
+                                               full_output=True)
+        self.assertTrue(iterations > 0)
+        self.assertRaises(ValueError, A.dp_over_p2mach, 200.)
+
 
 # create test suites
 
@@ -641,6 +800,9 @@ suite9 = unittest.makeSuite(Test_tas2mach)
 suite10 = unittest.makeSuite(Test_mach2tas)
 suite11 = unittest.makeSuite(Test_mach2temp)
 suite12 = unittest.makeSuite(Test_tas2temp)
+suite13 = unittest.makeSuite(Test_airspeed_arrays)
+suite14 = unittest.makeSuite(Test_super_solver)
+suite15 = unittest.makeSuite(Test_table_mode)
 
 # add test suites to main test suite, so all test results are in one block
 
@@ -658,6 +820,9 @@ main_suite.addTest(suite9)
 main_suite.addTest(suite10)
 main_suite.addTest(suite11)
 main_suite.addTest(suite12)
+main_suite.addTest(suite13)
+main_suite.addTest(suite14)
+main_suite.addTest(suite15)
 
 # run main test suite
 # if we run the main test suite, we get a line for each test, plus any
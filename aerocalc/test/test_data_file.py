@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Test cases for data_file module.
+Run this script directly to do all the tests.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# sys.path.append('/Users/kwh/python/')
+
+sys.path.append('../')
+import data_file as DF
+import numpy as N
+
+
+def make_data_file(rows=25, blank_row=3):
+    """ Write a data file in the flight test recorder layout, with a title
+    row, a blank row, the column names, a units row, then one record per
+    row, each ending with the record separator.  Returns the file name.
+    """
+
+    (handle, file_name) = tempfile.mkstemp(suffix='.txt')
+    DATA = os.fdopen(handle, 'w')
+    DATA.write('Test flight\n\nTime\tAltitude\tIAS\t\n\tft\tkt\t\n')
+    for i in range(rows):
+        if i == blank_row:
+            ias = ''
+        else:
+            ias = str(100 + i)
+        DATA.write('12:%02d:%02d\t%d\t%s\t\n' % (i // 60, i % 60,
+                   1000 + 10 * i, ias))
+    DATA.close()
+
+    return file_name
+
+
+class Test_load_chunks(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file()
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_01(self):
+
+        # chunk sizes, and the last chunk holds the remaining rows
+
+        chunks = list(DF.load_chunks(self.file_name, 10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+
+    def test_02(self):
+
+        # the chunks hold the same records as load_array
+
+        whole = DF.load_array(self.file_name)
+        chunks = list(DF.load_chunks(self.file_name, 7))
+        self.assertEqual(chunks[0].dtype.names, ('Time', 'Altitude', 'IAS'))
+        self.assertEqual(sum([list(chunk.Altitude) for chunk in chunks],
+                         []), list(whole.Altitude))
+        self.assertEqual(chunks[0].IAS[3], 0.)
+
+    def test_03(self):
+
+        # time slice, with both ends inclusive
+
+        chunks = list(DF.load_chunks(self.file_name, 4,
+                      time_slice=('12:00:05', '12:00:12')))
+        times = sum([list(chunk.Time) for chunk in chunks], [])
+        self.assertEqual(times[0], '12:00:05')
+        self.assertEqual(times[-1], '12:00:12')
+        self.assertEqual(len(times), 8)
+
+    def test_04(self):
+
+        # open ended time slice
+
+        chunks = list(DF.load_chunks(self.file_name, 100,
+                      time_slice=('12:00:20', '')))
+        self.assertEqual(len(chunks[0]), 5)
+
+    def test_05(self):
+
+        # blanks may be nan, to match load_array with blank=nan
+
+        nan = float('nan')
+        chunks = list(DF.load_chunks(self.file_name, 10, blank=nan))
+        Truth = DF.load_array(self.file_name, blank=nan)
+        self.assertTrue(N.isnan(chunks[0].IAS[3]))
+        self.assertTrue(N.array_equal(N.concatenate([chunk.IAS for chunk in
+                        chunks]), Truth.IAS, equal_nan=True))
+
+    def test_06(self):
+
+        # bad chunk size
+
+        self.assertRaises(ValueError, list, DF.load_chunks(self.file_name,
+                          0))
+
+class Test_load_array(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file()
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_01(self):
+
+        # load_array keeps the record at the start time.  Before version 
+        # 0.29 it skipped it, and returned 5 records from 12:00:06 here, 
+        # rather than 6 from 12:00:05
+
+        Value = DF.load_array(self.file_name, time_slice=('12:00:05',
+                              '12:00:10'))
+        self.assertEqual(len(Value), 6)
+        self.assertEqual(Value.Time[0], '12:00:05')
+        self.assertEqual(Value.Time[-1], '12:00:10')
+        Value = DF.load_array(self.file_name, time_slice=('12:00:20', ''))
+        self.assertEqual(len(Value), 5)
+        self.assertEqual(Value.Time[0], '12:00:20')
+
+class Test_index(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file(rows=200)
+        self.index_file = DF.build_index(self.file_name, every=7)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+        os.remove(self.index_file)
+
+    def test_01(self):
+
+        # default index file name
+
+        self.assertEqual(self.index_file, self.file_name + '.idx')
+
+    def test_02(self):
+
+        # grab_data gives the same result with and without the index
+
+        for time_slice in (('12:00:00', '12:00:05'), ('12:00:31', '12:00:44'),
+                           ('12:01:35', '12:01:39')):
+            self.assertEqual(DF.grab_data(self.file_name, 'Altitude',
+                             time_slice, index=True),
+                             DF.grab_data(self.file_name, 'Altitude',
+                             time_slice))
+
+    def test_03(self):
+
+        # load_chunks and load_array give the same records with the index
+
+        time_slice = ('12:01:03', '12:01:20')
+        Value = list(DF.load_chunks(self.file_name, time_slice=time_slice,
+                     index=True))[0]
+        Truth = list(DF.load_chunks(self.file_name, time_slice=time_slice))[0]
+        self.assertEqual(list(Value.Time), list(Truth.Time))
+        Value = DF.load_array(self.file_name, time_slice=time_slice,
+                              index=self.index_file)
+        Truth = DF.load_array(self.file_name, time_slice=time_slice)
+        self.assertEqual(list(Value.Time), list(Truth.Time))
+
+    def test_04(self):
+
+        # a missing or out of date index is rejected
+
+        self.assertRaises(ValueError, DF.grab_data, self.file_name,
+                          'Altitude', ('12:00:10', '12:00:20'),
+                          index='no_such_file.idx')
+        DATA = open(self.file_name, 'a')
+        DATA.write('13:00:00\t0\t0\t\n')
+        DATA.close()
+        self.assertRaises(ValueError, DF.grab_data, self.file_name,
+                          'Altitude', ('12:00:10', '12:00:20'), index=True)
+
+    def test_05(self):
+
+        # an index that was already loaded is rejected once the data file 
+        # changes, here by rewriting it with a longer header
+
+        DF.grab_data(self.file_name, 'Altitude', ('12:00:10', '12:00:20'),
+                     index=True)
+        DATA = open(self.file_name)
+        lines = DATA.readlines()
+        DATA.close()
+        DATA = open(self.file_name, 'w')
+        DATA.writelines(['Test flight, with a longer title\n'] + lines[1:])
+        DATA.close()
+        self.assertRaises(ValueError, DF.grab_data, self.file_name,
+                          'Altitude', ('12:00:10', '12:00:20'), index=True)
+
+class Test_grab_stats(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file(rows=200)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_01(self):
+
+        # one record per time slice and column, matching grab_data
+
+        time_slices = [('12:01:00', '12:01:30'), ('12:00:00', '12:00:10')]
+        Value = DF.grab_stats(self.file_name, ['Altitude', 'IAS'],
+                              time_slices)
+        self.assertEqual(list(Value.slice), [0, 0, 1, 1])
+        self.assertEqual(list(Value.column), ['Altitude', 'IAS'] * 2)
+        for record in Value:
+            (ave, min_val, max_val) = DF.grab_data(self.file_name,
+                    record.column, time_slices[record.slice], min_max=True)
+            self.assertAlmostEqual(record.ave, ave)
+            self.assertEqual(record.min_val, min_val)
+            self.assertEqual(record.max_val, max_val)
+
+    def test_02(self):
+
+        # blank values are counted as incomplete
+
+        Value = DF.grab_stats(self.file_name, ['IAS'], [('12:00:00',
+                              '12:00:10')])
+        self.assertEqual(Value.count[0], 10)
+        self.assertEqual(Value.incomplete[0], 1)
+
+    def test_03(self):
+
+        # overlapping time slices, and standard deviation
+
+        Value = DF.grab_stats(self.file_name, ['Altitude'],
+                              [('12:00:20', '12:00:24'), ('12:00:22',
+                              '12:00:26')], index=DF.build_index(self.file_name,
+                              every=3))
+        os.remove(DF.index_name(self.file_name))
+        self.assertEqual(list(Value.count), [5, 5])
+        self.assertEqual(Value.ave[1], 1240.)
+        self.assertAlmostEqual(Value.std_dev[0], 10 * 2 ** 0.5)
+
+    def test_04(self):
+
+        # time slice with no data, and an unknown column
+
+        Value = DF.grab_stats(self.file_name, ['Altitude'], [('13:00:00',
+                              '13:00:10')])
+        self.assertEqual(Value.count[0], 0)
+        self.assertTrue(Value.ave[0] != Value.ave[0])
+        self.assertRaises(ValueError, DF.grab_stats, self.file_name,
+                          ['Airspeed'], [('12:00:00', '12:00:10')])
+
+class Test_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file(rows=50)
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        os.remove(self.file_name)
+        for name in os.listdir(self.cache_dir):
+            os.remove(os.path.join(self.cache_dir, name))
+        os.rmdir(self.cache_dir)
+
+    def test_01(self):
+
+        # the cached records match the parsed records, and are memory mapped
+
+        Truth = DF.load_array(self.file_name)
+        DF.load_array(self.file_name, cache=self.cache_dir)
+        Value = DF.load_array(self.file_name, cache=self.cache_dir)
+        self.assertTrue(isinstance(Value.base, N.memmap))
+        self.assertEqual(Value.dtype, Truth.dtype)
+        self.assertEqual(list(Value.IAS), list(Truth.IAS))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_02(self):
+
+        # changes to the records are not written back to the cache
+
+        Value = DF.load_array(self.file_name, cache=self.cache_dir)
+        Value.Altitude[0] = -1.
+        Value = DF.load_array(self.file_name, cache=self.cache_dir)
+        self.assertEqual(Value.Altitude[0], 1000.)
+
+    def test_03(self):
+
+        # different arguments have separate cache files
+
+        DF.load_array(self.file_name, cache=self.cache_dir)
+        Value = DF.load_array(self.file_name, cache=self.cache_dir,
+                              time_slice=('12:00:10', '12:00:20'))
+        self.assertTrue(len(Value) < 50)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_04(self):
+
+        # a changed data file is parsed again, and the old cache removed
+
+        DF.load_array(self.file_name, cache=self.cache_dir)
+        DATA = open(self.file_name, 'a')
+        DATA.write('12:00:50\t1500\t150\t\n')
+        DATA.close()
+        Value = DF.load_array(self.file_name, cache=self.cache_dir)
+        self.assertEqual(len(Value), 51)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+class Test_numpy_engine(unittest.TestCase):
+
+    def setUp(self):
+        self.file_name = make_data_file(rows=100)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_01(self):
+
+        # numbers match the python engine, with blanks as nan by default,
+        # rather than 0.0
+
+        Value = DF.load_array(self.file_name, engine='numpy')
+        Truth = DF.load_array(self.file_name)
+        self.assertEqual(list(Value.Altitude), list(Truth.Altitude))
+        self.assertTrue(N.isnan(Value.IAS[3]))
+        self.assertEqual(Truth.IAS[3], 0.)
+        Value.IAS[3] = 0.
+        self.assertEqual(list(Value.IAS), list(Truth.IAS))
+
+    def test_02(self):
+
+        # blanks may be 0.0 or nan, in either engine
+
+        for engine in ('python', 'numpy'):
+            Value = DF.load_array(self.file_name, engine=engine,
+                                  blank=float('nan'))
+            self.assertTrue(N.isnan(Value.IAS[3]))
+            self.assertEqual(Value.IAS[4], 104.)
+            Value = DF.load_array(self.file_name, engine=engine, blank=0.)
+            self.assertEqual(Value.IAS[3], 0.)
+
+    def test_03(self):
+
+        # times are converted to seconds
+
+        Value = DF.load_array(self.file_name, engine='numpy')
+        self.assertEqual(Value.Time[0], 12 * 3600.)
+        self.assertEqual(Value.Time[99], 12 * 3600. + 99)
+
+    def test_04(self):
+
+        # the time slice includes both ends
+
+        Value = DF.load_array(self.file_name, engine='numpy',
+                              time_slice=('12:00:30', '12:01:10'))
+        self.assertEqual(len(Value), 41)
+        self.assertEqual(Value.Altitude[0], 1300.)
+
+    def test_05(self):
+
+        # the engines return the same records for a time slice, including
+        # the record at the start time
+
+        for time_slice in (('12:00:05', '12:00:10'), ('12:00:00', ''),
+                           ('', '12:00:03'), ('12:01:30', '12:09:00')):
+            Value = DF.load_array(self.file_name, engine='numpy',
+                                  time_slice=time_slice, blank=0.)
+            Truth = DF.load_array(self.file_name, time_slice=time_slice)
+            self.assertEqual(list(Value.Altitude), list(Truth.Altitude))
+            self.assertEqual(list(Value.IAS), list(Truth.IAS))
+
+    def test_06(self):
+
+        # text columns, and a column that is not always numbers
+
+        DATA = open(self.file_name, 'a')
+        DATA.write('12:01:40\tsensor fail\t140\t\n')
+        DATA.close()
+        self.assertRaises(ValueError, DF.load_array, self.file_name,
+                          engine='numpy')
+        self.assertRaises(ValueError, DF.load_array, self.file_name,
+                          engine='fortran')
+
+    def test_07(self):
+
+        # runs of blanks, and blanks in the last column, match the python 
+        # engine
+
+        nan = float('nan')
+        for sep in ('\t', ','):
+            DATA = open(self.file_name, 'w')
+            DATA.write('Test flight\n\n')
+            for row in (['Time', 'A', 'B', 'C', 'D'], ['', 'ft', 'kt', '',
+                        ''], ['12:00:00', '1', '', '', '4'], ['12:00:01',
+                        '', '', '', ''], ['12:00:02', '5', '6', '7', '8']):
+                DATA.write(sep.join(row) + sep + '\n')
+            DATA.close()
+            Value = DF.load_array(self.file_name, engine='numpy',
+                                  record_sep=sep)
+            Truth = DF.load_array(self.file_name, record_sep=sep,
+                                  blank=nan)
+            for name in ('A', 'B', 'C', 'D'):
+                self.assertTrue(N.array_equal(Value.field(name),
+                                Truth.field(name), equal_nan=True))
+            self.assertEqual(Value.D[0], 4.)
+            self.assertTrue(N.isnan(Value.D[1]))
+
+class Test_load_many(unittest.TestCase):
+
+    def setUp(self):
+        self.file_names = [make_data_file(rows=20), make_data_file(rows=30)]
+
+    def tearDown(self):
+        for file_name in self.file_names:
+            os.remove(file_name)
+
+    def test_01(self):
+
+        # one records array per file, in order, and the report
+
+        (Value, report) = DF.load_many(self.file_names, workers=1)
+        self.assertEqual([len(data) for data in Value], [20, 30])
+        self.assertEqual(list(Value[1].Altitude),
+                         list(DF.load_array(self.file_names[1]).Altitude))
+        self.assertEqual(list(report.source), self.file_names)
+        self.assertEqual(list(report.rows), [20, 30])
+        self.assertTrue(min(report.seconds) >= 0.)
+
+    def test_02(self):
+
+        # concatenated, with the source file of each record
+
+        (Value, report) = DF.load_many(self.file_names, workers=1,
+                                       concatenate=True, engine='numpy')
+        self.assertEqual(len(Value), 50)
+        self.assertEqual(Value.dtype.names, ('Time', 'Altitude', 'IAS',
+                         'source'))
+        self.assertEqual(Value.source[19], self.file_names[0])
+        self.assertEqual(Value.source[20], self.file_names[1])
+        self.assertEqual(Value.Altitude[20], 1000.)
+
+    def test_03(self):
+
+        # in a pool of processes, with a time slice
+
+        (Value, report) = DF.load_many(self.file_names, workers=2,
+                                       time_slice=('12:00:05', '12:00:14'))
+        Truth = DF.load_array(self.file_names[0],
+                              time_slice=('12:00:05', '12:00:14'))
+        self.assertEqual(list(report.rows), [len(Truth)] * 2)
+        self.assertEqual(list(Value[1].Time), list(Truth.Time))
+
+    def test_04(self):
+
+        # files with different columns can not be concatenated
+
+        DATA = open(self.file_names[1], 'w')
+        DATA.write('Test flight\n\nTime\tAltitude\t\n\tft\t\n12:00:00\t1000\t\n')
+        DATA.close()
+        self.assertRaises(ValueError, DF.load_many, self.file_names,
+                          workers=1, concatenate=True)
+
+class Test_results_store(unittest.TestCase):
+
+    def setUp(self):
+        self.store = os.path.join(tempfile.mkdtemp(), 'results')
+
+    def tearDown(self):
+        for name in os.listdir(self.store):
+            os.remove(os.path.join(self.store, name))
+        os.rmdir(self.store)
+        os.rmdir(os.path.dirname(self.store))
+
+    def test_01(self):
+
+        # appends, with single values repeated for each row
+
+        self.assertEqual(DF.append_results(self.store, {'point': 1,
+                         'CAS': N.array([100., 110.]), 'test': ['a', 'bb']}),
+                         2)
+        self.assertEqual(DF.append_results(self.store, {'test': 'c',
+                         'point': 2, 'CAS': 120}), 3)
+        Value = DF.load_results(self.store)
+        self.assertEqual(Value.dtype.names, ('point', 'CAS', 'test'))
+        self.assertEqual(list(Value.point), [1, 1, 2])
+        self.assertEqual(list(Value.CAS), [100., 110., 120.])
+        self.assertEqual(list(Value.test), ['a', 'bb', 'c'])
+
+    def test_02(self):
+
+        # partial column and row reads
+
+        DF.append_results(self.store, {'point': N.arange(10),
+                          'CAS': N.arange(10) * 10.})
+        Value = DF.load_results(self.store, ['CAS'], (-3, None))
+        self.assertEqual(Value.dtype.names, ('CAS', ))
+        self.assertEqual(list(Value.CAS), [70., 80., 90.])
+        self.assertEqual(len(DF.load_results(self.store, rows=(20, 30))), 0)
+        self.assertRaises(ValueError, DF.load_results, self.store, ['EAS'])
+
+    def test_03(self):
+
+        # records arrays can be appended, and loaded records appended again
+
+        DF.append_results(self.store, N.rec.fromrecords([(1, 100.), (2,
+                          110.)], names='point,CAS'))
+        DF.append_results(self.store, DF.load_results(self.store))
+        self.assertEqual(list(DF.load_results(self.store).point), [1, 2, 1,
+                         2])
+
+    def test_04(self):
+
+        # rows past the schema row count, from an unfinished append, are 
+        # not read, and are replaced by the next append
+
+        DF.append_results(self.store, {'point': 1, 'CAS': 100.})
+        COLUMN = open(os.path.join(self.store, 'col1.bin'), 'ab')
+        COLUMN.write(N.array([999.]).tobytes())
+        COLUMN.close()
+        self.assertEqual(len(DF.load_results(self.store)), 1)
+        DF.append_results(self.store, {'point': 2, 'CAS': 110.})
+        self.assertEqual(list(DF.load_results(self.store).CAS), [100., 110.])
+
+    def test_05(self):
+
+        # different columns, types that do not fit, and longer strings
+
+        DF.append_results(self.store, {'point': 1, 'test': 'ab'})
+        self.assertRaises(ValueError, DF.append_results, self.store,
+                          {'point': 2})
+        self.assertRaises(ValueError, DF.append_results, self.store,
+                          {'point': 2.5, 'test': 'c'})
+        self.assertRaises(ValueError, DF.append_results, self.store,
+                          {'point': 2, 'test': 'abc'})
+        self.assertRaises(ValueError, DF.append_results, self.store,
+                          {'point': [1, 2, 3], 'test': ['a', 'b']})
+        self.assertRaises(ValueError, DF.load_results, self.store + 'x')
+
+
+# create test suites
+
+main_suite = unittest.TestSuite()
+suite1 = unittest.makeSuite(Test_load_chunks)
+suite2 = unittest.makeSuite(Test_index)
+suite3 = unittest.makeSuite(Test_grab_stats)
+suite4 = unittest.makeSuite(Test_cache)
+suite5 = unittest.makeSuite(Test_numpy_engine)
+suite6 = unittest.makeSuite(Test_load_many)
+suite7 = unittest.makeSuite(Test_results_store)
+suite8 = unittest.makeSuite(Test_load_array)
+
+# add suites to main test suite
+
+main_suite.addTest(suite1)
+main_suite.addTest(suite2)
+main_suite.addTest(suite3)
+main_suite.addTest(suite4)
+main_suite.addTest(suite5)
+main_suite.addTest(suite6)
+main_suite.addTest(suite7)
+main_suite.addTest(suite8)
+
+# run main test suite
+# if we run the main test suite, we get a line for each test, plus any
+# tracebacks from failures.
+
+unittest.TextTestRunner(verbosity=5).run(main_suite)
+
+# if we run unittest.main(), we get just a single line of output, plus any
+# tracebacks from failures.
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Test cases for interpolator module.
+Run this script directly to do all the tests.
+"""
+
+import unittest
+import sys
+
+# It is assumed that interpolator.py is in the directory directly above
+
+sys.path.append('../')
+import interpolator as I
+import numpy as N
+
+
+class Test_GridInterpolator(unittest.TestCase):
+
+    def setUp(self):
+        self.axes = [N.linspace(0., 1., 6), N.linspace(-2., 2., 9),
+                     [0.5, 0.6, 0.8, 0.9]]
+
+        # a function that is linear in each coordinate, so multilinear
+        # interpolation is exact
+
+        (x, y, z) = N.meshgrid(*self.axes, indexing='ij')
+        self.values = 1. + 2. * x - 3. * y + 5. * z + x * y * z
+
+    def truth(self, x, y, z):
+        return 1. + 2. * x - 3. * y + 5. * z + x * y * z
+
+    def test_01(self):
+
+        # single points match the existing three dimensional interpolation
+
+        grid = I.GridInterpolator(self.axes, self.values)
+        for (x, y, z) in ((0.1, -1.9, 0.55), (0.95, 1.3, 0.88),
+                          (0.4, 0., 0.6)):
+            self.assertAlmostEqual(grid(x, y, z), self.truth(x, y, z))
+
+        x = [13000, 13500]
+        y = [10, 20]
+        z = [90, 95]
+        v = [[[2000, 2500], [2200, 2700]], [[3000, 3500], [3200, 3700]]]
+        grid = I.GridInterpolator([x, y, z], N.transpose(v))
+        self.assertAlmostEqual(grid(13100, 12, 91),
+                               I.interpolate3(x, y, z, v, 13100, 12, 91))
+
+    def test_02(self):
+
+        # arrays of points, broadcast against each other
+
+        grid = I.GridInterpolator(self.axes, self.values)
+        x = N.linspace(0., 1., 7)
+        Value = grid(x[:, None], N.array([-1.5, 0.3, 1.7]), 0.7)
+        self.assertEqual(Value.shape, (7, 3))
+        Truth = self.truth(x[:, None], N.array([-1.5, 0.3, 1.7]), 0.7)
+        self.assertTrue(N.allclose(Value, Truth))
+        self.assertEqual(grid(x, 0., 0.5)[3], grid(float(x[3]), 0., 0.5))
+
+    def test_03(self):
+
+        # points outside the grid
+
+        points = (N.array([-0.5, 0.5, 1.5]), 0., 0.5)
+        Value = I.GridInterpolator(self.axes, self.values)(*points)
+        self.assertTrue(N.allclose(Value, self.truth(N.array([0., 0.5, 1.]),
+                        0., 0.5)))
+        Value = I.GridInterpolator(self.axes, self.values,
+                                   bounds='extrapolate')(*points)
+        self.assertTrue(N.allclose(Value, self.truth(points[0], 0., 0.5)))
+        Value = I.GridInterpolator(self.axes, self.values, bounds='nan')(*points)
+        self.assertEqual(list(N.isnan(Value)), [True, False, True])
+        self.assertTrue(N.isnan(I.GridInterpolator(self.axes, self.values,
+                        bounds='nan')(0.5, 2.5, 0.6)))
+
+    def test_04(self):
+
+        # one dimension, and the bad input checks
+
+        grid = I.GridInterpolator([[0., 1., 3.]], [0., 10., 50.])
+        self.assertEqual(grid(2.), 30.)
+        self.assertRaises(ValueError, I.GridInterpolator, [[0., 1.]], [1.,
+                          2., 3.])
+        self.assertRaises(ValueError, I.GridInterpolator, [[1., 0.]], [1.,
+                          2.])
+        self.assertRaises(ValueError, I.GridInterpolator, [[0., 1.]], [1.,
+                          2.], bounds='wrap')
+        self.assertRaises(ValueError, grid, 1., 2.)
+
+class Test_GridInterpolator_cubic(unittest.TestCase):
+
+    def test_01(self):
+
+        # all methods pass through the grid points, and are exact for 
+        # functions that are linear in each coordinate
+
+        axes = [N.linspace(0., 1., 4), N.linspace(0., 2., 5),
+                [0., 0.3, 0.5, 0.9, 1.]]
+        (x, y, z) = N.meshgrid(*axes, indexing='ij')
+        for method in ('natural', 'akima', 'pchip'):
+            values = N.sin(x) + y * z ** 2
+            grid = I.GridInterpolator(axes, values, method=method)
+            self.assertTrue(N.allclose(grid(x, y, z), values))
+            values = 1. + 2. * x - y + 3. * z + x * y * z
+            grid = I.GridInterpolator(axes, values, method=method)
+            self.assertAlmostEqual(grid(0.2, 1.3, 0.7), 1. + 0.4 - 1.3 + 2.1 +
+                                   0.2 * 1.3 * 0.7)
+
+    def test_02(self):
+
+        # natural spline, with zero second derivative at the ends and
+        # continuous slope at the grid points
+
+        x = [0., 1., 2.5, 3., 4.5, 6.]
+        grid = I.GridInterpolator([x], N.sin(x), method='natural')
+        step = 1e-4
+        second = (grid(2 * step) - 2 * grid(step) + grid(0.)) / step ** 2
+        self.assertTrue(abs(second) < 1e-3)
+        slopes = (grid(N.array(x[1:-1]) + step) - grid(N.array(x[1:-1]) -
+                  step)) / (2 * step)
+        self.assertTrue(N.allclose(slopes, (grid(N.array(x[1:-1]) + 2 *
+                        step) - grid(N.array(x[1:-1]) - 2 * step)) / (4 *
+                        step), atol=1e-6))
+
+    def test_03(self):
+
+        # pchip is monotone and does not overshoot, and akima overshoots 
+        # less than the natural spline
+
+        x = [0., 1., 2., 3., 4., 5.]
+        y = [0., 0., 0.1, 5., 5.1, 5.1]
+        points = N.linspace(0., 5., 501)
+        Value = I.GridInterpolator([x], y, method='pchip')(points)
+        self.assertTrue(N.all(N.diff(Value) >= 0.))
+        self.assertTrue(Value.min() >= 0. and Value.max() <= 5.1)
+        akima = I.GridInterpolator([x], y, method='akima')(points)
+        natural = I.GridInterpolator([x], y, method='natural')(points)
+        self.assertTrue(akima.max() - 5.1 < natural.max() - 5.1)
+
+    def test_04(self):
+
+        # a separable function in two dimensions, with the natural spline, 
+        # is the product of the one dimensional splines
+
+        axes = [N.linspace(0., 3., 5), [0., 0.5, 1.5, 2., 3.5]]
+        f = N.exp(-axes[0])
+        g = N.cos(axes[1])
+        grid = I.GridInterpolator(axes, N.outer(f, g), method='natural')
+        x = N.array([0.1, 1.7, 2.9])
+        y = N.array([3.4, 0.2, 1.1])
+        Truth = I.GridInterpolator([axes[0]], f, method='natural')(x) * \
+            I.GridInterpolator([axes[1]], g, method='natural')(y)
+        self.assertTrue(N.allclose(grid(x, y), Truth))
+
+    def test_05(self):
+
+        # the bounds work the same as for linear interpolation, and an 
+        # unknown method
+
+        grid = I.GridInterpolator([[0., 1., 2.]], [0., 1., 4.],
+                                  method='natural', bounds='nan')
+        self.assertTrue(N.isnan(grid(2.5)))
+        grid = I.GridInterpolator([[0., 1., 2.]], [0., 1., 4.],
+                                  method='natural')
+        self.assertEqual(grid(2.5), 4.)
+        self.assertRaises(ValueError, I.GridInterpolator, [[0., 1.]], [0.,
+                          1.], method='quintic')
+
+class Test_interpolate(unittest.TestCase):
+
+    def test_01(self):
+
+        # two points, as before, including extrapolation
+
+        self.assertEqual(I.interpolate([13000, 13500], [2000, 2500], 13100),
+                         2100.)
+        self.assertEqual(I.interpolate([13000, 13500], [2000, 2500], 14000),
+                         3000.)
+        self.assertEqual(I.interpolate([13500, 13000], [2500, 2000], 13100),
+                         2100.)
+
+    def test_02(self):
+
+        # whole tables, increasing and decreasing
+
+        x = [0, 1000, 2000, 4000]
+        y = [100, 90, 85, 75]
+        self.assertEqual(I.interpolate(x, y, 3000), 80.)
+        self.assertEqual(I.interpolate(x, y, 1000), 90.)
+        self.assertEqual(I.interpolate(x, y, -1000), 110.)
+        self.assertEqual(I.interpolate(x[::-1], y[::-1], 3000), 80.)
+        self.assertEqual(I.interpolate(N.array(x), N.array(y), 4500), 72.5)
+
+    def test_03(self):
+
+        # arrays of x1 match single values, and numpy's interp inside the 
+        # table
+
+        x = N.linspace(0., 10., 101)
+        y = N.sin(x)
+        x1 = N.array([0., 0.05, 3.33, 9.99, 10.])
+        Value = I.interpolate(x, y, x1)
+        self.assertTrue(N.allclose(Value, N.interp(x1, x, y)))
+        self.assertEqual(Value[2], I.interpolate(list(x), list(y), 3.33))
+        Value = I.interpolate(x[::-1], y[::-1], x1.reshape(5, 1))
+        self.assertEqual(Value.shape, (5, 1))
+        self.assertTrue(N.allclose(Value.ravel(), N.interp(x1, x, y)))
+
+    def test_04(self):
+
+        # arrays in two and three dimensional interpolation
+
+        x = [13000, 13500]
+        y = [10, 20]
+        z = [90, 95]
+        v = [[[2000, 2500], [2200, 2700]], [[3000, 3500], [3200, 3700]]]
+        Value = I.interpolate3(x, y, z, v, N.array([13100, 13250]),
+                               N.array([12, 15]), N.array([91, 92.5]))
+        self.assertTrue(N.allclose(Value, [2340., 2850.]))
+        self.assertRaises(ValueError, I.interpolate, [1, 2, 3], [1, 2], 1.5)
+        self.assertRaises(ValueError, I.interpolate, [1], [1], 1.5)
+
+
+# create test suites
+
+main_suite = unittest.TestSuite()
+suite1 = unittest.makeSuite(Test_GridInterpolator)
+suite2 = unittest.makeSuite(Test_GridInterpolator_cubic)
+suite3 = unittest.makeSuite(Test_interpolate)
+
+# add suites to main test suite
+
+main_suite.addTest(suite1)
+main_suite.addTest(suite2)
+main_suite.addTest(suite3)
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(main_suite)
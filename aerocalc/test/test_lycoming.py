@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Test cases for the Lycoming io360a and o360a modules.
+Run this script directly to do all the tests.
+"""
+
+import unittest
+import sys
+import itertools
+
+# It is assumed that the Lycoming modules are in engine/lycoming, below the
+# directory directly above
+
+sys.path.append('../')
+sys.path.append('../engine/lycoming')
+import io360a
+import o360a
+import numpy as N
+
+
+def RE(value, truth):
+    """ Returns the absolute value of the relative error.
+    """
+
+    return abs((value - truth) / truth)
+
+
+# rpms at and between the table rows, including the O-360's 2000 to 2400
+# rpm bracket, and MPs either side of the IO-360's slope clamp above 28"
+
+RPMS = [1800, 2000, 2100, 2200, 2300, 2400, 2500, 2600, 2650, 2700]
+MPS = [12, 20.5, 28, 28.5, 29, 30]
+ALTS = [0, 5000, 12000]
+
+
+class Test_pwr_arrays(unittest.TestCase):
+
+    def setUp(self):
+        points = list(itertools.product(RPMS, MPS, ALTS))
+        (self.rpm, self.MP, self.alt) = [N.array(values, dtype=float)
+                for values in zip(*points)]
+
+    def check(self, engine, temp='std'):
+        Value = engine.pwr(self.rpm, self.MP, self.alt, temp=temp)
+        if isinstance(temp, str):
+            temps = ['std'] * len(self.rpm)
+        else:
+            temps = N.broadcast_to(temp, self.rpm.shape)
+        for (i, (rpm, MP, alt)) in enumerate(zip(self.rpm, self.MP,
+                self.alt)):
+            Truth = engine.pwr(rpm, MP, alt, temp=temps[i])
+            self.assertTrue(RE(Value[i], Truth) <= 1e-12, (rpm, MP, alt,
+                            Value[i], Truth))
+
+    def test_01(self):
+
+        # IO-360 arrays match single values at the table edges
+
+        self.check(io360a)
+
+    def test_02(self):
+
+        # O-360 arrays match single values at the table edges
+
+        self.check(o360a)
+
+    def test_03(self):
+
+        # arrays of temperatures
+
+        self.check(io360a, N.linspace(-30., 35., len(self.rpm)))
+        self.check(o360a, N.linspace(-30., 35., len(self.rpm)))
+
+    def test_04(self):
+
+        # lists give the same powers as arrays, and arrays broadcast
+        # against single values
+
+        for engine in (io360a, o360a):
+            Value = engine.pwr(list(self.rpm), list(self.MP),
+                               list(self.alt))
+            Truth = engine.pwr(self.rpm, self.MP, self.alt)
+            self.assertTrue(N.array_equal(Value, Truth))
+            Value = engine.pwr(N.array(RPMS, dtype=float), 28.5, 8000)
+            for (i, rpm) in enumerate(RPMS):
+                self.assertTrue(RE(Value[i], engine.pwr(rpm, 28.5, 8000))
+                                <= 1e-12)
+
+
+# create test suites
+
+main_suite = unittest.TestSuite()
+suite1 = unittest.makeSuite(Test_pwr_arrays)
+
+# add suites to main test suite
+
+main_suite.addTest(suite1)
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(main_suite)
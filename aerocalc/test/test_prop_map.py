@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Test cases for prop_map module.
+Run this script directly to do all the tests.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import shutil
+import tempfile
+
+# It is assumed that prop_map.py is in the personal directory, below the
+# directory directly above
+
+sys.path.append('../')
+sys.path.append('../personal')
+import prop_map as P
+import numpy as N
+
+PROP = '7666-2RV'
+MACHS = [0.5, 0.65, 0.8, 0.95]
+CPS = [0.02, 0.05, 0.08, 0.11, 0.14, 0.17, 0.2]
+JS = [0.2, 0.5, 0.8, 1.1, 1.4, 1.7]
+
+
+def ct_value(mach, Cp, J):
+    return round(0.1 + 0.9 * Cp - 0.04 * J * J - 0.01 * mach, 6)
+
+
+def blade_angle_value(mach, Cp, J):
+    return round(10. + 80. * Cp + 12. * J + 3. * J * J + 2. * mach, 6)
+
+
+def eff_value(mach, Cp, J):
+    return round(0.3 + 0.4 * J - 0.15 * J * J - Cp - 0.05 * mach, 6)
+
+
+def write_map_file(base_path, mach, scale=1.):
+    """ Write a prop map csv file for one tip mach number, in the Hartzell
+    layout, with the thrust coefficient, blade angle and efficiency blocks,
+    each with a row of J values, then one row per Cp.  The thrust
+    coefficients are multiplied by scale.
+    """
+
+    lines = ['Hartzell %s Tip Mach %.2f' % (PROP, mach), '']
+    for (title, value, factor) in (('THRUST COEFFICIENT', ct_value, scale),
+                                   ('BLADE ANGLE', blade_angle_value, 1.),
+                                   ('EFFICIENCY', eff_value, 1.)):
+        lines.append(title)
+        lines.append(','.join(['CP / J'] + [str(J) for J in JS]))
+        for Cp in CPS:
+            lines.append(','.join([str(Cp)] + [str(value(mach, Cp, J)
+                         * factor) for J in JS]))
+        lines.append('')
+    FILE = open(os.path.join(base_path, '%s_%.2f.csv' % (PROP, mach)), 'w')
+    FILE.write('\n'.join(lines))
+    FILE.close()
+
+
+def make_map_dir():
+    """ Write a set of prop map csv files in a temporary directory, and
+    return the directory name.
+    """
+
+    base_path = tempfile.mkdtemp()
+    for mach in MACHS:
+        write_map_file(base_path, mach)
+
+    return base_path
+
+
+class Test_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.base_path = make_map_dir()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path)
+
+    def map_files(self):
+        return sorted([name for name in os.listdir(self.base_path)
+                      if name.endswith('.npy')])
+
+    def test_01(self):
+
+        # the csv files are parsed into maps of tip mach, Cp and J
+
+        prop = P.Prop(PROP, self.base_path, cache=False)
+        self.assertEqual(prop.dia, 74)
+        self.assertEqual(prop.prop_CT_map.shape, (len(MACHS), len(CPS)
+                         + 1, len(JS) + 1))
+        self.assertEqual(list(prop.prop_CT_map[:, 0, 0]), MACHS)
+        self.assertEqual(list(prop.prop_CT_map[0, 1:, 0]), CPS)
+        self.assertEqual(list(prop.prop_CT_map[0, 0, 1:]), JS)
+        self.assertEqual(prop.prop_CT_map[2, 3, 4], ct_value(MACHS[2],
+                         CPS[2], JS[3]))
+        self.assertEqual(prop.blade_angle_map[2, 3, 4],
+                         blade_angle_value(MACHS[2], CPS[2], JS[3]))
+        self.assertEqual(prop.prop_eff_map[2, 3, 4], eff_value(MACHS[2],
+                         CPS[2], JS[3]))
+        self.assertEqual(self.map_files(), [])
+
+    def test_02(self):
+
+        # the second prop is loaded from the cache, as memory mapped maps
+
+        Truth = P.Prop(PROP, self.base_path, cache=False)
+        P.Prop(PROP, self.base_path)
+        self.assertEqual(len(self.map_files()), 3)
+        Value = P.Prop(PROP, self.base_path)
+        for name in ('prop_CT_map', 'blade_angle_map', 'prop_eff_map'):
+            self.assertTrue(isinstance(getattr(Value, name), N.memmap))
+            self.assertTrue(N.array_equal(getattr(Value, name),
+                            getattr(Truth, name)))
+        self.assertEqual(Value.dia, Truth.dia)
+        self.assertEqual(Value.Ct_Cp_max, Truth.Ct_Cp_max)
+
+    def test_03(self):
+
+        # the cache is rebuilt when a csv file changes
+
+        P.Prop(PROP, self.base_path)
+        write_map_file(self.base_path, MACHS[1], scale=2.)
+        file_name = os.path.join(self.base_path, '%s_%.2f.csv' % (PROP,
+                                 MACHS[1]))
+        stat = os.stat(file_name)
+        os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns
+                 + 10 ** 9))
+        Value = P.Prop(PROP, self.base_path)
+        self.assertEqual(Value.prop_CT_map[1, 3, 4], 2. * ct_value(MACHS[1],
+                         CPS[2], JS[3]))
+        self.assertEqual(P.Prop(PROP, self.base_path).prop_CT_map[1, 3, 4],
+                         Value.prop_CT_map[1, 3, 4])
+
+    def test_04(self):
+
+        # a missing or partial map file is parsed from the csv files again
+
+        Truth = P.Prop(PROP, self.base_path, cache=False)
+        P.Prop(PROP, self.base_path)
+        map_files = [os.path.join(self.base_path, name) for name in
+                     self.map_files()]
+        os.remove(map_files[0])
+        Value = P.Prop(PROP, self.base_path)
+        self.assertTrue(N.array_equal(Value.prop_CT_map, Truth.prop_CT_map))
+        self.assertTrue(os.path.exists(map_files[0]))
+
+        FILE = open(map_files[1], 'rb')
+        data = FILE.read()
+        FILE.close()
+        FILE = open(map_files[1], 'wb')
+        FILE.write(data[:len(data) // 2])
+        FILE.close()
+        Value = P.Prop(PROP, self.base_path)
+        self.assertTrue(N.array_equal(Value.blade_angle_map,
+                        Truth.blade_angle_map))
+        self.assertTrue(N.array_equal(Value.prop_eff_map,
+                        Truth.prop_eff_map))
+
+    def test_05(self):
+
+        # a prop is pickled by name, and unpickled with get_prop
+
+        prop = P.get_prop(PROP, self.base_path)
+        data = pickle.dumps(prop)
+        self.assertTrue(len(data) < 1000)
+        self.assertTrue(pickle.loads(data) is prop)
+        Value = pickle.loads(pickle.dumps(P.Prop(PROP, self.base_path)))
+        self.assertTrue(Value is P.get_prop(PROP, self.base_path))
+        del P._props[(PROP, self.base_path)]
+
+    def test_06(self):
+
+        # the maps are found from prop_map_path
+
+        prop_map_path = P.prop_map_path
+        P.prop_map_path = [os.path.join(self.base_path, 'empty'),
+                           self.base_path]
+        try:
+            prop = P.Prop(PROP)
+        finally:
+            P.prop_map_path = prop_map_path
+        self.assertEqual(prop.base_path, self.base_path)
+
+class Test_maps(unittest.TestCase):
+
+    def setUp(self):
+        self.base_path = make_map_dir()
+        self.prop = P.Prop(PROP, self.base_path, cache=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path)
+
+    def test_01(self):
+
+        # cp2ct and pull_Ct_data_point return the thrust coefficient, not
+        # the blade angle
+
+        for (mach, Cp, J) in ((0.5, 0.02, 0.2), (0.8, 0.11, 1.1), (0.95,
+                              0.2, 1.7)):
+            Truth = ct_value(mach, Cp, J)
+            self.assertEqual(P.pull_Ct_data_point(self.prop, mach, J, Cp),
+                             Truth)
+            self.assertAlmostEqual(P.cp2ct(self.prop, Cp, J, mach), Truth,
+                                   12)
+            self.assertAlmostEqual(P.cp2blade_angle(self.prop, Cp, J,
+                                   mach), blade_angle_value(mach, Cp, J),
+                                   10)
+            self.assertAlmostEqual(P.cp2eff(self.prop, Cp, J, mach),
+                                   eff_value(mach, Cp, J), 12)
+
+    def test_02(self):
+
+        # arrays give the same values as single points
+
+        Cp = N.array([0.03, 0.09, 0.155])
+        J = N.array([0.35, 0.9, 1.65])
+        mach = N.array([0.55, 0.7, 0.9])
+        Value = P.cp2ct(self.prop, Cp, J, mach)
+        for i in range(3):
+            self.assertAlmostEqual(Value[i], P.cp2ct(self.prop, Cp[i],
+                                   J[i], mach[i]), 14)
+
+    def test_03(self):
+
+        # blade_angle2cp inverts cp2blade_angle exactly, inside the map
+
+        Cp = N.linspace(0.021, 0.199, 40)
+        J = N.linspace(0.25, 1.65, 40)
+        mach = N.linspace(0.93, 0.52, 40)
+        angle = P.cp2blade_angle(self.prop, Cp, J, mach)
+        Value = P.blade_angle2cp(self.prop, angle, J, mach)
+        self.assertTrue(N.max(N.abs(Value - Cp)) <= 1e-12)
+        self.assertAlmostEqual(P.blade_angle2cp(self.prop, angle[7], J[7],
+                               mach[7]), Cp[7], 12)
+
+class Test_prop_surface(unittest.TestCase):
+
+    def setUp(self):
+        self.base_path = make_map_dir()
+        self.prop = P.Prop(PROP, self.base_path, cache=False)
+        self.axes = ([100., 130., 160.], [2300., 2500., 2700.], [100.,
+                     140., 180.], [0., 4000., 8000.])
+        self.surface = P.prop_surface(self.prop, *self.axes)
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path)
+
+    def test_01(self):
+
+        # the surface matches prop_eff and blade_angle at the grid nodes
+
+        for (tas, rpm, bhp, alt) in ((100., 2300., 100., 0.), (130.,
+                                     2500., 180., 4000.), (160., 2700.,
+                                     140., 8000.)):
+            self.assertAlmostEqual(self.surface.eff(tas, rpm, bhp, alt),
+                                   P.prop_eff(self.prop, bhp, rpm, tas,
+                                   alt), 12)
+            self.assertAlmostEqual(self.surface.blade_angle(tas, rpm, bhp,
+                                   alt), P.blade_angle(self.prop, bhp,
+                                   rpm, tas, alt), 10)
+
+    def test_02(self):
+
+        # save and load_prop_surface give the same surface
+
+        (handle, file_name) = tempfile.mkstemp(suffix='.npz')
+        os.close(handle)
+        try:
+            self.surface.save(file_name)
+            Value = P.load_prop_surface(file_name)
+        finally:
+            os.remove(file_name)
+        self.assertEqual(Value.prop, PROP)
+        self.assertEqual((Value.speed_units, Value.power_units,
+                         Value.alt_units), ('kt', 'hp', 'ft'))
+        point = (N.array([115., 150.]), 2600., N.array([120., 170.]),
+                 N.array([1000., 7000.]))
+        for name in ('eff', 'ct', 'blade_angle'):
+            self.assertTrue(N.array_equal(getattr(Value, name)(*point),
+                            getattr(self.surface, name)(*point)))
+
+    def test_03(self):
+
+        # points outside the grid are nan by default
+
+        self.assertTrue(N.isnan(self.surface.eff(90., 2500., 140., 0.)))
+
+
+# create test suites
+
+main_suite = unittest.TestSuite()
+suite1 = unittest.makeSuite(Test_cache)
+suite2 = unittest.makeSuite(Test_maps)
+suite3 = unittest.makeSuite(Test_prop_surface)
+
+# add suites to main test suite
+
+main_suite.addTest(suite1)
+main_suite.addTest(suite2)
+main_suite.addTest(suite3)
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(main_suite)
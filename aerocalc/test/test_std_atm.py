@@ -23,11 +23,13 @@ Run this script directly to do all the tests.
 
 import unittest
 import sys
+import warnings
 
 # It is assumed that std_atm.py is in the directory directly above
 
 sys.path.append('../')
 import std_atm as SA
+import numpy as N
 
 # These tests require that default_units.py contain the following defaults:
 # default_area_units = 'ft**2'
@@ -697,6 +699,15 @@ class Test_temp2speed_of_sound(unittest.TestCase):
         Truth = 582.11
         self.assertTrue(RE(Value, Truth) <= 1e-5)
 
+    def test_05(self):
+
+        # a sequence of temperatures gives the same values as single ones
+
+        Value = SA.temp2speed_of_sound([15, -5, 120], temp_units='F')
+        for (value, temp) in zip(Value, (15, -5, 120)):
+            Truth = SA.temp2speed_of_sound(temp, temp_units='F')
+            self.assertTrue(RE(value, Truth) <= 1e-12)
+
 
 class Test_pressure_alt(unittest.TestCase):
 
@@ -846,6 +857,315 @@ class Test_alt2dynamic_viscosity(unittest.TestCase):
         Truth = 1.2575e-5
         self.assertTrue(RE(Value, Truth) <= 1e-4)
 
+class Test_alt_arrays(unittest.TestCase):
+
+    def test_01(self):
+
+        # array results must match the scalar functions in every layer
+
+        H = N.array([-1000, 0, 11000, 15000, 20000, 25000, 32000, 40000,
+                     47000, 49000, 51000, 60000, 71000, 80000, 84852])
+        for func in (SA.alt2temp, SA.alt2temp_ratio, SA.alt2press_ratio,
+                     SA.alt2press, SA.alt2density_ratio, SA.alt2density):
+            Value = func(H, alt_units='m')
+            for n, alt in enumerate(H):
+                Truth = func(float(alt), alt_units='m')
+                self.assertTrue(RE(Value[n], Truth) <= 1e-14)
+
+    def test_02(self):
+
+        # the shape of the input is preserved, and lists are accepted
+
+        Value = SA.alt2press_ratio([[0, 5000], [10000, 15000]])
+        self.assertEqual(Value.shape, (2, 2))
+        self.assertTrue(RE(Value[0, 1], 0.8320481158727735) <= 1e-14)
+
+    def test_03(self):
+
+        # the caller's array must not be modified by the unit conversions
+
+        H = N.array([1000., 2000.])
+        SA.alt2press(H, alt_units='m')
+        SA.alt2temp(H, alt_units='m')
+        self.assertEqual(list(H), [1000., 2000.])
+
+    def test_04(self):
+
+        # scalar input still returns a python float
+
+        self.assertTrue(isinstance(SA.alt2density_ratio(7500), float))
+
+    def test_05(self):
+
+        # out of range altitudes are rejected, as for a single altitude
+
+        self.assertRaises(ValueError, SA.alt2temp, [0, 90], alt_units='km')
+
+class Test_inverse_arrays(unittest.TestCase):
+
+    def test_01(self):
+
+        # array results must match the scalar functions in every layer,
+        # including values exactly on the layer boundaries
+
+        P = N.concatenate((N.array(SA._LAYER_P),
+                           SA.alt2press(N.arange(-1000, 84000, 2500),
+                                        alt_units='m', press_units='pa')))
+        Value = SA.press2alt(P, press_units='pa', alt_units='m')
+        for n, press in enumerate(P):
+            Truth = SA.press2alt(float(press), press_units='pa', alt_units='m')
+            self.assertTrue(abs(Value[n] - Truth) <= 1e-6)
+
+    def test_02(self):
+
+        Rho = N.concatenate((N.array(SA._LAYER_RHO),
+                             SA.alt2density(N.arange(-1000, 84000, 2500),
+                                            alt_units='m',
+                                            density_units='kg/m**3')))
+        Value = SA.density2alt(Rho, density_units='kg/m**3', alt_units='m')
+        for n, density in enumerate(Rho):
+            Truth = SA.density2alt(float(density), density_units='kg/m**3',
+                                   alt_units='m')
+            self.assertTrue(abs(Value[n] - Truth) <= 1e-6)
+
+    def test_03(self):
+
+        # ratio variants accept lists
+
+        Value = SA.press_ratio2alt([0.5, 0.1], alt_units='m')
+        self.assertTrue(RE(Value[1], 16096.249927559486) <= 1e-12)
+        Value = SA.density_ratio2alt([1, 0.5])
+        self.assertTrue(RE(Value[1], 21859.50324995652) <= 1e-12)
+
+    def test_04(self):
+
+        # out of range samples raise by default, or are returned as nan
+
+        P = [1013.25, 0.001]
+        self.assertRaises(ValueError, SA.press2alt, P, press_units='hpa')
+        Value = SA.press2alt(P, press_units='hpa', out_of_range='nan')
+        self.assertEqual(Value[0], 0)
+        self.assertTrue(N.isnan(Value[1]))
+
+    def test_05(self):
+
+        # the nan option also applies to a single value
+
+        Value = SA.density_ratio2alt(1e-9, out_of_range='nan')
+        self.assertTrue(N.isnan(Value))
+        self.assertRaises(ValueError, SA.press2alt, 1, out_of_range='clip')
+
+class Test_table_mode(unittest.TestCase):
+
+    """Check the optional precomputed table mode against the exact formulas"""
+
+    def tearDown(self):
+        SA.disable_table()
+
+    def test_01(self):
+
+        # table_info is None when the table is not in use
+
+        SA.disable_table()
+        self.assertEqual(SA.table_info(), None)
+
+    def test_02(self):
+
+        # scalar lookups are within the reported error bound
+
+        Value = [SA.alt2press_ratio(H) for H in (0, 7500, 36089, 45000)]
+        SA.enable_table()
+        error = SA.table_info()['max_error']['press_ratio']
+        self.assertTrue(error < 1e-9)
+        for (H, Truth) in zip((0, 7500, 36089, 45000), Value):
+            self.assertTrue(RE(SA.alt2press_ratio(H), Truth) <= error)
+
+    def test_03(self):
+
+        # array lookups are within the reported error bound
+
+        H = N.linspace(-2000, 50000, 1001)
+        Truth = SA.alt2density_ratio(H)
+        SA.enable_table(resolution=1000)
+        error = SA.table_info()['max_error']['density_ratio']
+        Value = SA.alt2density_ratio(H)
+        self.assertTrue(N.max(N.abs((Value - Truth) / Truth)) <= error)
+
+    def test_04(self):
+
+        # altitudes outside the table use the exact formulas
+
+        Truth = SA.alt2press_ratio(60000)
+        SA.enable_table(0, 50000, 1000)
+        self.assertEqual(SA.alt2press_ratio(60000), Truth)
+        Value = SA.alt2press_ratio([-1000, 60000])
+        self.assertEqual(Value[1], Truth)
+
+    def test_05(self):
+
+        # disable_table restores the exact results
+
+        Truth = SA.alt2temp(12345)
+        SA.enable_table(resolution=1000)
+        SA.disable_table()
+        self.assertEqual(SA.alt2temp(12345), Truth)
+
+    def test_06(self):
+
+        # bad table ranges are rejected
+
+        self.assertRaises(ValueError, SA.enable_table, 10000, 5000)
+        self.assertRaises(ValueError, SA.enable_table, 0, 300000)
+        self.assertRaises(ValueError, SA.enable_table, 0, 50000, 0)
+
+class Test_density_alt_arrays(unittest.TestCase):
+
+    """Check density altitude, vapour pressure and pressure altitude with 
+    arrays against the single value results"""
+
+    def test_01(self):
+
+        # nan dew point or relative humidity means not provided
+
+        nan = float('nan')
+        Value = SA.density_alt([7000, 2000, 500, 7000], [30, 15, -5, 85],
+                               [29.80, 1010, 30.12, 29.80],
+                               DP=[10, nan, nan, nan],
+                               RH=[nan, 0.5, nan, 0.3])
+        Truth = (SA.density_alt(7000, 30, 29.80, 10),
+                 SA.density_alt(2000, 15, 1010, RH=0.5),
+                 SA.density_alt(500, -5, 30.12),
+                 SA.density_alt(7000, 85, 29.80, RH=0.3))
+        for (v, t) in zip(Value, Truth):
+            self.assertTrue(RE(v, t) <= 1e-12)
+
+    def test_02(self):
+
+        # single values may be mixed with arrays
+
+        Value = SA.density_alt(N.array([0., 5000.]), 20, DP=[5, 15],
+                               temp_units='C')
+        self.assertTrue(RE(Value[1], SA.density_alt(5000, 20, DP=15))
+                        <= 1e-12)
+
+    def test_03(self):
+
+        # vapour pressure, with zero where neither value is provided
+
+        nan = float('nan')
+        Value = SA.sat_press(T=[30, 30, 30], DP=[11, nan, nan],
+                             RH=[0.2, 0.5, nan])
+        self.assertTrue(RE(Value[0], SA.sat_press(DP=11)) <= 1e-14)
+        self.assertTrue(RE(Value[1], SA.sat_press(T=30, RH=0.5)) <= 1e-14)
+        self.assertEqual(Value[2], 0.)
+
+    def test_04(self):
+
+        # bad values anywhere in an array raise the same errors
+
+        self.assertRaises(ValueError, SA.sat_press, [10, 10], [5, 11])
+        self.assertRaises(ValueError, SA.density_alt, [0, 0], [15, 15],
+                          RH=[0.5, 1.1])
+        self.assertRaises(ValueError, SA.pressure_alt, [0, 0], [29.92, 20])
+
+    def test_05(self):
+
+        # altimeter setting units are decided for each value
+
+        Value = SA.pressure_alt([1000, 1000], [30.92, 1008])
+        self.assertTrue(RE(Value[0], SA.pressure_alt(1000, 30.92)) <= 1e-14)
+        self.assertTrue(RE(Value[1], SA.pressure_alt(1000, 1008)) <= 1e-14)
+
+class Test_density_alt2temp_direct(unittest.TestCase):
+
+    """Check the direct density_alt2temp solution by round trips through 
+    density_alt"""
+
+    def test_01(self):
+
+        # dry air, with an array of pressure altitudes
+
+        HP = N.array([0., 3000., 6000., 9000.])
+        Value = SA.density_alt2temp(6000, HP, alt_units='ft')
+        DA = SA.density_alt(HP, Value, alt_units='ft')
+        self.assertTrue(N.max(N.abs(DA - 6000)) <= 1e-6)
+
+    def test_02(self):
+
+        # dew point
+
+        Value = SA.density_alt2temp(8000, 6000, DP=10, alt_units='ft',
+                                    temp_units='C')
+        DA = SA.density_alt(6000, Value, DP=10, alt_units='ft',
+                            temp_units='C')
+        self.assertTrue(abs(DA - 8000) <= 1e-6)
+
+    def test_03(self):
+
+        # relative humidity is found by iteration, to within 1 ft
+
+        Value = SA.density_alt2temp(8000, 6000, RH=0.5, alt_units='ft',
+                                    temp_units='C')
+        DA = SA.density_alt(6000, Value, RH=0.5, alt_units='ft',
+                            temp_units='C')
+        self.assertTrue(abs(DA - 8000) <= 1)
+
+    def test_04(self):
+
+        # mixed dew point, relative humidity and dry air in one array
+
+        nan = float('nan')
+        Value = SA.density_alt2temp(8000, [6000, 6000, 6000],
+                                    DP=[10, nan, nan], RH=[nan, 0.5, nan],
+                                    alt_units='ft', temp_units='C')
+        self.assertTrue(RE(Value[0], SA.density_alt2temp(8000, 6000, DP=10,
+                        alt_units='ft', temp_units='C')) <= 1e-12)
+        self.assertTrue(RE(Value[1], SA.density_alt2temp(8000, 6000,
+                        RH=0.5, alt_units='ft', temp_units='C')) <= 1e-12)
+        self.assertTrue(RE(Value[2], SA.density_alt2temp(8000, 6000,
+                        alt_units='ft', temp_units='C')) <= 1e-12)
+
+    def test_05(self):
+
+        # a dew point above the resulting temperature is rejected
+
+        self.assertRaises(ValueError, SA.density_alt2temp, 0, 6000,
+                          alt_units='ft', temp_units='C', DP=30)
+
+    def test_06(self):
+
+        # an array of dew points with the default relative humidity
+
+        Value = SA.density_alt2temp(8000, [6000, 7000, 8000], DP=[-10, -10,
+                                    -10], alt_units='ft', temp_units='C')
+        for (i, HP) in enumerate([6000, 7000, 8000]):
+            self.assertTrue(RE(Value[i], SA.density_alt2temp(8000, HP,
+                            DP=-10, alt_units='ft', temp_units='C'))
+                            <= 1e-12)
+
+    def test_07(self):
+
+        # a plain scalar call must not use bitwise inversion on a bool,
+        # which is deprecated in Python 3.12 and later
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            Value = SA.density_alt2temp(8000, 6000, alt_units='ft',
+                    temp_units='C')
+        self.assertTrue(RE(Value, 20.63122188) <= 1e-9)
+
+    def test_08(self):
+
+        # table rows
+
+        Value = SA.density_alt_table(10000, 20000, 10, alt_units='ft',
+                                     temp_units='C')
+        lines = Value.split('\n')
+        self.assertEqual(len(lines), 7 + 2001)
+        self.assertEqual(lines[-1].split()[-1], '%.1f'
+                         % SA.density_alt2temp(10000, 20000,
+                         alt_units='ft', temp_units='C'))
+
 
 # create test suites
 
@@ -870,6 +1190,11 @@ suite17 = unittest.makeSuite(Test_density_alt2temp)
 suite18 = unittest.makeSuite(Test_alt_temp2density_ratio)
 suite19 = unittest.makeSuite(Test_temp2dynamic_viscosity)
 suite20 = unittest.makeSuite(Test_alt2dynamic_viscosity)
+suite21 = unittest.makeSuite(Test_alt_arrays)
+suite22 = unittest.makeSuite(Test_inverse_arrays)
+suite23 = unittest.makeSuite(Test_table_mode)
+suite24 = unittest.makeSuite(Test_density_alt_arrays)
+suite25 = unittest.makeSuite(Test_density_alt2temp_direct)
 
 # add test suites to main test suite, so all test results are in one block
 
@@ -893,6 +1218,11 @@ main_suite.addTest(suite17)
 main_suite.addTest(suite18)
 main_suite.addTest(suite19)
 main_suite.addTest(suite20)
+main_suite.addTest(suite21)
+main_suite.addTest(suite22)
+main_suite.addTest(suite23)
+main_suite.addTest(suite24)
+main_suite.addTest(suite25)
 
 # run main test suite
 # if we run the main test suite, we get a line for each test, plus any
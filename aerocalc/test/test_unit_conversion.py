@@ -21,6 +21,7 @@ import unittest
 import sys
 sys.path[0] = '../'
 import unit_conversion as U
+import numpy as N
 
 
 def RE(value, truth):
@@ -467,6 +468,99 @@ class Test_mass_conv(unittest.TestCase):
         Truth = 100
         self.assertTrue(RE(Value, Truth) <= 1e-8)
 
+class Test_get_converter(unittest.TestCase):
+
+    """Check that the resolved converters agree with the *_conv functions"""
+
+    def test_01(self):
+        Value = U.get_converter('length', 'nm', 'ft')(1)
+        Truth = 1852 / 0.3048
+        self.assertTrue(RE(Value, Truth) <= 1e-15)
+
+    def test_02(self):
+        Value = U.get_converter('press', 'in HG', 'hpa')(29.9213)
+        Truth = U.press_conv(29.9213, from_units='in HG', to_units='hpa')
+        self.assertTrue(RE(Value, Truth) <= 1e-15)
+
+    def test_03(self):
+        Value = U.get_converter('temp', 'F', 'K')(59)
+        Truth = 288.15
+        self.assertEqual(Value, Truth)
+
+    def test_04(self):
+
+        # the converters match speed_conv for every pair of units
+
+        units = ['kt', 'mph', 'km/h', 'm/s', 'ft/mn', 'ft/s']
+        for from_units in units:
+            for to_units in units:
+                Value = U.get_converter('speed', from_units, to_units)(100)
+                Truth = U.speed_conv(100, from_units, to_units)
+                self.assertEqual(Value, Truth)
+
+    def test_05(self):
+        self.assertRaises(ValueError, U.get_converter, 'length', 'furlong',
+                          'ft')
+        self.assertRaises(ValueError, U.get_converter, 'length', 'ft',
+                          'furlong')
+        self.assertRaises(ValueError, U.get_converter, 'distance', 'ft',
+                          'm')
+
+class Test_array_conv(unittest.TestCase):
+
+    """Check the conversions of numpy arrays and lists"""
+
+    def test_01(self):
+
+        # arrays are converted element by element, and are not modified
+
+        P = N.array([29.92, 30.12])
+        Value = U.press_conv(P, from_units='in HG', to_units='hpa')
+        for (p, v) in zip(P, Value):
+            self.assertTrue(RE(v, U.press_conv(p, from_units='in HG',
+                            to_units='hpa')) <= 1e-15)
+        self.assertEqual(list(P), [29.92, 30.12])
+
+    def test_02(self):
+
+        # lists are returned as arrays
+
+        Value = U.speed_conv([100, 200], from_units='kt', to_units='mph')
+        self.assertTrue(isinstance(Value, N.ndarray))
+        self.assertTrue(RE(Value[1], 230.1558896047085) <= 1e-15)
+
+    def test_03(self):
+
+        # conversion into out, including in place
+
+        S = N.array([100., 200.])
+        out = N.empty(2)
+        Value = U.speed_conv(S, from_units='kt', to_units='m/s', out=out)
+        self.assertTrue(Value is out)
+        U.speed_conv(S, from_units='kt', to_units='m/s', out=S)
+        self.assertEqual(list(S), list(out))
+
+    def test_04(self):
+
+        # temperature conversions into out match the scalar conversions
+
+        T = N.array([-40., 32., 59., 212.])
+        Value = U.temp_conv(T, from_units='F', to_units='K', out=T)
+        for (v, t) in zip(Value, (-40., 32., 59., 212.)):
+            self.assertEqual(v, U.temp_conv(t, from_units='F',
+                             to_units='K'))
+
+    def test_05(self):
+
+        # avgas density varies with the temperature of each element
+
+        Value = U.avgas_conv(N.array([10., 10.]), from_units='USG',
+                             temp=N.array([0., 30.]))
+        self.assertTrue(RE(Value[0], U.avgas_conv(10, from_units='USG',
+                        temp=0)) <= 1e-15)
+        self.assertTrue(RE(Value[1], U.avgas_conv(10, from_units='USG',
+                        temp=30)) <= 1e-15)
+
 
 # create test suites
 
@@ -483,6 +577,8 @@ suite9 = unittest.makeSuite(Test_vol_conv)
 suite10 = unittest.makeSuite(Test_wt_conv)
 suite11 = unittest.makeSuite(Test_avgas_conv)
 suite12 = unittest.makeSuite(Test_mass_conv)
+suite13 = unittest.makeSuite(Test_get_converter)
+suite14 = unittest.makeSuite(Test_array_conv)
 
 # add test suites to main test suite, so all test results are in one block
 
@@ -498,6 +594,8 @@ main_suite.addTest(suite9)
 main_suite.addTest(suite10)
 main_suite.addTest(suite11)
 main_suite.addTest(suite12)
+main_suite.addTest(suite13)
+main_suite.addTest(suite14)
 
 if __name__ == '__main__':
     unittest.TextTestRunner(verbosity=5).run(main_suite)
@@ -27,7 +27,7 @@
 # ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # #############################################################################
 #
-# version 0.31, 26 Apr 2020
+# version 0.33, 16 Oct 2026
 #
 # Version History:
 # vers     date        Notes
@@ -50,12 +50,51 @@
 # 0.29   07 Sep 2013  Add ft/mn to speed_conv
 # 0.30   26 Feb 2020  Python 3.7 compatibility tweaks
 # 0.31   26 Apr 2020  Added daN to force_conv
+# 0.32   16 Oct 2026  Replaced the if/elif unit ladders with a registry of
+#                     conversion factors, resolved once and cached.  Added
+#                     get_converter().
+# 0.33   16 Oct 2026  All conversions accept numpy arrays and lists, never
+#                     modify the value passed in, and take an optional out
+#                     array.  avgas_conv accepts arrays of temperature.
 # ###############################################################################
 
 """ 
 Convert between various units.
+
+Each of the *_conv functions looks up the conversion factor between the two
+units in a registry, rather than walking a chain of unit names on every 
+call.  The factors are computed once, from the exact definitions of the 
+units, and cached.  get_converter() returns the resolved conversion as a 
+callable, which is the fastest way to convert many values between the same 
+units:
+
+>>> ft2m = get_converter('length', 'ft', 'm')
+>>> ft2m(1000)
+304.8
+
+If numpy is available, the values may also be numpy arrays, lists or tuples,
+which are converted element by element in one operation.  The value passed in
+is never modified.  To convert a large array without allocating a new one,
+pass an array of floats to receive the result as out, which may be the input 
+array itself:
+
+>>> import numpy as N
+>>> alts = N.array([1000., 2000., 5000.])
+>>> length_conv(alts, to_units = 'm', out = alts)
+array([ 304.8,  609.6, 1524. ])
+>>> alts
+array([ 304.8,  609.6, 1524. ])
 """
 
+from fractions import Fraction
+from functools import partial
+from operator import add, mul, sub, truediv
+
+try:
+    import numpy as N
+except ImportError:
+    N = None
+
 try:
     from default_units import *
 except ImportError:
@@ -72,15 +111,302 @@ except ImportError:
     default_vol_units = 'ft**3'
 
 
+# #############################################################################
+#
+# Unit registry
+#
+# The size of each unit, expressed in a reference unit for its quantity.  The
+# sizes are exact fractions, so the factor between any two units is only
+# rounded once.  The factors for every pair of units are resolved when the
+# module is imported, and each *_conv function then costs a lookup and a 
+# single multiply, whatever the units.
+#
+# #############################################################################
+
+_F = Fraction
+
+_UNITS = {
+    'area': {
+        'ft**2': _F('0.3048') ** 2,
+        'in**2': _F('0.0254') ** 2,
+        'm**2': _F(1),
+        'km**2': _F(1000) ** 2,
+        'sm**2': (5280 * _F('0.3048')) ** 2,
+        'nm**2': _F(1852) ** 2,
+        },
+    'density': {
+        'kg/m**3': _F(1),
+        'slug/ft**3': _F('515.37882'),
+        'lb/ft**3': _F('16.018463'),
+        },
+    'force': {
+        'N': _F(1),
+        'daN': _F(10),
+        'lb': _F('4.4482216'),
+        },
+    'length': {
+        'ft': _F('0.3048'),
+        'in': _F('0.0254'),
+        'mm': _F('0.001'),
+        'cm': _F('0.01'),
+        'm': _F(1),
+        'km': _F(1000),
+        'sm': 5280 * _F('0.3048'),
+        'nm': _F(1852),
+        },
+    'mass': {
+        'kg': _F(1),
+        'lb': _F('0.45359237'),
+        },
+    'power': {
+        'hp': _F(1),
+        'ft-lb/mn': 1 / _F(33000),
+        'ft-lb/s': 1 / _F(550),
+        'W': 1 / _F('745.69987'),
+        'kW': 1 / _F('0.74569987'),
+        },
+    'press': {
+        'in HG': _F('3386.38'),  # from NASA Reference Publication 1046 Appendix A28
+        'mm HG': _F('133.322'),  # derived from NASA Reference Publication 1046 value of pa to in HG
+        'psi': _F('6894.752'),  # from NASA Reference Publication 1046 Appendix A27
+        'psf': _F('47.88026'),  # from NASA Reference Publication 1046 Appendix A27
+        'lb/ft**2': _F('47.88026'),
+        'hpa': _F(100),
+        'mb': _F(100),
+        'pa': _F(1),
+        'in H2O': _F('248.648'),  # (using water density at 20 deg C)
+        'cm H2O': _F('248.648') / _F('2.54'),
+        },
+    'speed': {
+        'kt': _F(1852, 3600),
+        'mph': 5280 * _F('0.3048') / 3600,
+        'km/h': _F(1000, 3600),
+        'm/s': _F(1),
+        'ft/mn': _F('0.3048') / 60,
+        'ft/s': _F('0.3048'),
+        },
+    'vol': {
+        'ft**3': _F(1),
+        'in**3': 1 / _F(12) ** 3,
+        'm**3': 1 / _F('0.3048') ** 3,
+        'km**3': 1 / _F('0.0003048') ** 3,
+        'sm**3': _F(5280) ** 3,
+        'nm**3': (_F(1852) / _F('0.3048')) ** 3,
+        'USG': _F('0.133680555556'),
+        'ImpGal': _F('0.160543653236'),
+        'l': 1 / _F('3.048') ** 3,
+        },
+    'dynamic_viscosity': {
+        'Pa s': _F(1),
+        'N s/m**2': _F(1),
+        'poise': _F(1, 10),
+        'centipoise': _F(1, 1000),
+        },
+    'kinematic_viscosity': {
+        'm**2/s': _F(1),
+        'stokes': _F(1, 10000),
+        'centistokes': _F(1, 1000000),
+        },
+    }
+
+# Absolute temperatures are converted in two steps, to and from deg K, as the
+# offsets between the scales do not allow a single factor.  Each step is a 
+# sequence of (operator, constant) pairs.
+
+_TEMP_UNITS = {
+    'C': (((add, 273.15),), ((sub, 273.15),)),
+    'F': (((sub, 32), (mul, 5.), (truediv, 9.), (add, 273.15)),
+          ((sub, 273.15), (mul, 1.8), (add, 32))),
+    'K': ((), ()),
+    'R': (((mul, 5. / 9.),), ((mul, 1.8),)),
+    }
+
+# The error messages for unknown units, (from_units, to_units), by quantity.
+
+_UNIT_ERRORS = {
+    'area': ('from_units must be "ft**2" or "in**2" or "m**2" or "km**2" or "sm**2" (square statute miles) or "nm**2" (square nautical miles).',
+             'to_units must be "ft**2" or "in**2" or "m**2" or "km**2" or "sm**2" (square statute miles) or "nm**2" (square nautical miles).'),
+    'density': ('from_units must be one of "kg/m**3", "slug/ft**3" and "lb/ft**3".',
+                'to_units must be one of "kg/m**3", "slug/ft**3" and "lb/ft**3".'),
+    'force': ('from_units must be one of "lb", "N" or "daN".',
+              'to_units must be one of "lb", "N" or "daN".'),
+    'length': ('from_units must be "ft", "in", "mm", "cm", "m", "km", "sm" (statute miles) or "nm" (nautical miles).',
+               'to_units must be "ft", "in", "mm", "cm", "m", "km", "sm" (statute miles) or "nm" (nautical miles).'),
+    'mass': ('from_units must be one of "lb" or "kg".',
+             'to_units must be one of "lb" or "kg".'),
+    'power': ('from_units must be "hp", "ft-lb/mn", "ft-lb/s", "W" (watts) or "kW" (kilowatts).',
+              'to_units must be "hp", "ft-lb/mn", "ft-lb/s", "W" (watts) or "kW" (kilowatts).'),
+    'press': ('from_units must be "in HG", "mm HG", "psi", "psf" (lb per sq. ft), "hpa", "mb", "pa", "in H2O" or, "cm H2O".',
+              'to_units must be "in HG", "mm HG", "psi", "psf" (lb per sq. ft), "hpa", "mb", "pa", "in H2O" or, "cm H2O".'),
+    'speed': ('from_units must be one of "kt", "mph", "km/h", "m/s", "ft/mn" and "ft/s".',
+              'to_units must be one of "kt", "mph", "km/h", "m/s", "ft/mn" and "ft/s".'),
+    'temp': ('from_units must be one of "C", "F", "K" or "R".',
+             'to_units must be one of "C", "F", "K" or "R".'),
+    'vol': ('from_units must be "ft**3", "in**3", "USG", "ImpGal", "l", "m**3", "km**3", "sm**3" (cubic statute miles) or "nm**3" (cubic nautical miles).',
+            'to_units must be "ft**3", "in**3", "USG", "ImpGal", "l", "m**3", "km**3", "sm**3" (cubic statute miles) or "nm**3" (cubic nautical miles).'),
+    'dynamic_viscosity': ('Units must be one of"Pa s", "N s/m**2", "poise" or "centipoise".',
+                          'Units must be one of"Pa s", "N s/m**2", "poise" or "centipoise".'),
+    'kinematic_viscosity': ('Units must be one of "m**2/s", "stokes" or "centistokes".',
+                            'Units must be one of "m**2/s", "stokes" or "centistokes".'),
+    }
+
+def _resolve_factors(units):
+    """
+    Return the factors between every pair of units, as 
+    factors[from_units][to_units].
+    """
+
+    factors = {}
+    for from_units in units:
+        factors[from_units] = {}
+        for to_units in units:
+            factors[from_units][to_units] = float(units[from_units]
+                                                  / units[to_units])
+
+    return factors
+
+
+def _resolve_temp_steps(from_units, to_units):
+    """
+    Return the steps that convert absolute temperatures between two units,
+    skipping the steps through deg K that cancel out.
+    """
+
+    if from_units == to_units:
+        return ((mul, 1.),)
+    return _TEMP_UNITS[from_units][0] + _TEMP_UNITS[to_units][1]
+
+
+_FACTORS = {}
+for _quantity in _UNITS:
+    _FACTORS[_quantity] = _resolve_factors(_UNITS[_quantity])
+
+_TEMP_STEPS = {}
+for _from_units in _TEMP_UNITS:
+    _TEMP_STEPS[_from_units] = {}
+    for _to_units in _TEMP_UNITS:
+        _TEMP_STEPS[_from_units][_to_units] = \
+            _resolve_temp_steps(_from_units, _to_units)
+
+if N is not None:
+    _UFUNCS = {add: N.add, sub: N.subtract, mul: N.multiply,
+               truediv: N.divide}
+
+# the functions returned by get_converter(), keyed by 
+# (quantity, from_units, to_units)
+
+_converters = {}
+
+
+def _as_array(value):
+    """
+    Return lists and tuples of values as numpy arrays of floats.
+    """
+
+    if N is not None and isinstance(value, (list, tuple)):
+        return N.array(value, dtype=float)
+    return value
+
+
+def _scale(factor, value, out=None):
+    """
+    Return value * factor, written into out if it is given.
+    """
+
+    if out is None:
+        return _as_array(value) * factor
+    return N.multiply(value, factor, out=out)
+
+
+def _apply_steps(steps, value, out=None):
+    """
+    Apply a sequence of (operator, constant) steps to value, working in out
+    if it is given.
+    """
+
+    if out is None:
+        value = _as_array(value)
+        for (op, constant) in steps:
+            value = op(value, constant)
+        return value
+
+    for (op, constant) in steps:
+        _UFUNCS[op](value, constant, out=out)
+        value = out
+    return out
+
+
+def _unit_error(quantity, from_units, to_units):
+    """
+    Raise the ValueError for a conversion with unknown units.
+    """
+
+    try:
+        if quantity == 'temp':
+            units = _TEMP_UNITS
+        else:
+            units = _UNITS[quantity]
+    except KeyError:
+        raise ValueError('quantity must be one of "%s".'
+                         % '", "'.join(sorted(list(_UNITS) + ['temp'])))
+    try:
+        if from_units not in units:
+            raise ValueError(_UNIT_ERRORS[quantity][0])
+    except TypeError:
+        raise ValueError(_UNIT_ERRORS[quantity][0])
+    raise ValueError(_UNIT_ERRORS[quantity][1])
+
+
+def get_converter(quantity, from_units, to_units):
+    """
+    Return a function that converts values of a quantity from one unit to
+    another.
+
+    The quantity is one of 'area', 'density', 'force', 'length', 'mass', 
+    'power', 'press', 'speed', 'temp', 'vol', 'dynamic_viscosity' or 
+    'kinematic_viscosity', and the units are those accepted by the matching 
+    *_conv function.  Temperatures are absolute, as for temp_conv.
+    
+    The returned function, f(value, out=None), applies the precomputed 
+    factor with a single multiply (or the steps to and from deg K, for 
+    temperatures), so it is the fastest way to convert many values between 
+    the same units.  A ValueError is raised for unknown units.
+
+    Examples:
+
+    >>> kt2mph = get_converter('speed', 'kt', 'mph')
+    >>> kt2mph(100)
+    115.07794480235425
+
+    >>> F2C = get_converter('temp', 'F', 'C')
+    >>> F2C(212)
+    100.0
+    """
+
+    try:
+        return _converters[quantity, from_units, to_units]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        if quantity == 'temp':
+            converter = partial(_apply_steps,
+                                _TEMP_STEPS[from_units][to_units])
+        else:
+            converter = partial(_scale,
+                                _FACTORS[quantity][from_units][to_units])
+    except (KeyError, TypeError):
+        _unit_error(quantity, from_units, to_units)
+
+    _converters[quantity, from_units, to_units] = converter
+    return converter
+
+
 def area_conv(A, from_units=default_area_units,
-              to_units=default_area_units):
+              to_units=default_area_units, out=None):
     """ 
     Convert area values between ft**2, in**2, m**2, km**2, sm**2 and nm**2.
 
-    The incoming value is first converted to ft**2, then it is converted to
-    desired return value.
-    
-
     The units default to those specified in default_units.py
     
     Examples:
@@ -100,43 +426,17 @@ def area_conv(A, from_units=default_area_units,
     1550003.1000062
     """
 
-    if from_units == 'ft**2':
-        pass
-    elif from_units == 'in**2':
-        A /= 144.
-    elif from_units == 'm**2':
-        A /= 0.3048 ** 2
-    elif from_units == 'km**2':
-        A /= 0.0003048 ** 2
-    elif from_units == 'sm**2':
-        A *= 5280. ** 2
-    elif from_units == 'nm**2':
-        A *= (1852 / 0.3048) ** 2
-    else:
-        raise ValueError('from_units must be "ft**2" or "in**2" or "m**2" or "km**2" or "sm**2" (square statute miles) or "nm**2" (square nautical miles).')
-
-    if to_units == 'ft**2':
-        return A
-    elif to_units == 'in**2':
-        return A * 144.
-    elif to_units == 'm**2':
-        return A * 0.3048 ** 2
-    elif to_units == 'km**2':
-        return A * 0.0003048 ** 2
-    elif to_units == 'sm**2':
-        return A / 5280. ** 2
-    elif to_units == 'nm**2':
-        return A * (0.3048 / 1852) ** 2
-    else:
-        raise ValueError('from_units must be "ft**2" or "in**2" or "m**2" or "km**2" or "sm**2" (square statute miles) or "nm**2" (square nautical miles).')
+    try:
+        factor = _FACTORS['area'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('area', from_units, to_units)
+
+    return _scale(factor, A, out)
 
 
-def density_conv(D, from_units, to_units):
+def density_conv(D, from_units, to_units, out=None):
     """ 
     Convert density values between kg/m**3, slug/ft**3 and lb/ft**3.
-
-    The incoming value is first converted to kg/m**3, then it is converted 
-    to desired return value.
     
     There are no default units. Both the from_units and the to_units must 
     be specified.
@@ -145,66 +445,36 @@ def density_conv(D, from_units, to_units):
     
     Convert 1.225 kg per metre cubed to lb per foot cubed:
     >>> density_conv(1.225, from_units = 'kg/m**3', to_units = 'lb/ft**3')
-    0.0764742534911121
+    0.07647425349111212
 
     """
 
-    if from_units == 'kg/m**3':
-        pass
-    elif from_units == 'slug/ft**3':
-        D *= 515.37882
-    elif from_units == 'lb/ft**3':
-        D *= 16.018463
-    else:
-        raise ValueError('from_units must be one of "kg/m**3", "slug/ft**3" and "lb/ft**3".')
-
-    if to_units == 'kg/m**3':
-        return D
-    elif to_units == 'slug/ft**3':
-        return D / 515.37882
-    elif to_units == 'lb/ft**3':
-        return D / 16.018463
-    else:
-        raise ValueError('to_units must be one of "kg/m**3", "slug/ft**3" and "lb/ft**3".')
+    try:
+        factor = _FACTORS['density'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('density', from_units, to_units)
+
+    return _scale(factor, D, out)
 
 
 def force_conv(F, from_units=default_weight_units,
-               to_units=default_weight_units):
+               to_units=default_weight_units, out=None):
     """
     Convert force values between lb force and N.
-    
-    The incoming value is first converted to N, then it is converted to the
-    desired return value.
     """
 
-    if from_units == 'N':
-        pass
-    elif from_units == 'daN':
-        F *= 10
-    elif from_units == 'lb':
-        F *= 4.4482216
-    else:
-        raise ValueError('from_units must be one of "lb", "N" or "daN".')
-
-    if to_units == 'N':
-        pass
-    elif to_units == 'daN':
-        F /= 10
-    elif to_units == 'lb':
-        F /= 4.4482216
-    else:
-        raise ValueError('to_units must be one of "lb", "N" or "daN".')
+    try:
+        factor = _FACTORS['force'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('force', from_units, to_units)
 
-    return F
+    return _scale(factor, F, out)
 
 
 def length_conv(L, from_units=default_length_units,
-             to_units=default_length_units):
+             to_units=default_length_units, out=None):
     """ 
     Convert length values between ft, in, mm, cm, m, km, sm and nm.
-
-    The incoming value is first converted to ft, then it is converted to
-    desired return value.
     
     The units default to those specified in default_units.py
     
@@ -222,104 +492,42 @@ def length_conv(L, from_units=default_length_units,
 
     Convert 1000 metres to kilometres:
     >>> length_conv(1000, from_units = 'm', to_units = 'km')
-    0.9999999999999999
+    1.0
     """
 
-    if from_units == 'ft':
-        pass
-    elif from_units == 'mm':
-        L /= 304.8
-    elif from_units == 'cm':
-        L /= 30.48
-    elif from_units == 'm':
-        L /= 0.3048
-    elif from_units == 'km':
-        L /= 0.0003048
-    elif from_units == 'sm':
-        L *= 5280.
-    elif from_units == 'nm':
-        L *= 1852 / 0.3048
-    elif from_units == 'in':
-        L /= 12.
-    else:
-        raise ValueError('from_units must be "ft", "in", "mm", "cm", "m", "km", "sm" (statute miles) or "nm" (nautical miles).')
-
-    if to_units == 'ft':
-        return L
-    elif to_units == 'mm':
-        return L * 304.8
-    elif to_units == 'cm':
-        return L * 30.48
-    elif to_units == 'm':
-        return L * 0.3048
-    elif to_units == 'km':
-        return L * 0.0003048
-    elif to_units == 'sm':
-        return L / 5280.
-    elif to_units == 'nm':
-        return (L * 0.3048) / 1852
-    elif to_units == 'in':
-        return L * 12.
-    else:
-        raise ValueError('to_units must be "ft", "in", "mm", "cm", "m", "km", "sm" (statute miles) or "nm" (nautical miles).')
+    try:
+        factor = _FACTORS['length'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('length', from_units, to_units)
+
+    return _scale(factor, L, out)
 
 
 def power_conv(P, from_units=default_power_units,
-               to_units=default_power_units):
+               to_units=default_power_units, out=None):
     """
     Convert power values between horsepower, ft-lb/mn,  ft-lb/s, watts, 
     kilowatts, BTU/hr and BTU/mn.
     
-    The incoming value is first converted to hp, then it is converted to the
-    desired return value.
     The units default to those specified in default_units.py
     
     """
 
-    if from_units == 'hp':
-        pass
-    elif from_units == 'ft-lb/mn':
-        P /= 33000.
-    elif from_units == 'ft-lb/s':
-        P /= 550.
-    elif from_units == 'W':
-        P /= 745.69987
-    elif from_units == 'kW':
-        P /= 0.74569987
-    # elif from_units == 'BTU/hr':
-    #     P /= 2544.4332
-    # elif from_units == 'BTU/mn':
-    #     P /= 42.407227
-    else:
-        raise ValueError('from_units must be "hp", "ft-lb/mn", "ft-lb/s", "W" (watts), "kW" (kilowatts), "BTU/hr", or "BTU/mn".')
-
-    if to_units == 'hp':
-        return P
-    elif to_units == 'ft-lb/mn':
-        return P * 33000.
-    elif to_units == 'ft-lb/s':
-        return P * 550.
-    elif to_units == 'W':
-        return P * 745.69987
-    elif to_units == 'kW':
-        return P * 0.74569987
-    # elif to_units == 'BTU/hr':
-    #     return P * 2544.4332
-    # elif to_units == 'BTU/mn':
-    #     return P * 42.407227
-    else:
-        raise ValueError('to_units must be "hp", "ft-lb/mn", "ft-lb/s", "W" (watts), "kW" (kilowatts), "BTU/hr", or "BTU/mn".')
+    try:
+        factor = _FACTORS['power'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('power', from_units, to_units)
+
+    return _scale(factor, P, out)
 
 
 def press_conv(P, from_units=default_press_units,
-               to_units=default_press_units):
+               to_units=default_press_units, out=None):
     """ 
     Convert pressure values between inches of HG, mm of HG, psi, lb/ft^2,
     pa, hpa, mb, inches of water and cm of water (using water density at 
     20 deg C).
 
-    The incoming value is first converted to Pa, then it is converted to
-    desired return value.
     The units default to those specified in default_units.py
     
     
@@ -327,63 +535,30 @@ def press_conv(P, from_units=default_press_units,
     
     Convert 1013.25 hpa to default pressure units:
     >>> press_conv(1013.25, from_units = 'hpa')
-    29.921331923765198
+    29.9213319237652
 
     Convert 29.9213 default pressure units to mm of HG:
     >>> press_conv(29.9213, to_units = 'mm HG')
-    760.0012893145918
+    760.0012893145916
     
     Convert 2116.22 lb per sq. ft to lb per sq. inch:
     >>> press_conv(2116.22, from_units = 'psf', to_units = 'psi')
-    14.695983817430996
+    14.695983817430994
     """
 
-    if from_units == 'in HG':
-        P *= 3386.38  # from NASA Reference Publication 1046 Appendix A28
-    elif from_units == 'mm HG':
-        P *= 133.322  # derived from NASA Reference Publication 1046 value of pa to in HG
-    elif from_units == 'psi':
-        P *= 6894.752  # from NASA Reference Publication 1046 Appendix A27
-    elif from_units == 'psf' or from_units == 'lb/ft**2':
-        P *= 47.88026  # from NASA Reference Publication 1046 Appendix A27
-    elif from_units == 'hpa' or from_units == 'mb':
-        P *= 100.
-    elif from_units == 'pa':
-        pass
-    elif from_units == 'in H2O':
-        P *= 248.648 #  (using water density at 20 deg C)
-    elif from_units == 'cm H2O':
-        P *= 248.648 / 2.54 #  (using water density at 20 deg C)
-    else:
-        raise ValueError('from_units must be "in HG", "mm HG", "psi", "psf" (lb per sq. ft), "hpa", "mb", "pa", "in H2O" or, "cm H2O".')
-
-    if to_units == 'in HG':
-        return P / 3386.38 # from NASA Reference Publication 1046 Appendix A28
-    elif to_units == 'mm HG':
-        return P / 133.322 # derived from NASA Reference Publication 1046 value of pa to in HG
-    elif to_units == 'psi':
-        return P / 6894.752 # from NASA Reference Publication 1046 Appendix A27
-    elif to_units == 'psf' or to_units == 'lb/ft**2':
-        return P / 47.88026  # from NASA Reference Publication 1046 Appendix A27
-    elif to_units == 'hpa' or to_units == 'mb':
-        return P / 100.
-    elif to_units == 'pa':
-        return P
-    elif to_units == 'in H2O':
-       return P / 248.648 #  (using water density at 20 deg C)
-    elif to_units == 'cm H2O':
-       return P / (248.648 / 2.54) #  (using water density at 20 deg C)
-    else:
-        raise ValueError('from_units must be "in HG", "mm HG", "psi", "psf" (lb per sq. ft), "hpa", "mb", "pa", or "in H2O", or "cm H2O".')
+    try:
+        factor = _FACTORS['press'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('press', from_units, to_units)
+
+    return _scale(factor, P, out)
 
 
 def speed_conv(S, from_units=default_speed_units,
-               to_units=default_speed_units):
+               to_units=default_speed_units, out=None):
     """ 
     Convert speed values between kt, mph, km/h, m/s, ft/mn and ft/s.
 
-    The incoming value is first converted to kt, then it is converted to
-    desired return value.
     The units default to those specified in default_units.py
     
     
@@ -395,54 +570,22 @@ def speed_conv(S, from_units=default_speed_units,
 
     """
 
-    if from_units == 'kt':
-        pass
-    elif from_units == 'mph':
-        S *= length_conv(1, from_units='sm', to_units='nm')
-    elif from_units == 'km/h':
-        S *= length_conv(1, from_units='km', to_units='nm')
-    elif from_units == 'm/s':
-        S *= length_conv(1, from_units='m', to_units='nm') * 3600.
-    elif from_units == 'ft/s':
-        S *= length_conv(1, from_units=default_length_units, to_units='nm')\
-             * 3600.
-    elif from_units == 'ft/mn':
-        S *= length_conv(1, from_units=default_length_units, to_units='nm')\
-            * 60.
-    else:
-        raise ValueError('from_units must be one of "kt", "mph", "km/h", "m/s", "ft/mn" and "ft/s".')
-
-    if to_units == 'kt':
-        return S
-    elif to_units == 'mph':
-        S *= length_conv(1, from_units='nm', to_units='sm')
-        return S
-    elif to_units == 'km/h':
-        S *= length_conv(1, from_units='nm', to_units='km')
-        return S
-    elif to_units == 'm/s':
-        S *= length_conv(1, from_units='nm', to_units='m')
-        return S / 3600.
-    elif to_units == 'ft/s':
-        S *= length_conv(1, from_units='nm', to_units=default_length_units)
-        return S / 3600.
-    elif to_units == 'ft/mn':
-        S *= length_conv(1, from_units='nm', to_units=default_length_units)
-        return S / 60.
-    else:
-        raise ValueError('to_units must be one of "kt", "mph", "km/h", "m/s", "ft/mn" and "ft/s".')
+    try:
+        factor = _FACTORS['speed'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('speed', from_units, to_units)
+
+    return _scale(factor, S, out)
 
 
 def temp_conv(T, from_units=default_temp_units,
-              to_units=default_temp_units):
+              to_units=default_temp_units, out=None):
     """ 
     Convert absolute temperature values between deg C, F, K and R.
     
     This function should not be used for relative temperature conversions,
     i.e. temperature differences.
     
-    The incoming value is first converted to deg K, then it is converted to
-    desired return value.
     The units default to those specified in default_units.py
     
     
@@ -461,38 +604,19 @@ def temp_conv(T, from_units=default_temp_units,
     288.15
     """
 
-    if from_units == 'C':
-        T += 273.15
-    elif from_units == 'F':
-        T = ((T - 32) * 5.) / 9. + 273.15
-    elif from_units == 'K':
-        pass
-    elif from_units == 'R':
-        T *= 5. / 9.
-    else:
-        raise ValueError('from_units must be one of "C", "F", "K" or "R".')
-
-    if to_units == 'C':
-        return T - 273.15
-    elif to_units == 'F':
-        return (T - 273.15) * 1.8 + 32
-    elif to_units == 'K':
-        return T
-    elif to_units == 'R':
-        return T * 1.8
-    else:
-        raise ValueError('to_units must be one of "C", "F", "K" or "R".')
+    try:
+        steps = _TEMP_STEPS[from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('temp', from_units, to_units)
+
+    return _apply_steps(steps, T, out)
 
 
 def vol_conv(V, from_units=default_vol_units,
-             to_units=default_vol_units):
+             to_units=default_vol_units, out=None):
     """ 
     Convert volume values between USG, ImpGal (Imperial gallons), l (litres), ft**3, in**3, m**3, km**3, sm**3 and nm**3.
 
-    The incoming value is first converted to ft**3, then it is converted to
-    desired return value.
-
-
     The units default to those specified in default_units.py
 
     Examples:
@@ -512,83 +636,36 @@ def vol_conv(V, from_units=default_vol_units,
     37.85411784012585
     """
 
-    if from_units == 'ft**3':
-        pass
-    elif from_units == 'in**3':
-        V /= 12. ** 3
-    elif from_units == 'm**3':
-        V /= 0.3048 ** 3
-    elif from_units == 'km**3':
-        V /= 0.0003048 ** 3
-    elif from_units == 'sm**3':
-        V *= 5280. ** 3
-    elif from_units == 'nm**3':
-        V *= (1852 / 0.3048) ** 3
-    elif from_units == 'USG':
-        V *= 0.133680555556
-    elif from_units == 'ImpGal':
-        V *= 0.160543653236
-    elif from_units == 'l':
-        V /= 3.048 ** 3
-    else:
-        raise ValueError('from_units must be "ft**3", "in**3", "USG", "ImpGal", "l", "m**3", "km**3", "sm**3" (cubic statute miles) or "nm**3" (cubic nautical miles).')
-
-    if to_units == 'ft**3':
-        return V
-    elif to_units == 'in**3':
-        return V * 12. ** 3
-    elif to_units == 'm**3':
-        return V * 0.3048 ** 3
-    elif to_units == 'km**3':
-        return V * 0.0003048 ** 3
-    elif to_units == 'sm**3':
-        return V / 5280. ** 3
-    elif to_units == 'nm**3':
-        return V * (0.3048 / 1852) ** 3
-    elif to_units == 'USG':
-        return V / 0.133680555556
-    elif to_units == 'ImpGal':
-        return V / 0.160543653236
-    elif to_units == 'l':
-        return V * 3.048 ** 3
-    else:
-        raise ValueError('to_units must be "ft**3", "in**3", "USG", "ImpGal", "l", "m**3", "km**3", "sm**3" (cubic statute miles) or "nm**3" (cubic nautical miles).')
+    try:
+        factor = _FACTORS['vol'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('vol', from_units, to_units)
+
+    return _scale(factor, V, out)
 
 
 def wt_conv(W,from_units=default_weight_units,
-            to_units=default_weight_units):
+            to_units=default_weight_units, out=None):
     """
     Deprecated.  Use mass_conv instead.
     """
-    return mass_conv(W,from_units, to_units)
+    return mass_conv(W,from_units, to_units, out)
 
 def mass_conv(M, from_units=default_weight_units,
-            to_units=default_weight_units):
+            to_units=default_weight_units, out=None):
     """
     Convert mass values between lb and kg.
-    
-    The incoming value is first converted to kg, then it is converted to the
-    desired return value.
 
     The units default to those specified in default_units.py    
     
     """
 
-    if from_units == 'kg':
-        pass
-    elif from_units == 'lb':
-        M *= 0.45359237
-    else:
-        raise ValueError('from_units must be one of "lb" or "kg".')
-
-    if to_units == 'kg':
-        pass
-    elif to_units == 'lb':
-        M *= 2.204622622
-    else:
-        raise ValueError('to_units must be one of "lb" or "kg".')
+    try:
+        factor = _FACTORS['mass'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('mass', from_units, to_units)
 
-    return M
+    return _scale(factor, M, out)
 
 
 def avgas_conv(
@@ -598,6 +675,7 @@ def avgas_conv(
     temp=15,
     temp_units='C',
     grade='nominal',
+    out=None,
     ):
     """
     Convert aviation gasoline between units of lb, US Gallon (USG), 
@@ -652,6 +730,12 @@ def avgas_conv(
     '100LL' if it is not specified.
     
     The temperature defaults to 15 deg C if it is not specified.
+
+    The quantity and the temperature may be numpy arrays, in which case each 
+    quantity is converted using the density at its own temperature:
+
+    >>> avgas_conv([100, 100], from_units = 'USG', temp = [-20, 30])
+    array([626.396, 590.116])
     """
 
     lb_per_USG_15_nom = 6.01  # nominal density at 15 deg C from Canada Flight Supplement
@@ -677,82 +761,52 @@ def avgas_conv(
 
     lb_per_USG *= grade_density / lb_per_USG_15_nom
 
+    # the mass in lb of one of each of from_units and to_units
+
     if from_units == 'lb':
-        pass
+        from_lb = 1.
     elif from_units == 'USG':
-        AG *= lb_per_USG
+        from_lb = lb_per_USG
     elif from_units == 'ImpGal':
-        AG *= vol_conv(lb_per_USG, from_units='ImpGal', to_units='USG')
+        from_lb = vol_conv(lb_per_USG, from_units='ImpGal', to_units='USG')
     elif from_units == 'kg':
-        AG = wt_conv(AG, from_units='kg')
+        from_lb = _FACTORS['mass']['kg']['lb']
     elif from_units == 'l':
-        AG *= vol_conv(lb_per_USG, from_units='l', to_units='USG')
+        from_lb = vol_conv(lb_per_USG, from_units='l', to_units='USG')
     else:
         raise ValueError('from_units must be one of "lb", "USG", "ImpGal", "l", or "kg".')
 
     if to_units == 'lb':
-        pass
+        to_lb = 1.
     elif to_units == 'USG':
-        AG /= lb_per_USG
+        to_lb = lb_per_USG
     elif to_units == 'ImpGal':
-        AG /= vol_conv(lb_per_USG, from_units='ImpGal', to_units='USG')
+        to_lb = vol_conv(lb_per_USG, from_units='ImpGal', to_units='USG')
     elif to_units == 'kg':
-        AG = wt_conv(AG, to_units='kg')
+        to_lb = _FACTORS['mass']['kg']['lb']
     elif to_units == 'l':
-        AG /= vol_conv(lb_per_USG, from_units='l', to_units='USG')
+        to_lb = vol_conv(lb_per_USG, from_units='l', to_units='USG')
     else:
-        raise ValueError('from_units must be one of "lb", "USG", "ImpGal", "l", or "kg".')
+        raise ValueError('to_units must be one of "lb", "USG", "ImpGal", "l", or "kg".')
 
-    return AG
+    return _scale(from_lb / to_lb, AG, out)
 
-def dynamic_viscosity_conv(u, from_units=default_dynamic_viscosity_units, to_units=default_dynamic_viscosity_units):
-    
-    if from_units == 'Pa s':
-        pass
-    elif from_units == 'N s/m**2':
-        pass
-    elif from_units == 'poise':
-        u /= 10.
-    elif from_units == 'centipoise':
-        u /= 1000.    
-    else:
-        raise ValueError('Units must be one of"Pa s", "N s/m**2", "poise" or "centipoise".')
-    
-    if to_units == 'Pa s':
-        pass
-    elif to_units == 'N s/m**2':
-        pass
-    elif to_units == 'poise':
-        u *= 10.
-    elif to_units == 'centipoise':
-        u *= 1000. 
-    else:
-        raise ValueError('Units must be one of"Pa s", "N s/m**2", "poise" or "centipoise".')
-    
-    return u
+def dynamic_viscosity_conv(u, from_units=default_dynamic_viscosity_units, to_units=default_dynamic_viscosity_units, out=None):
+    try:
+        factor = _FACTORS['dynamic_viscosity'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('dynamic_viscosity', from_units, to_units)
 
-def kinematic_viscosity_conv(v, from_units=default_kinematic_viscosity_units, to_units=default_kinematic_viscosity_units):
-    
-    if from_units == 'm**2/s':
-        pass
-    elif from_units == 'stokes':
-        v /= 10000.
-    elif from_units == 'centistokes':
-        v /= 1000000.
-    else:
-        raise ValueError('Units must be one of "m**2/s", "stokes" or "centistokes".')
+    return _scale(factor, u, out)
 
-    if to_units == 'm**2/s':
-        pass
-    elif to_units == 'stokes':
-        v *= 10000.
-    elif to_units == 'centistokes':
-        v *= 1000000.
-    else:
-        raise ValueError('Units must be one of "m**2/s", "stokes" or "centistokes".')
 
+def kinematic_viscosity_conv(v, from_units=default_kinematic_viscosity_units, to_units=default_kinematic_viscosity_units, out=None):
+    try:
+        factor = _FACTORS['kinematic_viscosity'][from_units][to_units]
+    except (KeyError, TypeError):
+        _unit_error('kinematic_viscosity', from_units, to_units)
 
-    return v
+    return _scale(factor, v, out)
 
 
 if __name__ == '__main__':